@@ -1,33 +1,27 @@
 import sys
 import voxgrep
-from voxgrep import transcribe
 from collections import Counter
 import random
 
 try:
-    from .utils import STOPWORDS
+    from .utils import STOPWORDS, ensure_transcripts
 except (ImportError, ValueError):
-    from utils import STOPWORDS
+    from utils import STOPWORDS, ensure_transcripts
 
 def auto_supercut(vidfile, total_words=3):
     """automatically creates a supercut from a video by selecting three random words"""
 
     # ensure transcript exists
-    if not voxgrep.find_transcript(vidfile):
-        print(f"Transcript not found for {vidfile}. Transcribing with Whisper...")
-        transcribe.transcribe(vidfile, method="whisper")
+    ensure_transcripts([vidfile])
 
     # grab all the words from the transcript
     unigrams = voxgrep.get_ngrams(vidfile)
 
-    # remove stop words
-    unigrams = [w for w in unigrams if w[0] not in STOPWORDS]
-
-    # get the most common 10 words
-    most_common = Counter(unigrams).most_common(10)
+    # count the words that aren't stop words and get the most common 10
+    most_common = Counter(w[0] for w in unigrams if w[0] not in STOPWORDS).most_common(10)
 
     # transform the list into just the words
-    words = [w[0][0] for w in most_common]
+    words = [word for word, count in most_common]
 
     # randomize the list
     random.shuffle(words)
@@ -35,11 +29,8 @@ def auto_supercut(vidfile, total_words=3):
     # select the first N words
     words = words[0:total_words]
 
-    # create a query
-    query = "|".join(words)
-
-    # create the video
-    voxgrep.voxgrep(vidfile, query, search_type="fragment", output="auto_supercut.mp4")
+    # create the video, searching for each word
+    voxgrep.voxgrep(vidfile, words, search_type="fragment", output="auto_supercut.mp4")
 
 
 if __name__ == "__main__":
@@ -1,10 +1,16 @@
+import os
+import time
 import voxgrep
-from voxgrep import transcribe
-from glob import glob
+from glob import iglob
 import voxgrep.modules.youtube
 
+try:
+    from .utils import ensure_transcripts
+except (ImportError, ValueError):
+    from utils import ensure_transcripts
 
-def auto_youtube_supercut(search_query, url=None, max_videos=1, lang="en", padding=0.5, output="supercut.mp4"):
+
+def auto_youtube_supercut(search_query, url=None, max_videos=1, lang="en", padding=0.5, output="supercut.mp4", encoder_threads=None):
     """
     Search youtube for a query or use a direct URL, download videos with yt-dlp,
     and then makes a supercut with that query
@@ -18,9 +24,12 @@ def auto_youtube_supercut(search_query, url=None, max_videos=1, lang="en", paddi
         url = "https://www.youtube.com/results?search_query=" + search_query
         prefix = "".join([c if c.isalnum() else "_" for c in search_query])
 
+    # remember when this run started so earlier downloads with the same prefix are skipped
+    start_ts = time.time()
+
     # Download video using the new module
     try:
-        voxgrep.modules.youtube.download_video(
+        downloaded = voxgrep.modules.youtube.download_video(
             url,
             output_template=prefix + "%(autonumber)s.%(ext)s"
         )
@@ -29,21 +38,22 @@ def auto_youtube_supercut(search_query, url=None, max_videos=1, lang="en", paddi
         return
 
     # grab the videos we just downloaded
-    files = glob(prefix + "*.mp4")
+    files = [f for f in iglob(prefix + "*.mp4") if os.path.getmtime(f) >= start_ts]
+
+    # yt-dlp doesn't rewrite files that already exist, so fall back to what it reported
+    if not files and downloaded and os.path.exists(downloaded):
+        files = [downloaded]
 
     if not files:
         print("No videos downloaded.")
         return
 
     # ensure transcripts exist for all downloaded files
-    for f in files:
-        if not voxgrep.find_transcript(f):
-            print(f"Transcript not found for {f}. Transcribing with Whisper ({lang})...")
-            transcribe.transcribe(f, method="whisper", language=lang)
+    ensure_transcripts(files, language=lang)
 
     # run voxgrep
     print(f"Creating supercut for query: {search_query} (padding: {padding}s)")
-    voxgrep.voxgrep(files, search_query, search_type="fragment", padding=padding, output=output)
+    voxgrep.voxgrep(files, search_query, search_type="fragment", padding=padding, output=output, encoder_threads=encoder_threads)
 
 
 if __name__ == "__main__":
@@ -90,6 +100,14 @@ if __name__ == "__main__":
         help="output filename (default: youtube_supercut.mp4)",
     )
 
+    parser.add_argument(
+        "--x264-threads",
+        dest="encoder_threads",
+        type=int,
+        default=None,
+        help="ffmpeg encoder threads (default: 4)",
+    )
+
     args = parser.parse_args()
 
     if not args.search and not args.url:
@@ -98,4 +116,4 @@ if __name__ == "__main__":
     else:
         # If only URL is provided, use a default search term or ask for one
         query = args.search if args.search else "." # "." matches everything in regex
-        auto_youtube_supercut(query, args.url, args.max_videos, args.lang, args.padding, args.output)
+        auto_youtube_supercut(query, args.url, args.max_videos, args.lang, args.padding, args.output, args.encoder_threads)
@@ -1,11 +1,10 @@
 import sys
-import voxgrep
-from voxgrep import parse_transcript, create_supercut, transcribe
+from voxgrep import create_supercut
 
 try:
-    from .utils import calculate_silences
+    from .utils import silences_from_times, word_times, ensure_transcripts
 except (ImportError, ValueError):
-    from utils import calculate_silences
+    from utils import silences_from_times, word_times, ensure_transcripts
 
 # the min and max duration of silences to extract
 min_duration = 0.5
@@ -21,19 +20,17 @@ if not filenames:
     print("Usage: python only_silence.py <video_file(s)>")
     sys.exit(1)
 
+# ensure transcripts exist
+ensure_transcripts(filenames)
+
 silences = []
 for filename in filenames:
-    # ensure transcript exists
-    if not voxgrep.find_transcript(filename):
-        print(f"Transcript not found for {filename}. Transcribing with Whisper...")
-        transcribe.transcribe(filename, method="whisper")
-
-    timestamps = parse_transcript(filename)
-    if not timestamps:
+    starts, ends = word_times(filename)
+    if not len(starts):
         continue
 
-    silences += calculate_silences(
-        timestamps, filename, min_duration, max_duration, adjuster
+    silences += silences_from_times(
+        starts, ends, filename, min_duration, max_duration, adjuster
     )
 
 if silences:
@@ -1,11 +1,10 @@
 import argparse
 import voxgrep
-from voxgrep import transcribe
 
 try:
-    from .utils import load_spacy_model
+    from .utils import load_spacy_model, iter_transcripts
 except (ImportError, ValueError):
-    from utils import load_spacy_model
+    from utils import load_spacy_model, iter_transcripts
 
 """
 Make a supercut of different types of words, for example, all nouns.
@@ -25,27 +24,25 @@ def main():
 
     search_words = []
 
-    for video in args.videos:
-        # ensure transcript exists
-        if not voxgrep.find_transcript(video):
-            print(f"Transcript not found for {video}. Transcribing with Whisper...")
-            transcribe.transcribe(video, method="whisper")
+    # sentences are fed to spacy while the next video is still being transcribed
+    texts = (
+        sentence["content"]
+        for video, transcript in iter_transcripts(args.videos)
+        if transcript
+        for sentence in transcript
+    )
 
-        transcript = voxgrep.parse_transcript(video)
-        if not transcript:
-            continue
-
-        for sentence in transcript:
-            doc = nlp(sentence["content"])
-            for token in doc:
-                if token.pos_ in args.pos:
-                    # ensure we're only going to grab exact words
-                    search_words.append(f"^{token.text}$")
+    for doc in nlp.pipe(texts, batch_size=256):
+        for token in doc:
+            if token.pos_ in args.pos:
+                search_words.append(token.text)
 
     if search_words:
-        query = "|".join(search_words)
+        # one query per unique word, in the order the words were found
+        query = list(dict.fromkeys(search_words))
+        # exact_match ensures we're only going to grab exact words
         voxgrep.voxgrep(
-            args.videos, query, search_type="fragment", output=args.output
+            args.videos, query, search_type="fragment", exact_match=True, output=args.output
         )
     else:
         print("No matching parts of speech found.")
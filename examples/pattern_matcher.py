@@ -1,12 +1,11 @@
 import argparse
 import voxgrep
-from voxgrep import transcribe
 from spacy.matcher import Matcher
 
 try:
-    from .utils import load_spacy_model
+    from .utils import load_spacy_model, iter_transcripts
 except (ImportError, ValueError):
-    from utils import load_spacy_model
+    from utils import load_spacy_model, iter_transcripts
 
 """
 Uses rule-based matching from spacy to make supercuts:
@@ -31,24 +30,23 @@ def main():
 
     searches = []
 
-    for video in args.videos:
-        # ensure transcript exists
-        if not voxgrep.find_transcript(video):
-            print(f"Transcript not found for {video}. Transcribing with Whisper...")
-            transcribe.transcribe(video, method="whisper")
+    # sentences are fed to spacy while the next video is still being transcribed
+    texts = (
+        sentence["content"]
+        for video, transcript in iter_transcripts(args.videos)
+        if transcript
+        for sentence in transcript
+    )
 
-        transcript = voxgrep.parse_transcript(video)
-        if not transcript:
-            continue
-
-        for sentence in transcript:
-            doc = nlp(sentence["content"])
-            matches = matcher(doc)
-            for match_id, start, end in matches:
-                span = doc[start:end]  # The matched span
-                searches.append(span.text)
+    for doc in nlp.pipe(texts, batch_size=256):
+        matches = matcher(doc)
+        for match_id, start, end in matches:
+            span = doc[start:end]  # The matched span
+            searches.append(span.text)
 
     if searches:
+        # the same phrase is usually matched many times, search for each one once
+        searches = list(dict.fromkeys(searches))
         voxgrep.voxgrep(
             args.videos, searches, search_type="fragment", output="pattern_matcher.mp4"
         )
@@ -6,46 +6,39 @@ to run: python3 remove_silences.py SOMEVIDEO.mp4
 """
 
 import sys
-import voxgrep
-from voxgrep import parse_transcript, create_supercut_in_batches, transcribe
+from voxgrep import create_supercut_in_batches
 
 try:
-    from .utils import merge_clips
+    from .utils import merge_times, word_times, ensure_transcripts
 except (ImportError, ValueError):
-    from utils import merge_clips
+    from utils import merge_times, word_times, ensure_transcripts
 
 # the min duration of silences to remove
 min_duration = 1.0
 
-filenames = sys.argv[1:]
 
-if not filenames:
-    print("Usage: python remove_silence.py <video_file(s)>")
-    sys.exit(1)
+def main():
+    filenames = sys.argv[1:]
 
-clips = []
+    if not filenames:
+        print("Usage: python remove_silence.py <video_file(s)>")
+        sys.exit(1)
 
-for filename in filenames:
-    # ensure transcript exists
-    if not voxgrep.find_transcript(filename):
-        print(f"Transcript not found for {filename}. Transcribing with Whisper...")
-        transcribe.transcribe(filename, method="whisper")
+    # ensure transcripts exist
+    ensure_transcripts(filenames)
 
-    timestamps = parse_transcript(filename)
-    if not timestamps:
-        continue
+    clips = []
 
-    items = []
-    if "words" in timestamps[0]:
-        for sentence in timestamps:
-            items += sentence["words"]
-    else:
-        items = timestamps
+    for filename in filenames:
+        starts, ends = word_times(filename)
+        clips += merge_times(starts, ends, filename, min_duration)
 
-    clips += merge_clips(items, filename, min_duration)
+    if clips:
+        create_supercut_in_batches(clips, "no_silences.mp4")
+    else:
+        print("No clips found to export.")
 
 
-if clips:
-    create_supercut_in_batches(clips, "no_silences.mp4")
-else:
-    print("No clips found to export.")
+# guard needed: batches are encoded in worker processes
+if __name__ == "__main__":
+    main()
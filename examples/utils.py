@@ -1,37 +1,83 @@
 import os
 import sys
+import queue
+import hashlib
+import functools
+import threading
+from itertools import chain
+from operator import itemgetter
 
-try:
-    import spacy
-    SPACY_AVAILABLE = True
-except ImportError:
-    SPACY_AVAILABLE = False
+import numpy as np
+
+import voxgrep
+from voxgrep import transcribe
+from voxgrep.utils.config import get_cache_dir
+
+# spacy is imported on first use (see _import_spacy); importing it takes
+# seconds and most helpers here never need it
+spacy = None
+SPACY_AVAILABLE = None
 
 # Shared stop words
-STOPWORDS_EN = ["i", "we're", "you're", "that's", "it's", "us", "i'm", "me", "my", "myself", "we", "our", "ours", "ourselves", "you", "your", "yours", "yourself", "yourselves", "he", "him", "his", "himself", "she", "her", "hers", "herself", "it", "its", "itself", "they", "them", "their", "theirs", "themselves", "what", "which", "who", "whom", "this", "that", "these", "those", "am", "is", "are", "was", "were", "be", "been", "being", "have", "has", "had", "having", "do", "does", "did", "doing", "a", "an", "the", "and", "but", "if", "or", "because", "as", "until", "while", "of", "at", "by", "for", "with", "about", "against", "between", "into", "through", "during", "before", "after", "above", "below", "to", "from", "up", "down", "in", "out", "on", "off", "over", "under", "again", "further", "then", "once", "here", "there", "when", "where", "why", "how", "all", "any", "both", "each", "few", "more", "most", "other", "some", "such", "no", "nor", "not", "only", "own", "same", "so", "than", "too", "very", "s", "t", "can", "will", "just", "don", "should", "now"]
-STOPWORDS_PT = ["a", "ao", "aos", "aquela", "aquelas", "aquele", "aqueles", "aquilo", "as", "até", "com", "como", "da", "das", "de", "dela", "delas", "dele", "deles", "depois", "do", "dos", "e", "é", "ela", "elas", "ele", "eles", "em", "entre", "era", "eram", "éramos", "essa", "essas", "esse", "esses", "esta", "está", "estamos", "estão", "estas", "estava", "estavam", "estávamos", "este", "esteja", "estejam", "estejamos", "estes", "esteve", "estive", "estivemos", "estivera", "estiveram", "estivéramos", "estiverem", "estivermos", "estivesse", "estivessem", "estivéssemos", "estou", "eu", "foi", "fomos", "for", "fora", "foram", "fôramos", "forem", "formos", "fosse", "fossem", "fôssemos", "fui", "há", "haja", "hajam", "hajamos", "hão", "haver", "havia", "haviam", "havíamos", "houve", "houvemos", "houvera", "houveram", "houvéramos", "houverei", "houverem", "houveremos", "houveria", "houveriam", "houveríamos", "houvermos", "houvesse", "houvessem", "houvéssemos", "isso", "isto", "já", "lhe", "lhes", "mais", "mas", "me", "mesmo", "meu", "meus", "minha", "minhas", "muito", "na", "nas", "nem", "no", "nos", "nós", "nossa", "nossas", "nosso", "nossos", "num", "numa", "o", "os", "ou", "para", "pela", "pelas", "pelo", "pelos", "por", "qual", "quando", "que", "quem", "são", "se", "seja", "sejam", "sejamos", "sem", "ser", "será", "serão", "serei", "seremos", "seria", "seriam", "seríamos", "seu", "seus", "só", "somos", "sou", "sua", "suas", "também", "te", "tem", "tém", "temos", "tenha", "tenham", "tenhamos", "tenho", "terá", "terão", "terei", "teremos", "teria", "teriam", "teríamos", "teu", "teus", "teve", "tinha", "tinham", "tínhamos", "tive", "tivemos", "tivera", "tiveram", "tivéramos", "tiverem", "tivermos", "tivesse", "tivessem", "tivéssemos", "tu", "tua", "tuas", "um", "uma", "você", "vocês", "vos"]
-STOPWORDS = set(STOPWORDS_EN + STOPWORDS_PT)
+STOPWORDS_EN = frozenset({"i", "we're", "you're", "that's", "it's", "us", "i'm", "me", "my", "myself", "we", "our", "ours", "ourselves", "you", "your", "yours", "yourself", "yourselves", "he", "him", "his", "himself", "she", "her", "hers", "herself", "it", "its", "itself", "they", "them", "their", "theirs", "themselves", "what", "which", "who", "whom", "this", "that", "these", "those", "am", "is", "are", "was", "were", "be", "been", "being", "have", "has", "had", "having", "do", "does", "did", "doing", "a", "an", "the", "and", "but", "if", "or", "because", "as", "until", "while", "of", "at", "by", "for", "with", "about", "against", "between", "into", "through", "during", "before", "after", "above", "below", "to", "from", "up", "down", "in", "out", "on", "off", "over", "under", "again", "further", "then", "once", "here", "there", "when", "where", "why", "how", "all", "any", "both", "each", "few", "more", "most", "other", "some", "such", "no", "nor", "not", "only", "own", "same", "so", "than", "too", "very", "s", "t", "can", "will", "just", "don", "should", "now"})
+STOPWORDS_PT = frozenset({"a", "ao", "aos", "aquela", "aquelas", "aquele", "aqueles", "aquilo", "as", "até", "com", "como", "da", "das", "de", "dela", "delas", "dele", "deles", "depois", "do", "dos", "e", "é", "ela", "elas", "ele", "eles", "em", "entre", "era", "eram", "éramos", "essa", "essas", "esse", "esses", "esta", "está", "estamos", "estão", "estas", "estava", "estavam", "estávamos", "este", "esteja", "estejam", "estejamos", "estes", "esteve", "estive", "estivemos", "estivera", "estiveram", "estivéramos", "estiverem", "estivermos", "estivesse", "estivessem", "estivéssemos", "estou", "eu", "foi", "fomos", "for", "fora", "foram", "fôramos", "forem", "formos", "fosse", "fossem", "fôssemos", "fui", "há", "haja", "hajam", "hajamos", "hão", "haver", "havia", "haviam", "havíamos", "houve", "houvemos", "houvera", "houveram", "houvéramos", "houverei", "houverem", "houveremos", "houveria", "houveriam", "houveríamos", "houvermos", "houvesse", "houvessem", "houvéssemos", "isso", "isto", "já", "lhe", "lhes", "mais", "mas", "me", "mesmo", "meu", "meus", "minha", "minhas", "muito", "na", "nas", "nem", "no", "nos", "nós", "nossa", "nossas", "nosso", "nossos", "num", "numa", "o", "os", "ou", "para", "pela", "pelas", "pelo", "pelos", "por", "qual", "quando", "que", "quem", "são", "se", "seja", "sejam", "sejamos", "sem", "ser", "será", "serão", "serei", "seremos", "seria", "seriam", "seríamos", "seu", "seus", "só", "somos", "sou", "sua", "suas", "também", "te", "tem", "tém", "temos", "tenha", "tenham", "tenhamos", "tenho", "terá", "terão", "terei", "teremos", "teria", "teriam", "teríamos", "teu", "teus", "teve", "tinha", "tinham", "tínhamos", "tive", "tivemos", "tivera", "tiveram", "tivéramos", "tiverem", "tivermos", "tivesse", "tivessem", "tivéssemos", "tu", "tua", "tuas", "um", "uma", "você", "vocês", "vos"})
+STOPWORDS = STOPWORDS_EN | STOPWORDS_PT
 
-def load_spacy_model(lang):
-    """Tries to load the best available model for the language."""
-    if not SPACY_AVAILABLE:
-        print("Error: Spacy is not installed. Please run: pip install spacy")
-        sys.exit(1)
+# components the examples never use; attribute_ruler stays because the
+# English pipelines derive token.pos_ from it
+SPACY_EXCLUDE = ("parser", "ner", "lemmatizer")
+
+
+_gpu_checked = False
+
+
+def _import_spacy():
+    """Imports spacy once and records whether it is installed."""
+    global spacy, SPACY_AVAILABLE
+    if SPACY_AVAILABLE is None:
+        try:
+            import spacy as _spacy
+            spacy = _spacy
+            SPACY_AVAILABLE = True
+        except ImportError:
+            SPACY_AVAILABLE = False
+    return SPACY_AVAILABLE
+
+
+def _init_gpu():
+    """Asks spacy to use the GPU, once per process."""
+    global _gpu_checked
+    if _gpu_checked:
+        return
+    _gpu_checked = True
 
     if spacy.prefer_gpu():
         print("GPU detected! Using GPU for spacy processing.")
     else:
         print("No GPU detected or spacy-transformers not configured for GPU. Using CPU.")
 
+
+@functools.lru_cache(maxsize=None)
+def _is_spacy_package(name):
+    """Cheap installed-package check; installed packages don't change within a run."""
+    return spacy.util.is_package(name)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_spacy_model_cached(lang, exclude):
     if lang == "en":
         models = ["en_core_web_trf", "en_core_web_lg", "en_core_web_sm"]
     else:
         models = ["pt_core_news_lg", "pt_core_news_sm"]
 
-    for model in models:
+    # try only installed packages, so a missing trf/lg model doesn't cost a failed load;
+    # probe every name if none is found as a package (e.g. models linked by path)
+    installed = [model for model in models if _is_spacy_package(model)]
+
+    for model in installed or models:
         try:
             print(f"Attempting to load spacy model: {model}")
-            return spacy.load(model)
+            return spacy.load(model, exclude=list(exclude))
         except OSError:
             continue
     
@@ -39,29 +85,220 @@ def load_spacy_model(lang):
     print(f"Please run: python -m spacy download {models[0]}")
     sys.exit(1)
 
+
+def load_spacy_model(lang, exclude=SPACY_EXCLUDE):
+    """
+    Tries to load the best available model for the language.
+    Components in exclude are not loaded at all; pass exclude=() for the full pipeline.
+    Loaded models are cached, so repeated calls return the same pipeline.
+    """
+    if not _import_spacy():
+        print("Error: Spacy is not installed. Please run: pip install spacy")
+        sys.exit(1)
+
+    _init_gpu()
+    return _load_spacy_model_cached(lang, tuple(exclude))
+
+
+def _spacy_cache_clear():
+    _load_spacy_model_cached.cache_clear()
+    _is_spacy_package.cache_clear()
+
+
+load_spacy_model.cache_clear = _spacy_cache_clear
+
+SUBTITLE_SUFFIXES = tuple(voxgrep.SUBTITLE_EXTENSIONS)
+
+
+def _dir_index(path):
+    """Lists a directory once with os.scandir and returns the set of entry names."""
+    try:
+        with os.scandir(path or ".") as it:
+            return {entry.name for entry in it if entry.is_file()}
+    except OSError:
+        return set()
+
+
+def has_transcript(filename, index):
+    """
+    Checks a directory index for a transcript belonging to filename,
+    e.g. video.json or video.en.vtt next to video.mp4.
+    """
+    stem = os.path.splitext(os.path.basename(filename))[0]
+    if any(stem + ext in index for ext in SUBTITLE_SUFFIXES):
+        return True
+    return any(name.startswith(stem) and name.endswith(SUBTITLE_SUFFIXES) for name in index)
+
+
+# Whisper settings for the examples: don't condition each window on the
+# previous text, so a bad window can't snowball into repetition loops, and
+# keep the model loaded so a batch of files loads it only once.
+# The library defaults already use int8 weights and the Silero VAD prefilter.
+TRANSCRIBE_DEFAULTS = {
+    "condition_on_previous_text": False,
+    "vad_filter": True,
+    "keep_model_loaded": True,
+}
+
+
+def _missing_transcripts(filenames):
+    """Returns the files that don't have a transcript yet, listing each directory once."""
+    indexes = {}
+    missing = []
+    for f in filenames:
+        directory = os.path.dirname(f)
+        if directory not in indexes:
+            indexes[directory] = _dir_index(directory)
+        if not has_transcript(f, indexes[directory]):
+            missing.append(f)
+    return missing
+
+
+def _transcribe(f, transcribe_kwargs):
+    print(f"Transcript not found for {f}. Transcribing with Whisper...")
+    transcribe.transcribe(f, **{**TRANSCRIBE_DEFAULTS, **transcribe_kwargs})
+
+
+def ensure_transcripts(filenames, **transcribe_kwargs):
+    """
+    Transcribes every file that doesn't have a transcript yet.
+    Files are transcribed one at a time with a single Whisper model, which is
+    loaded for the first file and released once the last one is done.
+    """
+    missing = _missing_transcripts(filenames)
+    if not missing:
+        return
+
+    try:
+        for f in missing:
+            _transcribe(f, transcribe_kwargs)
+    finally:
+        transcribe.clear_model_cache()
+
+
+def iter_transcripts(filenames, prefetch=2, **transcribe_kwargs):
+    """
+    Yields (filename, transcript) pairs in order. A background thread transcribes
+    and parses the upcoming files, so work done on each transcript overlaps
+    with transcription of the next one. One Whisper model serves every file.
+    """
+    results = queue.Queue(maxsize=prefetch)
+    done = object()
+    errors = []
+
+    def producer():
+        try:
+            for f in filenames:
+                if _missing_transcripts([f]):
+                    _transcribe(f, transcribe_kwargs)
+                results.put((f, voxgrep.parse_transcript(f)))
+        except Exception as e:
+            errors.append(e)
+        finally:
+            transcribe.clear_model_cache()
+            results.put(done)
+
+    threading.Thread(target=producer, daemon=True).start()
+
+    while (item := results.get()) is not done:
+        yield item
+
+    if errors:
+        raise errors[0]
+
+
+def _flatten_words(timestamps):
+    """Returns the word-level items of a transcript, or its sentences if it has no word timings."""
+    if timestamps and "words" in timestamps[0]:
+        return list(chain.from_iterable(sentence["words"] for sentence in timestamps))
+    return timestamps
+
+
+_get_start = itemgetter("start")
+_get_end = itemgetter("end")
+
+
+def _item_times(items):
+    """Packs the start and end times of items into two float64 arrays."""
+    starts = np.fromiter(map(_get_start, items), dtype=np.float64, count=len(items))
+    ends = np.fromiter(map(_get_end, items), dtype=np.float64, count=len(items))
+    return starts, ends
+
+
+def word_times(filename):
+    """
+    Returns (starts, ends) arrays for the words of filename's transcript.
+    The arrays are cached in the voxgrep cache dir, one file per transcript
+    path that is overwritten when the transcript's mtime changes, so repeated
+    runs over the same video skip parsing it. Delete the cache dir's
+    word_times folder to clear it.
+    """
+    transcript = voxgrep.find_transcript(filename)
+    if transcript is None:
+        return np.empty(0), np.empty(0)
+
+    mtime = os.path.getmtime(transcript)
+    digest = hashlib.sha1(os.path.abspath(transcript).encode()).hexdigest()
+    cache_path = get_cache_dir() / "word_times" / f"{digest}.npz"
+    if cache_path.exists():
+        with np.load(cache_path) as cached:
+            if cached["mtime"] == mtime:
+                return cached["starts"], cached["ends"]
+
+    timestamps = voxgrep.parse_transcript(filename)
+    if timestamps is None:
+        return np.empty(0), np.empty(0)
+
+    starts, ends = _item_times(_flatten_words(timestamps))
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(cache_path, mtime=mtime, starts=starts, ends=ends)
+    return starts, ends
+
+
+def silences_from_times(starts, ends, filename, min_duration=0.5, max_duration=None, adjuster=0.0):
+    """
+    Same as calculate_silences, but works on start/end arrays (see word_times).
+    """
+    # gap between the end of each item and the (adjusted) start of the next
+    gap_ends = starts[1:] - adjuster
+    durations = gap_ends - ends[:-1]
+
+    mask = durations >= min_duration
+    if max_duration is not None:
+        mask &= durations <= max_duration
+
+    idx = np.flatnonzero(mask)
+    return [
+        {"start": start, "end": end, "file": filename}
+        for start, end in zip(ends[idx].tolist(), gap_ends[idx].tolist())
+    ]
+
+
 def calculate_silences(timestamps, filename, min_duration=0.5, max_duration=None, adjuster=0.0):
     """
     Calculates silences (gaps) between words or sentences.
     Returns a list of dicts with 'start', 'end', and 'file'.
     """
-    items = []
-    if "words" in timestamps[0]:
-        for sentence in timestamps:
-            items += sentence["words"]
-    else:
-        items = timestamps
-
-    silences = []
-    for item1, item2 in zip(items[:-1], items[1:]):
-        start = item1["end"]
-        end = item2["start"] - adjuster
-        duration = end - start
-        
-        if duration >= min_duration:
-            if max_duration is None or duration <= max_duration:
-                silences.append({"start": start, "end": end, "file": filename})
-    
-    return silences
+    starts, ends = _item_times(_flatten_words(timestamps))
+    return silences_from_times(starts, ends, filename, min_duration, max_duration, adjuster)
+
+
+def merge_times(starts, ends, filename, min_silence_duration=1.0):
+    """
+    Same as merge_clips, but works on start/end arrays (see word_times).
+    """
+    if not len(starts):
+        return []
+
+    # a new clip begins wherever the gap to the previous item is long enough
+    breaks = np.flatnonzero(starts[1:] - ends[:-1] >= min_silence_duration)
+    first = np.concatenate(([0], breaks + 1))
+    last = np.concatenate((breaks, [len(starts) - 1]))
+
+    return [
+        {"start": start, "end": end, "file": filename}
+        for start, end in zip(starts[first].tolist(), ends[last].tolist())
+    ]
 
 
 def merge_clips(items, filename, min_silence_duration=1.0):
@@ -71,16 +308,5 @@ def merge_clips(items, filename, min_silence_duration=1.0):
     if not items:
         return []
 
-    clips = []
-    current_clip = {"start": items[0]["start"], "end": items[0]["end"], "file": filename}
-
-    for item in items[1:]:
-        gap = item["start"] - current_clip["end"]
-        if gap < min_silence_duration:
-            current_clip["end"] = item["end"]
-        else:
-            clips.append(current_clip)
-            current_clip = {"start": item["start"], "end": item["end"], "file": filename}
-    
-    clips.append(current_clip)
-    return clips
+    starts, ends = _item_times(items)
+    return merge_times(starts, ends, filename, min_silence_duration)
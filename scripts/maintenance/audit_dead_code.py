@@ -11,135 +11,139 @@ import ast
 import os
 import sys
 import json
+import hashlib
+import argparse
+import tokenize
 from pathlib import Path
 from collections import defaultdict
-from typing import Dict, List, Set, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
+from tqdm import tqdm
 
-class DeadCodeAnalyzer(ast.NodeVisitor):
-    """Analyzes Python AST for unreachable code and other issues."""
-    
-    def __init__(self, filepath: str):
-        self.filepath = filepath
-        self.issues = []
-        self.current_function = None
-        self.has_return = False
-        self.after_return = False
-        
-    def visit_FunctionDef(self, node):
-        old_function = self.current_function
-        old_has_return = self.has_return
-        old_after_return = self.after_return
-        
-        self.current_function = node.name
-        self.has_return = False
-        self.after_return = False
-        
-        self.generic_visit(node)
-        
-        self.current_function = old_function
-        self.has_return = old_has_return
-        self.after_return = old_after_return
-        
-    def visit_AsyncFunctionDef(self, node):
-        self.visit_FunctionDef(node)
-        
-    def visit_Return(self, node):
-        if self.current_function:
-            self.has_return = True
-            self.after_return = True
-        self.generic_visit(node)
-        
-    def visit_Raise(self, node):
-        if self.current_function:
-            self.after_return = True
-        self.generic_visit(node)
-        
-    def visit_Expr(self, node):
-        if self.after_return and self.current_function:
-            # Code after return/raise (unless it's in a try/except/finally)
-            if not isinstance(node.value, (ast.Pass, ast.Ellipsis)):
-                self.issues.append({
-                    'type': 'unreachable_code',
-                    'function': self.current_function,
-                    'line': node.lineno,
-                    'message': f'Unreachable code after return/raise in {self.current_function}'
-                })
-        self.generic_visit(node)
-        
-    def visit_If(self, node):
-        # Check for if True / if False
-        if isinstance(node.test, ast.Constant):
-            if node.test.value is True:
-                self.issues.append({
-                    'type': 'always_true',
-                    'line': node.lineno,
-                    'message': f'Condition is always True (unreachable else branch)'
-                })
-            elif node.test.value is False:
-                self.issues.append({
-                    'type': 'always_false',
-                    'line': node.lineno,
-                    'message': f'Condition is always False (unreachable if branch)'
-                })
-        self.generic_visit(node)
-
-
-class ImportAnalyzer(ast.NodeVisitor):
-    """Analyzes imports and their usage."""
-    
-    def __init__(self):
-        self.imports = {}  # name -> (module, line)
-        self.used_names = set()
-        
-    def visit_Import(self, node):
-        for alias in node.names:
-            name = alias.asname if alias.asname else alias.name
-            self.imports[name] = (alias.name, node.lineno)
-            
-    def visit_ImportFrom(self, node):
-        for alias in node.names:
-            name = alias.asname if alias.asname else alias.name
-            module = f"{node.module}.{alias.name}" if node.module else alias.name
-            self.imports[name] = (module, node.lineno)
-            
-    def visit_Name(self, node):
-        self.used_names.add(node.id)
-        self.generic_visit(node)
-        
-    def visit_Attribute(self, node):
-        if isinstance(node.value, ast.Name):
-            self.used_names.add(node.value.id)
-        self.generic_visit(node)
-        
-    def get_unused_imports(self) -> List[Tuple[str, str, int]]:
-        unused = []
-        for name, (module, line) in self.imports.items():
-            if name not in self.used_names:
-                unused.append((name, module, line))
-        return unused
 
+def analyze_tree(tree: ast.AST) -> Tuple[List[Dict], List[Tuple[str, str, int]]]:
+    """
+    Collects unreachable-code issues and unused imports in one pre-order pass.
 
-def analyze_file(filepath: str) -> Dict:
+    The walk uses an explicit stack instead of ast.NodeVisitor, so every node
+    is handled by a single type check rather than a visit_* method lookup.
+    Leaving a function is marked by pushing the enclosing scope's state, which
+    is restored when it is popped.
+
+    Returns:
+        (issues, unused_imports)
+    """
+    issues = []
+    imports = {}  # name -> (module, line)
+    used_names = set()
+
+    current_function = None
+    after_return = False
+
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        kind = type(node)
+
+        if kind is tuple:
+            # End of a function body: back to the enclosing scope
+            current_function, after_return = node
+            continue
+
+        if kind is ast.Name:
+            # A Name's only child is its Load/Store/Del context
+            used_names.add(node.id)
+            continue
+        elif kind is ast.Constant:
+            continue
+        elif kind is ast.Attribute:
+            if isinstance(node.value, ast.Name):
+                used_names.add(node.value.id)
+            # Skip the context child here too
+            stack.append(node.value)
+            continue
+        elif kind is ast.FunctionDef or kind is ast.AsyncFunctionDef:
+            stack.append((current_function, after_return))
+            current_function = node.name
+            after_return = False
+        elif kind is ast.Return or kind is ast.Raise:
+            if current_function:
+                after_return = True
+        elif kind is ast.Expr:
+            if after_return and current_function:
+                # Code after return/raise (unless it's in a try/except/finally)
+                if not isinstance(node.value, (ast.Pass, ast.Ellipsis)):
+                    issues.append({
+                        'type': 'unreachable_code',
+                        'function': current_function,
+                        'line': node.lineno,
+                        'message': f'Unreachable code after return/raise in {current_function}'
+                    })
+        elif kind is ast.If:
+            # Check for if True / if False
+            if isinstance(node.test, ast.Constant):
+                if node.test.value is True:
+                    issues.append({
+                        'type': 'always_true',
+                        'line': node.lineno,
+                        'message': f'Condition is always True (unreachable else branch)'
+                    })
+                elif node.test.value is False:
+                    issues.append({
+                        'type': 'always_false',
+                        'line': node.lineno,
+                        'message': f'Condition is always False (unreachable if branch)'
+                    })
+        elif kind is ast.Import:
+            for alias in node.names:
+                name = alias.asname if alias.asname else alias.name
+                imports[name] = (alias.name, node.lineno)
+            continue
+        elif kind is ast.ImportFrom:
+            for alias in node.names:
+                name = alias.asname if alias.asname else alias.name
+                module = f"{node.module}.{alias.name}" if node.module else alias.name
+                imports[name] = (module, node.lineno)
+            continue
+
+        # Children are pushed in reverse so they are popped in source order
+        stack.extend(reversed(list(ast.iter_child_nodes(node))))
+
+    unused_imports = [
+        (name, module, line)
+        for name, (module, line) in imports.items()
+        if name not in used_names
+    ]
+    return issues, unused_imports
+
+
+# Larger files are almost always generated or vendored; skip them
+MAX_FILE_SIZE = 2 * 1024 * 1024
+
+
+def analyze_file(filepath: str, max_size: int = MAX_FILE_SIZE) -> Dict:
     """Analyze a single Python file."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
+        if os.stat(filepath).st_size > max_size:
+            return {
+                'file': filepath,
+                'skipped': 'too_large',
+                'success': False
+            }
+
+        # tokenize.open honours PEP 263 encoding declarations
+        with tokenize.open(filepath) as f:
             content = f.read()
             
         tree = ast.parse(content, filename=filepath)
         
-        # Analyze unreachable code
-        dead_analyzer = DeadCodeAnalyzer(filepath)
-        dead_analyzer.visit(tree)
-        
-        # Analyze imports
-        import_analyzer = ImportAnalyzer()
-        import_analyzer.visit(tree)
-        unused_imports = import_analyzer.get_unused_imports()
+        # Unreachable code and imports in a single walk
+        unreachable_code, unused_imports = analyze_tree(tree)
         
         return {
             'file': filepath,
-            'unreachable_code': dead_analyzer.issues,
+            'unreachable_code': unreachable_code,
             'unused_imports': unused_imports,
             'success': True
         }
@@ -158,118 +162,191 @@ def analyze_file(filepath: str) -> Dict:
         }
 
 
+# Bump when analyze_file's output changes so stale cache entries are ignored
+CACHE_VERSION = 1
+
+
+def get_cache_path(cache_dir: Path, filepath: str) -> Path:
+    """Cache file for a source file, keyed on its path, mtime and size."""
+    st = os.stat(filepath)
+    key = f"{CACHE_VERSION}:{os.path.abspath(filepath)}:{st.st_mtime_ns}:{st.st_size}"
+    return cache_dir / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+
+def load_cached_result(cache_path: Path) -> Optional[Dict]:
+    """Load a cached analyze_file result, or None if missing or unreadable."""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def save_cached_result(cache_path: Path, result: Dict) -> None:
+    """Store an analyze_file result in the cache."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f)
+
+
+EXCLUDE_DIRS = frozenset({'.git', '__pycache__', '.pytest_cache', 'venv',
+                          'node_modules', '.tox', 'build', 'dist', '.eggs'})
+
+
+def _scan_python_files(directory: str, exclude_dirs: frozenset, out: List[str]) -> None:
+    """Collect .py files under directory, files before subdirectories (like os.walk)."""
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    subdirs = []
+    for entry in entries:
+        name = entry.name
+        # Test the name first: is_dir() has to stat symlinks
+        if name.endswith('.py') and not entry.is_dir():
+            out.append(entry.path)
+        # Symlinked directories are listed but not followed, as with os.walk
+        elif name not in exclude_dirs and entry.is_dir() and not entry.is_symlink():
+            subdirs.append(entry.path)
+
+    for subdir in subdirs:
+        _scan_python_files(subdir, exclude_dirs, out)
+
+
 def find_python_files(directory: str, exclude_dirs: Set[str] = None) -> List[str]:
     """Find all Python files in directory."""
     if exclude_dirs is None:
-        exclude_dirs = {'.git', '__pycache__', '.pytest_cache', 'venv', 
-                       'node_modules', '.tox', 'build', 'dist', '.eggs'}
+        exclude_dirs = EXCLUDE_DIRS
+    elif not isinstance(exclude_dirs, frozenset):
+        exclude_dirs = frozenset(exclude_dirs)
     
     python_files = []
-    for root, dirs, files in os.walk(directory):
-        # Filter out excluded directories
-        dirs[:] = [d for d in dirs if d not in exclude_dirs]
-        
-        for file in files:
-            if file.endswith('.py'):
-                python_files.append(os.path.join(root, file))
-                
+    _scan_python_files(directory, exclude_dirs, python_files)
     return python_files
 
 
-def generate_report(results: List[Dict]) -> str:
-    """Generate a formatted report."""
-    report = []
-    report.append("=" * 80)
-    report.append("VOXGREP DEAD CODE AUDIT REPORT")
-    report.append("=" * 80)
-    report.append("")
+def iter_report_lines(results: List[Dict], root: Optional[str] = None) -> Iterator[str]:
+    """Yield the lines of the report, with paths shown relative to root (default: cwd)."""
+    root_prefix = os.path.join(os.path.abspath(root or os.getcwd()), '')
+
+    def rel(filepath: str) -> str:
+        if filepath.startswith(root_prefix):
+            return filepath.removeprefix(root_prefix)
+        return os.path.relpath(filepath)
+
+    yield "=" * 80
+    yield "VOXGREP DEAD CODE AUDIT REPORT"
+    yield "=" * 80
+    yield ""
     
     total_files = len(results)
     total_unused_imports = 0
     total_unreachable = 0
     
     # Unused Imports Section
-    report.append("\n" + "=" * 80)
-    report.append("UNUSED IMPORTS")
-    report.append("=" * 80)
+    yield "\n" + "=" * 80
+    yield "UNUSED IMPORTS"
+    yield "=" * 80
     
     for result in results:
         if result.get('success') and result.get('unused_imports'):
             filepath = result['file']
-            rel_path = os.path.relpath(filepath)
-            report.append(f"\n📄 {rel_path}")
+            rel_path = rel(filepath)
+            yield f"\n📄 {rel_path}"
             for name, module, line in result['unused_imports']:
-                report.append(f"   Line {line}: Unused import '{name}' from '{module}'")
+                yield f"   Line {line}: Unused import '{name}' from '{module}'"
                 total_unused_imports += 1
                 
     if total_unused_imports == 0:
-        report.append("\n✅ No unused imports found!")
+        yield "\n✅ No unused imports found!"
         
     # Unreachable Code Section
-    report.append("\n\n" + "=" * 80)
-    report.append("UNREACHABLE CODE & LOGIC ISSUES")
-    report.append("=" * 80)
+    yield "\n\n" + "=" * 80
+    yield "UNREACHABLE CODE & LOGIC ISSUES"
+    yield "=" * 80
     
     for result in results:
         if result.get('success') and result.get('unreachable_code'):
             filepath = result['file']
-            rel_path = os.path.relpath(filepath)
-            report.append(f"\n📄 {rel_path}")
+            rel_path = rel(filepath)
+            yield f"\n📄 {rel_path}"
             for issue in result['unreachable_code']:
-                report.append(f"   Line {issue['line']}: [{issue['type']}] {issue['message']}")
+                yield f"   Line {issue['line']}: [{issue['type']}] {issue['message']}"
                 total_unreachable += 1
                 
     if total_unreachable == 0:
-        report.append("\n✅ No unreachable code found!")
+        yield "\n✅ No unreachable code found!"
         
     # Summary
-    report.append("\n\n" + "=" * 80)
-    report.append("SUMMARY")
-    report.append("=" * 80)
-    report.append(f"Total files analyzed: {total_files}")
-    report.append(f"Unused imports: {total_unused_imports}")
-    report.append(f"Unreachable code issues: {total_unreachable}")
-    report.append("")
-    
-    return "\n".join(report)
+    yield "\n\n" + "=" * 80
+    yield "SUMMARY"
+    yield "=" * 80
+    yield f"Total files analyzed: {total_files}"
+    yield f"Unused imports: {total_unused_imports}"
+    yield f"Unreachable code issues: {total_unreachable}"
+    yield ""
+
+
+def generate_report(results: List[Dict], root: Optional[str] = None) -> str:
+    """Generate a formatted report."""
+    return "\n".join(iter_report_lines(results, root))
 
 
 def main():
     """Main execution."""
+    parser = argparse.ArgumentParser(description="Audit the VoxGrep codebase for dead code.")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached results and re-analyze every file.")
+    args = parser.parse_args()
+
     project_root = Path(__file__).parents[2]
+    cache_dir = project_root / '.audit_cache'
     
     print("🔍 Scanning VoxGrep codebase for dead code...\n")
     
     # Find all Python files
     python_files = find_python_files(str(project_root))
     
-    # Analyze each file
-    results = []
-    for filepath in python_files:
-        rel_path = os.path.relpath(filepath)
-        print(f"Analyzing: {rel_path}")
-        result = analyze_file(filepath)
-        results.append(result)
+    # Reuse results for files that haven't changed since the last run
+    results = [None] * len(python_files)
+    cache_paths = [get_cache_path(cache_dir, filepath) for filepath in python_files]
+    pending = []
+    for i, cache_path in enumerate(cache_paths):
+        cached = None if args.no_cache else load_cached_result(cache_path)
+        if cached is None:
+            pending.append(i)
+        else:
+            results[i] = cached
+
+    print(f"Cached: {len(python_files) - len(pending)} files, analyzing: {len(pending)} files")
+
+    # Analyze the rest in parallel; results come back in input order and are
+    # written to the JSON Lines file as soon as they arrive
+    json_file = project_root / 'dead_code_audit.jsonl'
+    with ProcessPoolExecutor() as executor, open(json_file, 'w', encoding='utf-8') as jsonl:
+        fresh = executor.map(analyze_file, [python_files[i] for i in pending], chunksize=16)
+        with tqdm(total=len(pending), desc="Analyzing", unit="file") as progress:
+            for i, cache_path in enumerate(cache_paths):
+                if results[i] is None:
+                    results[i] = next(fresh)
+                    progress.update()
+                    if results[i].get('success'):
+                        save_cached_result(cache_path, results[i])
+                jsonl.write(json.dumps(results[i]) + "\n")
         
-    # Generate report
-    report = generate_report(results)
-    
-    # Save report
+    print("\n" + "=" * 80)
+
+    # Stream the report to the file and the terminal line by line
     report_file = project_root / 'DEAD_CODE_AUDIT.txt'
     with open(report_file, 'w', encoding='utf-8') as f:
-        f.write(report)
-        
-    # Also save JSON for programmatic access
-    json_file = project_root / 'dead_code_audit.json'
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2)
+        for line in iter_report_lines(results, str(project_root)):
+            f.write(line + "\n")
+            sys.stdout.write(line + "\n")
         
     print(f"\n✅ Analysis complete!")
     print(f"📄 Report saved to: {report_file}")
     print(f"📄 JSON data saved to: {json_file}")
-    print("\n" + "=" * 80)
-    print(report)
-
 
 if __name__ == '__main__':
     main()
@@ -1,10 +1,9 @@
 import re
+import json
 import argparse
 import os
-import subprocess
 import sys
 import logging
-from pathlib import Path
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -18,12 +17,64 @@ if not logger.handlers:
 import voxgrep
 from voxgrep.modules import youtube
 from voxgrep import transcribe
+from voxgrep.core.engine import TranscriptCache
 
 
-def run_whisper(video_path, model="large-v3", language=None, prompt=None, device="cpu", compute_type="int8"):
+def run_remote_whisper(url, video_path, model="large-v3", language=None, prompt=None, batch_size=16):
+    """
+    Posts the video file to a running transcription server instead of loading a local model.
+    The server is expected to answer with either voxgrep-style JSON segments ("segments")
+    or SRT text ("srt"); the result is saved next to the video like a local transcript.
+    """
+    try:
+        import httpx
+    except ImportError:
+        logger.error("[-] httpx is required for VOXGREP_WHISPER_URL. Install with 'pip install httpx'")
+        sys.exit(1)
+
+    logger.info(f"[+] Transcribing '{video_path}' on server {url} (model: {model})...")
+    data = {"model": model}
+    if language:
+        data["language"] = language
+    if prompt:
+        data["prompt"] = prompt
+    if batch_size:
+        data["batch_size"] = str(batch_size)
+
+    try:
+        with open(video_path, "rb") as f:
+            response = httpx.post(f"{url.rstrip('/')}/transcribe", files={"file": f}, data=data, timeout=None)
+        response.raise_for_status()
+        result = response.json()
+    except Exception as e:
+        logger.error(f"[-] Error from transcription server: {e}")
+        sys.exit(1)
+
+    base = os.path.splitext(video_path)[0]
+    if result.get("segments"):
+        with open(base + ".json", "w", encoding="utf-8") as outfile:
+            json.dump(result["segments"], outfile)
+        TranscriptCache.set(base + ".json", result["segments"])
+    elif result.get("srt"):
+        with open(base + ".srt", "w", encoding="utf-8") as outfile:
+            outfile.write(result["srt"])
+    else:
+        logger.error("[-] Transcription server returned no segments or srt")
+        sys.exit(1)
+    logger.info("[+] Transcription complete.")
+
+
+def run_whisper(video_path, model="large-v3", language=None, prompt=None, device="cpu", compute_type="int8", batch_size=16):
     """
     Runs faster-whisper (via voxgrep.transcribe) on the video file to generate a JSON transcript.
+    The model stays loaded between calls so multi-file runs only pay the load cost once.
+    If VOXGREP_WHISPER_URL is set, the file is sent to that server instead.
     """
+    url = os.environ.get("VOXGREP_WHISPER_URL")
+    if url:
+        run_remote_whisper(url, video_path, model, language, prompt, batch_size=batch_size)
+        return
+
     logger.info(f"[+] Transcribing '{video_path}' using faster-whisper/mlx (model: {model}) on {device}...")
     
     if language:
@@ -33,15 +84,20 @@ def run_whisper(video_path, model="large-v3", language=None, prompt=None, device
 
     try:
         # The transcribe module handles saving the JSON file
-        transcribe.transcribe(
+        segments = transcribe.transcribe(
             videofile=video_path,
             model_name=model,
-            method="whisper",
             prompt=prompt,
             language=language,
             device=device,
-            compute_type=compute_type
+            compute_type=compute_type,
+            batch_size=batch_size if device != "mlx" else None,
+            keep_model_loaded=True,
+            condition_on_previous_text=False
         )
+        # Hand the fresh transcript to the search cache so voxgrep doesn't re-read it
+        if segments:
+            TranscriptCache.set(os.path.splitext(video_path)[0] + ".json", segments)
         logger.info("[+] Transcription complete.")
     except Exception as e:
         logger.error(f"[-] Error running Whisper: {e}")
@@ -49,8 +105,11 @@ def run_whisper(video_path, model="large-v3", language=None, prompt=None, device
 
 
 def main():
-    parser = argparse.ArgumentParser(description="Auto-transcribe with Whisper and run VoxGrep.")
-    parser.add_argument("video", help="Path to the video file or YouTube URL.")
+    parser = argparse.ArgumentParser(
+        description="Auto-transcribe with Whisper and run VoxGrep.",
+        epilog="Set VOXGREP_WHISPER_URL to send files to a running transcription server (POST <url>/transcribe) instead of loading a local model."
+    )
+    parser.add_argument("video", nargs="+", help="Path(s) to video files or YouTube URLs.")
     parser.add_argument("query", help="Search query (regex supported).")
     parser.add_argument("--model", default="large-v3", help="Whisper model size (medium, large, large-v3). Default: large-v3.")
     parser.add_argument("--language", help="Language code (e.g., pt, en). If omitted, Whisper auto-detects.")
@@ -59,63 +118,72 @@ def main():
     parser.add_argument("--padding", type=float, default=0.0, help="Padding in seconds to add to the start/end of each clip. Default: 0.0.")
     parser.add_argument("--device", default="cpu", help="Device to use for transcription (cpu, cuda, mlx). Default: cpu.")
     parser.add_argument("--compute-type", default="int8", help="Compute type for transcription (int8, float16, int8_float16). Default: int8.")
+    parser.add_argument("--batch-size", type=int, default=16, help="Batched decoding size for faster-whisper (0 to disable). Default: 16.")
+    parser.add_argument("--x264-threads", type=int, default=None, help="ffmpeg encoder threads for rendering. Default: 4.")
     parser.add_argument("--preview", action="store_true", help="Preview the cut in mpv instead of rendering a file.")
     parser.add_argument("--output", help="Output filename. If not provided, defaults to supercut_[video_name].mp4")
     parser.add_argument("--force-transcribe", action="store_true", help="Force re-transcription even if transcript exists.")
 
     args = parser.parse_args()
     
-    video_path = args.video
-    
-    # Check if input is a URL
-    if re.match(r'^https?://', video_path):
-        logger.info(f"[+] Downloading video from {video_path}...")
-        try:
-            video_path = youtube.download_video(video_path)
-        except Exception as e:
-            logger.error(f"[-] Failed to download video: {e}")
+    video_paths = []
+    for video_path in args.video:
+        # Check if input is a URL
+        if re.match(r'^https?://', video_path):
+            logger.info(f"[+] Downloading video from {video_path}...")
+            try:
+                video_path = youtube.download_video(video_path)
+            except Exception as e:
+                logger.error(f"[-] Failed to download video: {e}")
+                sys.exit(1)
+        elif not os.path.exists(video_path):
+            logger.error(f"[-] Video file not found: {video_path}")
             sys.exit(1)
-    elif not os.path.exists(video_path):
-        logger.error(f"[-] Video file not found: {video_path}")
-        sys.exit(1)
+        video_paths.append(video_path)
 
-    # Determine default output filename based on video name
+    # Determine default output filename based on the first video name
     if not args.output:
-        base_video_name = os.path.basename(video_path)
+        base_video_name = os.path.basename(video_paths[0])
         video_name_no_ext = os.path.splitext(base_video_name)[0]
         output_file = f"supercut_{video_name_no_ext}.mp4"
     else:
         output_file = args.output
 
-    # Check for existing Transcript
-    if not args.force_transcribe and voxgrep.find_transcript(video_path):
-        logger.info(f"[+] Found existing transcript file for: {video_path}")
-        logger.info("[+] Skipping transcription (use --force-transcribe to override).")
-    else:
-        # Provide a default prompt for specific searches if none provided
-        prompt = args.prompt
-        if not prompt and ("h+m+" in args.query.lower() or "u+m+" in args.query.lower()):
-            prompt = "Umm, hmmm, let me see... ah, yes."
-            
+    # Provide a default prompt for specific searches if none provided
+    prompt = args.prompt
+    if not prompt and ("h+m+" in args.query.lower() or "u+m+" in args.query.lower()):
+        prompt = "Umm, hmmm, let me see... ah, yes."
+
+    for video_path in video_paths:
+        # Check for existing Transcript
+        if not args.force_transcribe and voxgrep.find_transcript(video_path):
+            logger.info(f"[+] Found existing transcript file for: {video_path}")
+            logger.info("[+] Skipping transcription (use --force-transcribe to override).")
+            continue
+
         run_whisper(
-            video_path, 
-            args.model, 
-            args.language, 
-            prompt, 
-            device=args.device, 
-            compute_type=args.compute_type
+            video_path,
+            args.model,
+            args.language,
+            prompt,
+            device=args.device,
+            compute_type=args.compute_type,
+            batch_size=args.batch_size or None
         )
-        
+
+    transcribe.clear_model_cache()
+
     # Run voxgrep
     logger.info(f"[+] Running voxgrep for query: '{args.query}'...")
     try:
         voxgrep.voxgrep(
-            files=video_path,
+            files=video_paths,
             query=args.query,
             search_type=args.search_type,
             output=output_file,
             padding=args.padding,
-            preview=args.preview
+            preview=args.preview,
+            encoder_threads=args.x264_threads
         )
         if not args.preview:
             logger.info(f"[+] Supercut created: {output_file}")
@@ -10,19 +10,21 @@ Usage:
 
 import argparse
 import os
+import sys
 import subprocess
 from pathlib import Path
 from typing import List, Dict
 
-# Color codes for terminal output
-class Colors:
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    BLUE = '\033[94m'
-    CYAN = '\033[96m'
-    BOLD = '\033[1m'
-    END = '\033[0m'
+# Color codes for terminal output; empty when piped or NO_COLOR is set
+_use_color = sys.stdout.isatty() and os.environ.get('NO_COLOR') is None
+
+GREEN = '\033[92m' if _use_color else ''
+YELLOW = '\033[93m' if _use_color else ''
+RED = '\033[91m' if _use_color else ''
+BLUE = '\033[94m' if _use_color else ''
+CYAN = '\033[96m' if _use_color else ''
+BOLD = '\033[1m' if _use_color else ''
+END = '\033[0m' if _use_color else ''
 
 
 class DeadCodeCleaner:
@@ -60,9 +62,70 @@ class DeadCodeCleaner:
             return False
             
         except Exception as e:
-            print(f"{Colors.RED}Error processing {filepath}: {e}{Colors.END}")
+            print(f"{RED}Error processing {filepath}: {e}{END}")
             return False
     
+    def remove_unused_imports_batch(self, filepaths: List[str], dry_run: bool = True) -> List[str]:
+        """
+        Remove unused imports from several files with a single autoflake run.
+
+        autoflake prints one unified diff per changed file, so one dry run
+        finds every file that needs changes. When applying, a second run
+        rewrites only those files in place. If the batch fails, each file
+        is retried on its own so one bad file doesn't hide the others.
+
+        Returns:
+            The files that have (or had) unused imports removed.
+        """
+        if not filepaths:
+            return []
+
+        cmd = [
+            'autoflake',
+            '--remove-all-unused-imports',
+            '--remove-unused-variables',
+        ]
+
+        try:
+            result = subprocess.run(cmd + filepaths, capture_output=True, text=True)
+        except Exception as e:
+            print(f"{RED}Error running autoflake: {e}{END}")
+            return []
+
+        if result.returncode != 0:
+            return [f for f in filepaths if self.remove_unused_imports(f, dry_run=dry_run)]
+
+        diffs = self._split_autoflake_diff(result.stdout)
+        changed = [f for f in filepaths if f in diffs]
+        for filepath in changed:
+            self.changes_made.append({
+                'file': filepath,
+                'type': 'unused_imports',
+                'changes': diffs[filepath]
+            })
+
+        if changed and not dry_run:
+            try:
+                subprocess.run(cmd + ['--in-place'] + changed, capture_output=True, text=True, check=True)
+            except Exception as e:
+                print(f"{RED}Error applying autoflake changes: {e}{END}")
+                return []
+
+        return changed
+
+    @staticmethod
+    def _split_autoflake_diff(output: str) -> Dict[str, str]:
+        """Split autoflake's combined output into a diff per file."""
+        diffs = {}
+        current = None
+        for line in output.splitlines(keepends=True):
+            if line.startswith('--- original/'):
+                current = line[len('--- original/'):].rstrip('\r\n')
+                diffs[current] = ''
+            if current is not None:
+                diffs[current] += line
+        return diffs
+
     def fix_syntax_errors(self, filepath: str) -> List[Dict]:
         """Identify syntax errors that need manual fixing."""
         issues = []
@@ -230,14 +293,14 @@ class DeadCodeCleaner:
             'examples/auto_supercut.py',
         ]
         
-        fixed = []
-        for rel_path in safe_files:
-            filepath = self.project_root / rel_path
-            if filepath.exists():
-                if self.remove_unused_imports(str(filepath), dry_run=dry_run):
-                    fixed.append(rel_path)
+        paths = {
+            str(self.project_root / rel_path): rel_path
+            for rel_path in safe_files
+            if (self.project_root / rel_path).exists()
+        }
         
-        return fixed
+        fixed = self.remove_unused_imports_batch(list(paths), dry_run=dry_run)
+        return [paths[filepath] for filepath in fixed]
 
 
 def main():
@@ -253,7 +316,7 @@ def main():
     args = parser.parse_args()
     
     if not args.dry_run and not args.apply and not args.checklist_only:
-        print(f"{Colors.YELLOW}No action specified. Use --dry-run, --apply, or --checklist-only{Colors.END}")
+        print(f"{YELLOW}No action specified. Use --dry-run, --apply, or --checklist-only{END}")
         parser.print_help()
         return
     
@@ -267,8 +330,8 @@ def main():
     with open(checklist_file, 'w', encoding='utf-8') as f:
         f.write(checklist)
     
-    print(f"\n{Colors.BOLD}{Colors.CYAN}VoxGrep Dead Code Cleanup{Colors.END}\n")
-    print(f"{Colors.GREEN}✓ Manual checklist saved to: {checklist_file}{Colors.END}\n")
+    print(f"\n{BOLD}{CYAN}VoxGrep Dead Code Cleanup{END}\n")
+    print(f"{GREEN}✓ Manual checklist saved to: {checklist_file}{END}\n")
     
     if args.checklist_only:
         print(checklist)
@@ -276,22 +339,22 @@ def main():
     
     # Auto-fix safe files
     if args.dry_run:
-        print(f"{Colors.YELLOW}🔍 DRY RUN MODE - No files will be modified{Colors.END}\n")
+        print(f"{YELLOW}🔍 DRY RUN MODE - No files will be modified{END}\n")
     else:
-        print(f"{Colors.RED}⚠️  APPLYING CHANGES - Files will be modified{Colors.END}\n")
+        print(f"{RED}⚠️  APPLYING CHANGES - Files will be modified{END}\n")
     
-    print(f"{Colors.BOLD}Auto-fixing safe files (tests and examples)...{Colors.END}\n")
+    print(f"{BOLD}Auto-fixing safe files (tests and examples)...{END}\n")
     
     fixed_files = cleaner.auto_fix_safe_files(dry_run=args.dry_run)
     
     if fixed_files:
-        print(f"{Colors.GREEN}Fixed {len(fixed_files)} files:{Colors.END}")
+        print(f"{GREEN}Fixed {len(fixed_files)} files:{END}")
         for f in fixed_files:
             print(f"  ✓ {f}")
     else:
-        print(f"{Colors.YELLOW}No changes needed in safe files.{Colors.END}")
+        print(f"{YELLOW}No changes needed in safe files.{END}")
     
-    print(f"\n{Colors.BOLD}Next Steps:{Colors.END}")
+    print(f"\n{BOLD}Next Steps:{END}")
     print(f"1. Review CLEANUP_CHECKLIST.md")
     print(f"2. Fix the syntax error in voxgrep/cli.py (line 388)")
     print(f"3. Run: pytest   # Ensure tests still pass")
@@ -295,6 +295,31 @@ class TestInteractiveModeNgrams:
         assert mock_get_ngrams.called
 
 
+class TestIgnoredWords:
+    """Test the ignored-words preference helper used by the n-gram workflow."""
+
+    def test_add_is_case_insensitive(self):
+        """Words are lowercased, deduplicated, and saved once on flush."""
+        from voxgrep.cli.ngrams import IgnoredWords
+
+        mock_save = Mock()
+        ignored = IgnoredWords({"ignored_words": ["the"], "device": "cpu"}, mock_save)
+        assert ignored.add("Hello") is True
+        assert ignored.add("HELLO") is False
+        assert ignored.add("The") is False
+        assert ignored.add("world") is True
+        mock_save.assert_not_called()
+
+        ignored.flush()
+        ignored.flush()
+
+        assert "hello" in ignored
+        assert ignored.words == ["the", "hello", "world"]
+        mock_save.assert_called_once_with(
+            {"ignored_words": ["the", "hello", "world"], "device": "cpu"}
+        )
+
+
 @skip_on_windows
 class TestInteractiveModeFileSelection:
     """Test interactive mode file selection options."""
@@ -488,6 +513,130 @@ class TestExecuteArgs:
         assert mock_voxgrep.called
 
 
+class TestSettingsForm:
+    """Test the batched search settings form."""
+
+    def test_settings_form_updates_state(self):
+        """Form answers are applied to the search and export config."""
+        from voxgrep.cli.io import CLIContext
+        from voxgrep.cli.config import SearchConfig, ExportConfig
+        from voxgrep.cli.action_loop import ActionLoopState, settings_questions, apply_settings
+
+        ctx = CLIContext.for_testing(responses=["mash", "0.5", "3", True, False, True])
+        state = ActionLoopState(
+            search=SearchConfig(query=["hello"]),
+            export=ExportConfig(),
+            input_files=[],
+            ctx=ctx,
+        )
+
+        apply_settings(state, ctx.prompts.form(settings_questions(state)))
+
+        assert state.search.search_type == "mash"
+        assert state.search.padding == 0.5
+        assert state.search.maxclips == 3
+        assert state.search.randomize is True
+        assert state.export.burn_in_subtitles is True
+        assert [c["type"] for c in ctx.prompts.call_history] == [
+            "select", "text", "text", "confirm", "confirm", "confirm"
+        ]
+        assert list(ctx.prompts.iter_call_history()) == list(ctx.prompts.call_history)
+
+    def test_cancelled_answer_keeps_setting(self):
+        """A None answer leaves the previous value in place."""
+        from voxgrep.cli.io import CLIContext
+        from voxgrep.cli.config import SearchConfig, ExportConfig
+        from voxgrep.cli.action_loop import ActionLoopState, apply_settings
+
+        state = ActionLoopState(
+            search=SearchConfig(query=["hello"], randomize=True, padding=0.5),
+            export=ExportConfig(),
+            input_files=[],
+            ctx=CLIContext.for_testing(),
+        )
+
+        apply_settings(state, {
+            "search_type": None, "padding": None, "maxclips": "",
+            "randomize": None, "exact_match": True, "burn_in_subtitles": None,
+        })
+
+        assert state.search.search_type == "sentence"
+        assert state.search.padding == 0.5
+        assert state.search.randomize is True
+        assert state.search.exact_match is True
+        assert state.export.burn_in_subtitles is False
+
+
+class TestSearchTermParsing:
+    """Test splitting of comma-separated search input."""
+
+    def test_parse_search_terms(self):
+        """Terms are stripped and empty entries dropped."""
+        from voxgrep.cli.interactive import parse_search_terms
+
+        assert parse_search_terms(" hello world , ,bye,") == ["hello world", "bye"]
+        assert parse_search_terms(" , ") == []
+
+
+class TestActionHandlers:
+    """Test the shared action loop handlers."""
+
+    def test_demo_runs_search_behind_spinner(self):
+        """The demo handler runs the search on the main thread behind a spinner."""
+        import threading
+        from voxgrep.cli.io import CLIContext
+        from voxgrep.cli.config import SearchConfig, ExportConfig
+        from voxgrep.cli.action_loop import ActionLoopState, ActionResult, DEMO_HANDLER
+
+        ctx = CLIContext.for_testing()
+        state = ActionLoopState(
+            search=SearchConfig(query=["hello"]),
+            export=ExportConfig(),
+            input_files=[],
+            ctx=ctx,
+        )
+        calls = []
+        state.run_search = lambda **kwargs: calls.append((threading.current_thread(), kwargs))
+
+        assert DEMO_HANDLER(state) == ActionResult.CONTINUE
+        assert calls[0][0] is threading.main_thread()
+        assert calls[0][1] == {"demo": True}
+        assert ctx.console.status_messages == ("Searching...",)
+
+
+class TestSessionConfig:
+    """Test SessionConfig conversion to and from Namespace."""
+
+    def test_namespace_round_trip(self):
+        """Fields survive to_namespace/from_namespace, including renamed ones."""
+        from voxgrep.cli.config import SessionConfig, SearchConfig, ExportConfig
+
+        session = SessionConfig(
+            input_files=["a.mp4"],
+            search=SearchConfig(query=["hello"], search_type="fragment", resync=0.2),
+            export=ExportConfig(output="out.mp4"),
+        )
+        args = session.to_namespace()
+
+        assert args.search == ["hello"]
+        assert args.searchtype == "fragment"
+        assert args.sync == 0.2
+        assert args.outputfile == "out.mp4"
+        assert SessionConfig.from_namespace(args) == session
+
+    def test_prefs_update_matches_children(self):
+        """The flattened session prefs equal the merged per-config prefs."""
+        from voxgrep.cli.config import SessionConfig
+
+        session = SessionConfig()
+        expected = {
+            **session.transcription.to_prefs_update(),
+            **session.search.to_prefs_update(),
+            **session.export.to_prefs_update(),
+        }
+        assert session.to_prefs_update() == expected
+
+
 class TestCLIPreferences:
     """Test CLI preferences storage and loading."""
     
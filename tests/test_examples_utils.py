@@ -1,4 +1,8 @@
-from examples.utils import calculate_silences, merge_clips
+import os
+import json
+import types
+
+from examples.utils import calculate_silences, merge_clips, has_transcript, iter_transcripts, word_times, merge_times
 
 def test_calculate_silences():
     timestamps = [
@@ -28,3 +32,106 @@ def test_merge_clips():
     assert merged[0]["end"] == 2
     assert merged[1]["start"] == 5
     assert merged[1]["end"] == 6
+
+def test_calculate_silences_max_duration_and_adjuster():
+    timestamps = [
+        {"start": 0, "end": 1, "content": "a"},
+        {"start": 1.8, "end": 2, "content": "b"},  # gap 0.8
+        {"start": 5, "end": 6, "content": "c"},    # gap 3.0
+    ]
+    silences = calculate_silences(timestamps, "test.mp4", min_duration=0.5, max_duration=1.0, adjuster=0.1)
+    assert len(silences) == 1
+    assert silences[0]["start"] == 1
+    assert silences[0]["end"] == 1.7
+
+def test_has_transcript():
+    index = {"talk.mp4", "talk.json", "lecture.mp4", "lecture.en.vtt", "other.mp4"}
+    assert has_transcript("some/dir/talk.mp4", index)
+    assert has_transcript("lecture.mp4", index)
+    assert not has_transcript("other.mp4", index)
+
+def test_iter_transcripts():
+    from pathlib import Path
+    video = str(Path(__file__).parent / "test_inputs" / "metallica.mp4")
+    results = list(iter_transcripts([video]))
+    assert len(results) == 1
+    assert results[0][0] == video
+    assert results[0][1][0]["content"].startswith("Prometo")
+
+
+def test_word_times_cached(tmp_path, monkeypatch):
+    monkeypatch.setenv("VOXGREP_CACHE_DIR", str(tmp_path / "cache"))
+    video = tmp_path / "clip.mp4"
+    video.write_text("dummy")
+    transcript = [{"content": "a b", "start": 0.0, "end": 3.0,
+                   "words": [{"word": "a", "start": 0.0, "end": 1.0},
+                             {"word": "b", "start": 2.5, "end": 3.0}]}]
+    (tmp_path / "clip.json").write_text(json.dumps(transcript))
+
+    starts, ends = word_times(str(video))
+    assert starts.tolist() == [0.0, 2.5]
+    assert ends.tolist() == [1.0, 3.0]
+    assert len(list((tmp_path / "cache" / "word_times").iterdir())) == 1
+
+    # second call is served from the cache and gives the same clips
+    starts, ends = word_times(str(video))
+    assert merge_times(starts, ends, "clip.mp4", 1.0) == merge_clips(transcript[0]["words"], "clip.mp4", 1.0)
+
+    # a changed transcript replaces its cache entry instead of adding one
+    transcript[0]["words"][1]["start"] = 2.0
+    (tmp_path / "clip.json").write_text(json.dumps(transcript))
+    mtime = os.path.getmtime(tmp_path / "clip.json") + 10
+    os.utime(tmp_path / "clip.json", (mtime, mtime))
+    starts, ends = word_times(str(video))
+    assert starts.tolist() == [0.0, 2.0]
+    assert len(list((tmp_path / "cache" / "word_times").iterdir())) == 1
+
+
+def test_word_times_unparseable_transcript(tmp_path, monkeypatch):
+    monkeypatch.setenv("VOXGREP_CACHE_DIR", str(tmp_path / "cache"))
+    video = tmp_path / "broken.mp4"
+    video.write_text("dummy")
+    (tmp_path / "broken.json").write_text("{not json")
+
+    starts, ends = word_times(str(video))
+    assert len(starts) == 0 and len(ends) == 0
+
+
+def test_load_spacy_model_cached(monkeypatch):
+    import examples.utils as utils
+
+    loads = []
+    fake_spacy = types.SimpleNamespace(
+        prefer_gpu=lambda: False,
+        load=lambda name, exclude: loads.append((name, tuple(exclude))) or object(),
+        util=types.SimpleNamespace(is_package=lambda name: name == "en_core_web_sm"),
+    )
+    monkeypatch.setattr(utils, "spacy", fake_spacy, raising=False)
+    monkeypatch.setattr(utils, "SPACY_AVAILABLE", True)
+    utils.load_spacy_model.cache_clear()
+    try:
+        first = utils.load_spacy_model("en")
+        assert utils.load_spacy_model("en", exclude=list(utils.SPACY_EXCLUDE)) is first
+        assert utils.load_spacy_model("en", exclude=()) is not first
+        # only the installed package is loaded, once per exclude list
+        assert loads == [("en_core_web_sm", utils.SPACY_EXCLUDE), ("en_core_web_sm", ())]
+    finally:
+        utils.load_spacy_model.cache_clear()
+
+
+def test_ensure_transcripts_shares_one_model(tmp_path, monkeypatch):
+    from examples import utils
+
+    calls = []
+    fake = types.SimpleNamespace(
+        transcribe=lambda f, **kwargs: calls.append((f, kwargs["keep_model_loaded"])),
+        clear_model_cache=lambda: calls.append("cleared"),
+    )
+    monkeypatch.setattr(utils, "transcribe", fake)
+    videos = [str(tmp_path / f"v{i}.mp4") for i in range(2)]
+    for v in videos:
+        open(v, "w").close()
+
+    utils.ensure_transcripts(videos)
+    # the model stays loaded across files and is released once at the end
+    assert calls == [(videos[0], True), (videos[1], True), "cleared"]
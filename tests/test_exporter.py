@@ -72,3 +72,130 @@ def test_export_xml(tmp_path):
     assert "<?xml" in content
     # fcpxml.py generates FCP XML 1.x which has <xmeml> or similar
     assert "xmeml" in content or "fcpxml" in content
+
+def test_create_supercut_stream_copy(tmp_path):
+    test_video = str(Path(__file__).parent / "test_inputs" / "metallica.mp4")
+    composition = [
+        {"file": test_video, "start": 1.0, "end": 3.0, "content": "a"},
+        {"file": test_video, "start": 10.0, "end": 12.0, "content": "b"},
+    ]
+    output = tmp_path / "supercut.mp4"
+    exporter.create_supercut(composition, str(output), stream_copy=True)
+
+    assert output.exists()
+    # Temporary trimmed segments are cleaned up
+    assert [p.name for p in tmp_path.iterdir()] == ["supercut.mp4"]
+
+def test_create_supercut_stream_copy_in_event_loop(tmp_path):
+    import asyncio
+
+    test_video = str(Path(__file__).parent / "test_inputs" / "metallica.mp4")
+    composition = [{"file": test_video, "start": 1.0, "end": 3.0, "content": "a"}]
+    output = tmp_path / "supercut.mp4"
+
+    async def export_from_handler():
+        exporter.create_supercut(composition, str(output), stream_copy=True)
+
+    asyncio.run(export_from_handler())
+    assert output.exists()
+
+def test_source_clip_cache_evicts_and_closes():
+    class FakeClip:
+        def __init__(self, path):
+            self.path = path
+            self.duration = 10.0
+            self.closed = False
+
+        def close(self):
+            self.closed = True
+
+    cache = exporter.SourceClipCache(FakeClip, maxsize=2)
+    a = cache["a.mp4"]
+    assert cache["a.mp4"] is a
+    b = cache["b.mp4"]
+    cache["a.mp4"]  # a is now most recently used
+    cache["c.mp4"]
+
+    assert b.closed and not a.closed
+    assert len(cache) == 2
+    # Durations survive eviction
+    assert cache.bounds({"file": "b.mp4", "start": -1.0, "end": 12.0}) == (0, 10.0)
+
+    cache.close()
+    assert a.closed and len(cache) == 0
+
+def test_remove_files(tmp_path):
+    paths = [tmp_path / f"batch{i}.mp4" for i in range(5)]
+    for p in paths:
+        p.write_bytes(b"")
+
+    # Missing files are ignored
+    exporter.remove_files([str(p) for p in paths] + [str(tmp_path / "gone.mp4")])
+    assert list(tmp_path.iterdir()) == []
+
+def test_get_batch_size(monkeypatch):
+    from voxgrep.utils import config
+
+    monkeypatch.setenv("VOXGREP_BATCH_SIZE", "7")
+    assert config.get_batch_size() == 7
+
+    monkeypatch.delenv("VOXGREP_BATCH_SIZE")
+    monkeypatch.setattr(config, "get_available_memory", lambda: None)
+    assert config.get_batch_size() == config.BATCH_SIZE
+
+    # A malformed override falls back to the computed size
+    monkeypatch.setenv("VOXGREP_BATCH_SIZE", "lots")
+    assert config.get_batch_size() == config.BATCH_SIZE
+    monkeypatch.delenv("VOXGREP_BATCH_SIZE")
+
+    monkeypatch.setattr(config, "get_available_memory", lambda: 1 << 50)
+    assert config.get_batch_size() == config.MAX_BATCH_SIZE
+
+def test_default_export_workers(monkeypatch):
+    # Unknown memory encodes serially
+    monkeypatch.setattr(exporter, "get_available_memory", lambda: None)
+    assert exporter._default_export_workers(8, 20) == 1
+
+    # Room for only two batches of clips in memory
+    monkeypatch.setattr(exporter, "get_available_memory", lambda: 2 * 20 * exporter.BATCH_CLIP_MEMORY)
+    monkeypatch.setattr(exporter.os, "cpu_count", lambda: 64)
+    assert exporter._default_export_workers(8, 20) == 2
+
+def test_batches_removed_when_concat_fails(tmp_path, monkeypatch):
+    def fake_supercut(batch, outputfile, **kwargs):
+        Path(outputfile).write_bytes(b"")
+
+    def failing_concat(files, outputfile):
+        raise RuntimeError("concat failed")
+
+    monkeypatch.setattr(exporter, "create_supercut", fake_supercut)
+    monkeypatch.setattr(exporter, "concat_stream_copy", failing_concat)
+
+    composition = [{"file": "a.mp4", "start": 0, "end": 1}] * 4
+    with pytest.raises(RuntimeError):
+        exporter.create_supercut_in_batches(
+            composition, str(tmp_path / "out.mp4"),
+            progress_callback=lambda p: None, max_workers=1, batch_size=2
+        )
+    assert list(tmp_path.glob("*.batch*")) == []
+
+def test_single_batch_keeps_target_format(tmp_path, monkeypatch):
+    def fake_supercut(batch, outputfile, **kwargs):
+        Path(outputfile).write_bytes(b"batch")
+
+    def fake_concat(files, outputfile):
+        Path(outputfile).write_bytes(b"remuxed")
+        return True
+
+    monkeypatch.setattr(exporter, "create_supercut", fake_supercut)
+    monkeypatch.setattr(exporter, "concat_stream_copy", fake_concat)
+    composition = [{"file": "a.mp4", "start": 0, "end": 1}]
+
+    # A lone .mp4 batch is moved straight into an .mp4 output
+    exporter.create_supercut_in_batches(composition, str(tmp_path / "out.mp4"), progress_callback=lambda p: None)
+    assert (tmp_path / "out.mp4").read_bytes() == b"batch"
+
+    # Any other container goes through the concat path to get the right format
+    exporter.create_supercut_in_batches(composition, str(tmp_path / "out.mkv"), progress_callback=lambda p: None)
+    assert (tmp_path / "out.mkv").read_bytes() == b"remuxed"
+    assert list(tmp_path.glob("*.batch*")) == []
@@ -53,3 +53,28 @@ def test_get_ngrams():
     # Should have pairs of words
     assert len(ngrams) > 0
     assert len(ngrams[0]) == 2
+
+def test_search_fragment_exact_match_indexed():
+    testvid = File("metallica.mp4")
+    # exact matches of plain words go through the token index
+    results = search_mod.search(testvid, ["prometo SER", "concert"], search_type="fragment", prefer=".json", exact_match=True)
+    assert len(results) == 1
+    assert results[0]["content"] == "Prometo ser"
+
+def test_transcript_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(search_mod.TranscriptCache, "MAXSIZE", 2)
+    search_mod.TranscriptCache.clear()
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.srt"
+        path.write_text("")
+        paths.append(str(path))
+    try:
+        search_mod.TranscriptCache.set(paths[0], [{"content": "a"}])
+        search_mod.TranscriptCache.set(paths[1], [{"content": "b"}])
+        assert search_mod.TranscriptCache.get(paths[0]) == [{"content": "a"}]
+        search_mod.TranscriptCache.set(paths[2], [{"content": "c"}])
+        assert search_mod.TranscriptCache.get(paths[1]) is None
+        assert search_mod.TranscriptCache.get(paths[0]) == [{"content": "a"}]
+    finally:
+        search_mod.TranscriptCache.clear()
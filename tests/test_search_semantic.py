@@ -3,23 +3,19 @@ import numpy as np
 from voxgrep.core import engine as search_engine
 
 @patch('voxgrep.core.engine.SentenceTransformer')
-@patch('voxgrep.core.engine.util.cos_sim')
-def test_semantic_search_mock(mock_cos_sim, mock_transformer, tmp_path):
+def test_semantic_search_mock(mock_transformer, tmp_path):
     # Setup mock model
     mock_model = MagicMock()
     mock_transformer.return_value = mock_model
     
     # Mock model.encode for query and sentences
     # We'll just return dummy arrays
+    # Cosine similarity of the query with sentence 1 is 0.6, with sentence 2 is 0
     mock_model.encode.side_effect = [
-        np.array([[0.1, 0.2]]), # query embedding
-        np.array([[0.1, 0.2], [0.9, 0.9]]) # sentence embeddings
+        np.array([[3.0, 4.0]]), # query embedding
+        np.array([[1.0, 0.0], [0.0, 0.0]]) # sentence embeddings
     ]
     
-    # Mock cos_sim results
-    # Query 1 vs Sentence 1 & 2
-    mock_cos_sim.return_value = np.array([[0.9, 0.1]])
-    
     # Create dummy transcript and video
     testvid = str(tmp_path / "test.mp4")
     with open(testvid, "w") as f: f.write("dummy")
@@ -42,7 +38,7 @@ def test_semantic_search_mock(mock_cos_sim, mock_transformer, tmp_path):
             
     assert len(results) == 1
     assert results[0]["content"] == "Match this"
-    assert results[0]["score"] == 0.9
+    assert abs(results[0]["score"] - 0.6) < 1e-6
 
 def test_mashup_punctuation_fix(tmp_path):
     # Test the punctuation fix I added earlier
@@ -64,3 +60,48 @@ def test_mashup_punctuation_fix(tmp_path):
     results = search_engine.search(testvid, "world", search_type="mash")
     assert len(results) == 1
     assert results[0]["content"] == "world."
+
+def _write_srt(path, text):
+    with open(path, "w", encoding="utf8") as f:
+        f.write(f"1\n00:00:00,000 --> 00:00:01,000\n{text}\n\n")
+
+
+def test_semantic_segment_cache_follows_transcript(tmp_path, monkeypatch):
+    import os
+    monkeypatch.setenv("VOXGREP_CACHE_DIR", str(tmp_path / "cache"))
+    testvid = str(tmp_path / "talk.mp4")
+    with open(testvid, "w") as f: f.write("dummy")
+    subfile = str(tmp_path / "talk.en.srt")
+    _write_srt(subfile, "first version")
+
+    mock_model = MagicMock()
+    mock_model.encode.side_effect = lambda sentences, **kwargs: np.ones((len(sentences), 2))
+
+    with patch('voxgrep.core.engine.SEMANTIC_AVAILABLE', True), \
+            patch('voxgrep.core.engine.SemanticModel.get_instance', return_value=mock_model):
+        results = search_engine.search(testvid, "Query", search_type="semantic", threshold=0.5)
+        assert results[0]["content"].strip() == "first version"
+        # The cached segment list must not be mistaken for the transcript
+        assert search_engine.find_transcript(testvid) == subfile
+
+        encodes = mock_model.encode.call_count
+        search_engine.search(testvid, "Query", search_type="semantic", threshold=0.5)
+        assert mock_model.encode.call_count == encodes
+
+        # An edited transcript is parsed and encoded again
+        _write_srt(subfile, "second version")
+        mtime = os.path.getmtime(subfile) + 10
+        os.utime(subfile, (mtime, mtime))
+        results = search_engine.search(testvid, "Query", search_type="semantic", threshold=0.5)
+        assert results[0]["content"].strip() == "second version"
+        assert mock_model.encode.call_count == encodes + 1
+
+def test_semantic_batch_size_env(monkeypatch):
+    from voxgrep.utils import config
+
+    monkeypatch.setenv("VOXGREP_SEMANTIC_BATCH_SIZE", "16")
+    assert config.get_semantic_batch_size() == 16
+
+    # A malformed override falls back to the default
+    monkeypatch.setenv("VOXGREP_SEMANTIC_BATCH_SIZE", "big")
+    assert config.get_semantic_batch_size() == config.DEFAULT_SEMANTIC_BATCH_SIZE
@@ -0,0 +1,81 @@
+import asyncio
+import json
+import threading
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlmodel import SQLModel, Session, create_engine
+from sqlmodel.pool import StaticPool
+
+# The server package loads the semantic model stack on import
+pytest.importorskip("sentence_transformers")
+
+from voxgrep.server.dependencies import get_session
+from voxgrep.server.models import Video
+from voxgrep.server.routers import search as search_routes
+
+
+@pytest.fixture
+def client():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    test_video = Path(__file__).parent / "test_inputs" / "metallica.mp4"
+    with Session(engine) as session:
+        session.add(Video(
+            path=str(test_video),
+            filename=test_video.name,
+            size_bytes=test_video.stat().st_size,
+            created_at=0.0,
+            has_transcript=True,
+        ))
+        session.commit()
+
+    def override_session():
+        with Session(engine) as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(search_routes.router)
+    app.dependency_overrides[get_session] = override_session
+    return TestClient(app)
+
+
+def test_search_stream_ndjson(client):
+    with client.stream("GET", "/search/stream", params={"query": "concerto", "type": "sentence"}) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.iter_lines() if line]
+
+    assert lines
+    assert all("concerto" in line["content"].lower() for line in lines)
+    assert all(line["file"].endswith("metallica.mp4") for line in lines)
+
+
+def test_stream_close_cancels_pending_searches():
+    started = []
+    release = threading.Event()
+
+    def job(i):
+        started.append(i)
+        if i:
+            release.wait(timeout=5)
+        return [search_routes.SearchResult(file="a.mp4", start=i, end=i + 1, content=str(i))]
+
+    jobs = [lambda i=i: job(i) for i in range(100)]
+
+    async def read_first_line():
+        stream = search_routes._stream_batches(jobs)
+        first = await stream.__anext__()
+        await stream.aclose()
+        await asyncio.sleep(0.1)  # Let the cancellations reach the executor
+        release.set()
+        return first
+
+    first = asyncio.run(read_first_line())
+    assert json.loads(first)["content"] == "0"
+    # Only jobs that had already reached a worker thread ran
+    assert len(started) < len(jobs)
@@ -0,0 +1,148 @@
+import json
+import os
+import types
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlmodel import SQLModel, Session, create_engine, select
+from sqlmodel.pool import StaticPool
+
+# The server package loads the semantic model stack on import
+pytest.importorskip("sentence_transformers")
+
+from voxgrep.server.models import Video, Token
+from voxgrep.server.token_index import (
+    index_video_tokens,
+    refresh_video_tokens,
+    search_mash,
+    token_indexed_video_ids,
+)
+from voxgrep.server.routers import ingest
+from voxgrep.server.routers.library import _scan_path
+from voxgrep.server.routers.search import search
+
+
+def _write_transcript(path, words):
+    segments = [
+        {"content": " ".join(words), "start": 0.0, "end": float(len(words))}
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(segments, f)
+
+
+@pytest.fixture
+def db_engine():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def session(db_engine):
+    with Session(db_engine) as session:
+        yield session
+
+
+@pytest.fixture
+def video(tmp_path, session):
+    video_path = tmp_path / "talk.mp4"
+    video_path.write_bytes(b"dummy")
+    _write_transcript(tmp_path / "talk.json", ["Hello", "big", "world"])
+    video = Video(
+        path=str(video_path),
+        filename="talk.mp4",
+        size_bytes=5,
+        created_at=0.0,
+        has_transcript=True,
+        transcript_path=str(tmp_path / "talk.json"),
+    )
+    session.add(video)
+    session.commit()
+    session.refresh(video)
+    return video
+
+
+def test_index_video_tokens(session, video):
+    assert index_video_tokens(video, session) == 3
+    tokens = session.exec(select(Token).order_by(Token.position)).all()
+    assert [t.word for t in tokens] == ["hello", "big", "world"]
+    assert tokens[0].content == "Hello"
+    assert token_indexed_video_ids(session) == {video.id}
+
+
+def test_mash_served_from_index(session, video):
+    index_video_tokens(video, session)
+    segments = search_mash(session, ["world hello"], {video.id})
+    assert [s["content"] for s in segments] == ["world", "Hello"]
+    assert all(s["file"] == video.path for s in segments)
+
+    # The route answers mash from the index without scanning transcripts
+    with patch("voxgrep.server.routers.search.search_engine.search") as scan:
+        results = search(query="world big", type="mash", video_ids=None, session=session)
+    scan.assert_not_called()
+    # Sorted by start time, like the disk fallback
+    assert [r.content for r in results] == ["big", "world"]
+
+
+def test_refresh_follows_transcript_changes(session, video, tmp_path):
+    assert refresh_video_tokens([video], session) == 1
+    assert refresh_video_tokens([video], session) == 0
+
+    transcript = tmp_path / "talk.json"
+    _write_transcript(transcript, ["Goodbye", "world"])
+    mtime = os.path.getmtime(transcript) + 10
+    os.utime(transcript, (mtime, mtime))
+
+    assert refresh_video_tokens([video], session) == 1
+    words = session.exec(select(Token.word).order_by(Token.position)).all()
+    assert words == ["goodbye", "world"]
+
+    os.remove(transcript)
+    assert refresh_video_tokens([video], session) == 1
+    assert token_indexed_video_ids(session) == set()
+
+
+def test_scan_indexes_and_refreshes_tokens(session, tmp_path):
+    (tmp_path / "talk.mp4").write_bytes(b"dummy")
+    transcript = tmp_path / "talk.json"
+    _write_transcript(transcript, ["Hello", "world"])
+
+    assert _scan_path(str(tmp_path), session) == 1
+    assert session.exec(select(Token.word).order_by(Token.position)).all() == ["hello", "world"]
+
+    # A rescan picks up an edited transcript without re-adding the video
+    _write_transcript(transcript, ["Goodbye", "world"])
+    mtime = os.path.getmtime(transcript) + 10
+    os.utime(transcript, (mtime, mtime))
+    assert _scan_path(str(tmp_path), session) == 0
+    assert session.exec(select(Token.word).order_by(Token.position)).all() == ["goodbye", "world"]
+
+
+def test_add_local_indexes_tokens(db_engine, tmp_path, monkeypatch):
+    video_path = tmp_path / "talk.mp4"
+    video_path.write_bytes(b"dummy")
+
+    class FakeModelManager:
+        def transcribe(self, path, backend=None):
+            segments = [{"content": "Fresh words", "start": 0.0, "end": 1.0}]
+            return types.SimpleNamespace(segments=segments)
+
+    monkeypatch.setattr(ingest, "engine", db_engine)
+    monkeypatch.setattr(ingest, "get_model_manager", FakeModelManager)
+    monkeypatch.setattr(ingest.features, "enable_auto_indexing", False)
+
+    app = FastAPI()
+    app.include_router(ingest.router)
+    response = TestClient(app).post("/add-local", params={"filepath": str(video_path)})
+    assert response.status_code == 200
+
+    # Background tasks run before TestClient returns
+    with Session(db_engine) as session:
+        video = session.exec(select(Video)).one()
+        assert video.path == str(video_path)
+        words = session.exec(select(Token.word).order_by(Token.position)).all()
+    assert words == ["fresh", "words"]
@@ -76,3 +76,39 @@ def test_transcribe_mlx_mock(tmp_path):
         assert len(result[0]["words"]) == 2
         assert result[0]["words"][0]["word"] == "Hello"
 
+
+
+def test_transcribe_whisper_keeps_model_loaded(tmp_path):
+    with patch('voxgrep.core.transcriber.WhisperModel', create=True) as mock_whisper, \
+            patch('voxgrep.core.transcriber.WHISPER_AVAILABLE', True):
+        mock_model = MagicMock()
+        mock_whisper.return_value = mock_model
+        mock_model.transcribe.return_value = ([], MagicMock(duration=1.0, language="en"))
+
+        dummy_video = tmp_path / "reuse.mp4"
+        dummy_video.write_text("dummy")
+
+        try:
+            for _ in range(2):
+                transcribe.transcribe_whisper(str(dummy_video), "tiny", device="cpu", keep_model_loaded=True)
+        finally:
+            transcribe.clear_model_cache()
+
+        mock_whisper.assert_called_once()
+        assert mock_model.transcribe.call_count == 2
+
+
+def test_transcribe_whisper_condition_on_previous_text(tmp_path):
+    with patch('voxgrep.core.transcriber.WhisperModel', create=True) as mock_whisper, \
+            patch('voxgrep.core.transcriber.WHISPER_AVAILABLE', True):
+        mock_model = MagicMock()
+        mock_whisper.return_value = mock_model
+        mock_model.transcribe.return_value = ([], MagicMock(duration=1.0, language="en"))
+
+        dummy_video = tmp_path / "cond.mp4"
+        dummy_video.write_text("dummy")
+
+        transcribe.transcribe_whisper(str(dummy_video), "tiny", device="cpu", condition_on_previous_text=False)
+
+        _, kwargs = mock_model.transcribe.call_args
+        assert kwargs["condition_on_previous_text"] is False
@@ -2,6 +2,7 @@ import voxgrep
 from collections import Counter
 from pathlib import Path
 from pytest import approx
+import json
 import subprocess
 import sys
 import os
@@ -15,14 +16,14 @@ def get_duration(input_video):
             "error",
             "-show_entries",
             "format=duration",
-            "-of",
-            "default=noprint_wrappers=1:nokey=1",
+            "-print_format",
+            "json",
             input_video,
         ],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
+        capture_output=True,
+        check=True,
     )
-    return float(result.stdout)
+    return float(json.loads(result.stdout)["format"]["duration"])
 
 
 def File(path):
@@ -103,17 +104,13 @@ def test_pad_and_sync():
 def test_ngrams():
     testvid = File("test_inputs/metallica.mp4")
 
-    grams = list(voxgrep.get_ngrams(testvid, 1))
-    assert len(grams) == 262
-
-    most_common = Counter(grams).most_common(10)
-    assert most_common[0] == (("que",), 9)
-
-    grams = list(voxgrep.get_ngrams(testvid, 2))
-    assert len(grams) == 261
+    grams = Counter(voxgrep.get_ngrams(testvid, 1))
+    assert grams.total() == 262
+    assert grams.most_common(1)[0] == (("que",), 9)
 
-    most_common = Counter(grams).most_common(10)
-    assert most_common[0] == (("a", "gente"), 3)
+    grams = Counter(voxgrep.get_ngrams(testvid, 2))
+    assert grams.total() == 261
+    assert grams.most_common(1)[0] == (("a", "gente"), 3)
 
 
 def test_voxgrep():
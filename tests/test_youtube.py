@@ -30,5 +30,34 @@ class TestYoutubeModule(unittest.TestCase):
         with self.assertRaises(Exception):
             youtube.download_video('http://fake.url')
 
+    @patch('voxgrep.modules.youtube.yt_dlp.YoutubeDL')
+    def test_download_videos_reuses_session(self, mock_ydl):
+        mock_instance = mock_ydl.return_value
+        mock_instance.__enter__.return_value = mock_instance
+        mock_instance.extract_info.side_effect = lambda url, download: {'title': url, 'ext': 'mp4'}
+        mock_instance.prepare_filename.side_effect = lambda info: f"{info['title']}.mp4"
+
+        filenames = youtube.download_videos(['http://a.url', 'http://b.url'])
+
+        self.assertEqual(filenames, ['http://a.url.mp4', 'http://b.url.mp4'])
+        mock_ydl.assert_called_once()
+        self.assertEqual(mock_instance.extract_info.call_count, 2)
+
+    @patch('voxgrep.modules.youtube.tqdm')
+    def test_background_progress_bar(self, mock_tqdm):
+        bar = youtube._BackgroundProgressBar()
+        for downloaded in (100, 250, 400):
+            bar({'status': 'downloading', 'total_bytes': 400, 'downloaded_bytes': downloaded})
+        bar({'status': 'finished'})
+        bar.close()
+
+        mock_tqdm.assert_called_once()
+        self.assertEqual(mock_tqdm.call_args.kwargs['total'], 400)
+        pbar = mock_tqdm.return_value
+        self.assertEqual(sum(c.args[0] for c in pbar.update.call_args_list), 400)
+        # Small, rapid updates are coalesced: first chunk, then the residual on finish
+        self.assertEqual(pbar.update.call_count, 2)
+        pbar.close.assert_called_once()
+
 if __name__ == '__main__':
     unittest.main()
@@ -7,12 +7,14 @@ interactive.py and ngrams.py into a single, reusable component.
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from functools import lru_cache
 from typing import Any, Callable, Optional, Protocol, Sequence
 
 import questionary
 
 from .config import SearchConfig, ExportConfig
 from .io import CLIContext, PromptProvider, ConsoleProvider
+from .ui import print_session_summary
 
 
 class ActionResult(Enum):
@@ -23,7 +25,7 @@ class ActionResult(Enum):
     EXIT = auto()      # Exit entirely
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Action:
     """
     A single action in an action loop menu.
@@ -47,9 +49,12 @@ class Action:
         return questionary.Choice(self.label, value=self.value)
 
 
+_SEPARATOR = Action(label="", value="__sep__", is_separator=True)
+
+
 def separator() -> Action:
-    """Create a separator action."""
-    return Action(label="", value="__sep__", is_separator=True)
+    """Return the separator action (immutable, so one instance is shared)."""
+    return _SEPARATOR
 
 
 @dataclass
@@ -69,6 +74,11 @@ class ActionLoopState:
     # Mutable state that handlers can update
     result_data: dict[str, Any] = field(default_factory=dict)
 
+    # (label key, actions) from the last build_search_actions call
+    _cached_actions: Optional[tuple[tuple[Any, ...], tuple[Action, ...]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def run_search(self, preview: bool = False, demo: bool = False) -> Any:
         """
         Execute a search with current configuration.
@@ -126,7 +136,7 @@ class ActionLoop:
             default_action: Default selection value
         """
         self.title = title
-        self.actions = list(actions)
+        self.actions = tuple(actions)
         self.ctx = ctx
         self.state = state
         self.default_action = default_action
@@ -187,15 +197,37 @@ class ActionLoop:
 # Standard Action Handlers
 # =============================================================================
 
+def run_search_with_status(state: ActionLoopState, message: str, **kwargs: Any) -> Any:
+    """
+    Run ``state.run_search`` behind a status spinner.
+
+    The search stays on the main thread, so Ctrl-C interrupts it directly and
+    nothing keeps running after the wizard returns to its menu. Rich animates
+    the spinner from its own refresh thread meanwhile.
+
+    Only used for preview and demo runs; exports draw their own progress bar,
+    which cannot share the terminal with a spinner.
+
+    Args:
+        state: Action loop state to search with
+        message: Spinner text shown while the search runs
+        **kwargs: Passed through to ``state.run_search``
+
+    Returns:
+        Whatever ``state.run_search`` returned
+    """
+    with state.ctx.console.status(message):
+        return state.run_search(**kwargs)
+
+
 def create_preview_handler() -> Callable[[ActionLoopState], ActionResult]:
     """Create a standard preview action handler."""
 
     def handler(state: ActionLoopState) -> ActionResult:
         state.ctx.console.print("\n[bold yellow]Generating Preview...[/bold yellow]")
-        result = state.run_search(preview=True)
+        result = run_search_with_status(state, "Previewing...", preview=True)
 
         if isinstance(result, dict):
-            from .ui import print_session_summary
             print_session_summary(result)
 
         return ActionResult.CONTINUE
@@ -207,10 +239,9 @@ def create_demo_handler() -> Callable[[ActionLoopState], ActionResult]:
     """Create a standard demo (text results) action handler."""
 
     def handler(state: ActionLoopState) -> ActionResult:
-        result = state.run_search(demo=True)
+        result = run_search_with_status(state, "Searching...", demo=True)
 
         if isinstance(result, dict):
-            from .ui import print_session_summary
             print_session_summary(result)
 
         return ActionResult.CONTINUE
@@ -238,7 +269,6 @@ def create_export_handler(
         result = state.run_search()
 
         if isinstance(result, dict) and result.get("success"):
-            from .ui import print_session_summary
             print_session_summary(result)
 
         if result:
@@ -273,203 +303,226 @@ def create_settings_handler(
     return handler
 
 
-def create_back_handler() -> Callable[[ActionLoopState], ActionResult]:
-    """Create a handler that returns BACK."""
+def _back(state: ActionLoopState) -> ActionResult:
+    return ActionResult.BACK
 
-    def handler(state: ActionLoopState) -> ActionResult:
-        return ActionResult.BACK
 
-    return handler
+def _exit(state: ActionLoopState) -> ActionResult:
+    return ActionResult.EXIT
+
+
+def create_back_handler() -> Callable[[ActionLoopState], ActionResult]:
+    """Return the handler that returns BACK (stateless, so always the same one)."""
+    return _back
 
 
 def create_exit_handler() -> Callable[[ActionLoopState], ActionResult]:
-    """Create a handler that returns EXIT."""
+    """Return the handler that returns EXIT (stateless, so always the same one)."""
+    return _exit
 
-    def handler(state: ActionLoopState) -> ActionResult:
-        return ActionResult.EXIT
 
-    return handler
+# Stateless handlers only read state at call time, so one instance serves every menu
+PREVIEW_HANDLER = create_preview_handler()
+DEMO_HANDLER = create_demo_handler()
+BACK_HANDLER = create_back_handler()
+EXIT_HANDLER = create_exit_handler()
+
+
+@lru_cache(maxsize=16)
+def _export_handler_for(
+    get_default_output: Callable[[ActionLoopState], str],
+) -> Callable[[ActionLoopState], ActionResult]:
+    """Export handler for a given default-output function, reused across menu redraws."""
+    from .workflows import post_export_menu, get_output_filename
+
+    def get_filename(s: ActionLoopState) -> str:
+        default_out = get_default_output(s)
+        return get_output_filename(s.search.query, default_out)
+
+    return create_export_handler(get_filename, post_export_menu)
 
 
 # =============================================================================
 # Pre-built Action Sets
 # =============================================================================
 
+def settings_questions(s: ActionLoopState) -> dict[str, dict[str, Any]]:
+    """The search settings form, prefilled from the current state."""
+    return {
+        "search_type": {
+            "type": "select",
+            "message": "Search Type",
+            "choices": ["sentence", "fragment", "mash", "semantic"],
+            "default": s.search.search_type,
+        },
+        "padding": {
+            "type": "text",
+            "message": "Padding (seconds, e.g., 0.5):",
+            "default": s.search.padding_text,
+        },
+        "maxclips": {
+            "type": "text",
+            "message": "Max clips (0 for all):",
+            "default": s.search.maxclips_text,
+        },
+        "randomize": {
+            "type": "confirm",
+            "message": "Randomize order?",
+            "default": s.search.randomize,
+        },
+        "exact_match": {
+            "type": "confirm",
+            "message": "Exact Match (Whole Words Only)?",
+            "default": s.search.exact_match,
+        },
+        "burn_in_subtitles": {
+            "type": "confirm",
+            "message": "Burn-in Subtitles in output?",
+            "default": s.export.burn_in_subtitles,
+        },
+    }
+
+
+# Yes/no settings form answers: (answer key, state section, config field)
+_CONFIRM_SETTINGS = (
+    ("randomize", "search", "randomize"),
+    ("exact_match", "search", "exact_match"),
+    ("burn_in_subtitles", "export", "burn_in_subtitles"),
+)
+
+
+def apply_settings(s: ActionLoopState, answers: dict[str, Any]) -> None:
+    """Store settings form answers on the state and report them."""
+    # A cancelled prompt answers None; keep the previous value in that case
+    if (search_type := answers["search_type"]) is not None:
+        s.search.search_type = search_type
+
+    if (padding_str := answers["padding"]) is not None:
+        s.search.padding = float(padding_str) if padding_str else None
+
+    if (maxclips_str := answers["maxclips"]) is not None:
+        s.search.maxclips = int(maxclips_str) if maxclips_str else 0
+
+    for key, section, attr in _CONFIRM_SETTINGS:
+        answer = answers[key]
+        if answer is not None:
+            setattr(getattr(s, section), attr, answer)
+
+    s.ctx.console.print(
+        f"[green]Settings updated. Search Type: {s.search.search_type}, "
+        f"Exact Match: {s.search.exact_match}, Burn-in: {s.export.burn_in_subtitles}[/green]"
+    )
+
+
+def configure_settings(s: ActionLoopState) -> None:
+    """Ask the search settings form and apply the answers."""
+    apply_settings(s, s.ctx.prompts.form(settings_questions(s)))
+
+
+SETTINGS_HANDLER = create_settings_handler(configure_settings)
+
+
+@lru_cache(maxsize=8)
+def search_action_labels(
+    padding: Optional[float],
+    maxclips: int,
+    default_out: str,
+) -> tuple[str, str]:
+    """
+    Format the export and settings labels of the search action menu.
+
+    Returns:
+        Tuple of (export label, settings label)
+    """
+    padding_display = padding or 0
+    max_display = maxclips or "All"
+    return (
+        f"Export Supercut (to {default_out}.mp4...)",
+        f"Settings (Padding: {padding_display}s, Max: {max_display})",
+    )
+
+
 def build_search_actions(
     state: ActionLoopState,
     get_default_output: Callable[[ActionLoopState], str],
-) -> list[Action]:
+) -> tuple[Action, ...]:
     """
     Build standard search workflow actions.
 
     This creates the common action set used in both the main search workflow
-    and the n-gram action phase.
+    and the n-gram action phase. The list is reused while the settings shown
+    in its labels are unchanged.
     """
-    from .workflows import post_export_menu, get_output_filename
-
-    def settings_menu(s: ActionLoopState) -> None:
-        """Configure search settings inline."""
-        # Search type
-        s.search.search_type = s.ctx.prompts.select(
-            "Search Type",
-            choices=["sentence", "fragment", "mash", "semantic"],
-            default=s.search.search_type,
-        ) or s.search.search_type
-
-        # Padding
-        padding_str = s.ctx.prompts.text(
-            "Padding (seconds, e.g., 0.5):",
-            default=str(s.search.padding) if s.search.padding else "",
-        )
-        s.search.padding = float(padding_str) if padding_str else None
-
-        # Max clips
-        maxclips_str = s.ctx.prompts.text(
-            "Max clips (0 for all):",
-            default=str(s.search.maxclips),
-        )
-        s.search.maxclips = int(maxclips_str) if maxclips_str else 0
+    key = (state.search.padding, state.search.maxclips, get_default_output(state), get_default_output)
+    if state._cached_actions is not None and state._cached_actions[0] == key:
+        return state._cached_actions[1]
 
-        # Randomize
-        s.search.randomize = s.ctx.prompts.confirm(
-            "Randomize order?",
-            default=s.search.randomize,
-        ) or False
-
-        # Exact match
-        s.search.exact_match = s.ctx.prompts.confirm(
-            "Exact Match (Whole Words Only)?",
-            default=s.search.exact_match,
-        ) or False
-
-        # Burn-in subtitles
-        s.export.burn_in_subtitles = s.ctx.prompts.confirm(
-            "Burn-in Subtitles in output?",
-            default=s.export.burn_in_subtitles,
-        ) or False
-
-        s.ctx.console.print(
-            f"[green]Settings updated. Search Type: {s.search.search_type}, "
-            f"Exact Match: {s.search.exact_match}, Burn-in: {s.export.burn_in_subtitles}[/green]"
-        )
-
-    def get_filename(s: ActionLoopState) -> str:
-        default_out = get_default_output(s)
-        return get_output_filename(s.search.query, default_out)
-
-    default_out = get_default_output(state)
-    padding_display = state.search.padding or 0
-    max_display = state.search.maxclips or "All"
-
-    return [
+    export_label, settings_label = search_action_labels(*key[:3])
+    actions = (
         Action(
             "Preview Results (MPV)",
             "preview",
-            create_preview_handler(),
+            PREVIEW_HANDLER,
         ),
         Action(
-            f"Export Supercut (to {default_out}.mp4...)",
+            export_label,
             "export",
-            create_export_handler(get_filename, post_export_menu),
+            _export_handler_for(get_default_output),
         ),
         separator(),
         Action(
-            f"Settings (Padding: {padding_display}s, Max: {max_display})",
+            settings_label,
             "settings",
-            create_settings_handler(settings_menu),
+            SETTINGS_HANDLER,
         ),
         Action(
             "Start Over (New Search)",
             "cancel",
-            create_back_handler(),
+            BACK_HANDLER,
         ),
-    ]
+    )
+    state._cached_actions = (key, actions)
+    return actions
 
 
 def build_ngram_actions(
     state: ActionLoopState,
     get_default_output: Callable[[ActionLoopState], str],
-) -> list[Action]:
+) -> tuple[Action, ...]:
     """
     Build n-gram specific workflow actions.
 
     Similar to search actions but includes additional n-gram specific options.
     """
-    from .workflows import post_export_menu, get_output_filename
-
-    def settings_menu(s: ActionLoopState) -> None:
-        """Configure search settings inline."""
-        s.search.search_type = s.ctx.prompts.select(
-            "Search Type",
-            choices=["sentence", "fragment", "mash", "semantic"],
-            default=s.search.search_type,
-        ) or s.search.search_type
-
-        padding_str = s.ctx.prompts.text(
-            "Padding (seconds, e.g., 0.5):",
-            default=str(s.search.padding) if s.search.padding else "",
-        )
-        s.search.padding = float(padding_str) if padding_str else None
-
-        maxclips_str = s.ctx.prompts.text(
-            "Max clips (0 for all):",
-            default=str(s.search.maxclips),
-        )
-        s.search.maxclips = int(maxclips_str) if maxclips_str else 0
-
-        s.search.randomize = s.ctx.prompts.confirm(
-            "Randomize order?",
-            default=s.search.randomize,
-        ) or False
-
-        s.search.exact_match = s.ctx.prompts.confirm(
-            "Exact Match (Whole Words Only)?",
-            default=s.search.exact_match,
-        ) or False
-
-        s.export.burn_in_subtitles = s.ctx.prompts.confirm(
-            "Burn-in Subtitles in output?",
-            default=s.export.burn_in_subtitles,
-        ) or False
-
-        s.ctx.console.print(
-            f"[green]Settings updated. Search Type: {s.search.search_type}, "
-            f"Exact Match: {s.search.exact_match}, Burn-in: {s.export.burn_in_subtitles}[/green]"
-        )
-
-    def get_filename(s: ActionLoopState) -> str:
-        default_out = get_default_output(s)
-        return get_output_filename(s.search.query, default_out)
-
-    return [
+    return (
         Action(
             "Preview Results (MPV)",
             "preview",
-            create_preview_handler(),
+            PREVIEW_HANDLER,
         ),
         Action(
             "Export Supercut",
             "export",
-            create_export_handler(get_filename, post_export_menu),
+            _export_handler_for(get_default_output),
         ),
         Action(
             "Settings (Search Type, Padding, etc.)",
             "settings",
-            create_settings_handler(settings_menu),
+            SETTINGS_HANDLER,
         ),
         Action(
             "Edit Selection (Add/Remove N-grams)",
             "edit_selection",
-            create_back_handler(),  # Returns BACK to go to selection phase
+            BACK_HANDLER,  # Returns BACK to go to selection phase
         ),
         Action(
             "Start Over (New Search)",
             "start_over",
-            create_exit_handler(),
+            EXIT_HANDLER,
         ),
         Action(
             "Cancel / Back",
             "cancel",
-            create_exit_handler(),
+            EXIT_HANDLER,
         ),
-    ]
+    )
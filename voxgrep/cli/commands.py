@@ -324,7 +324,8 @@ def run_voxgrep_search(
     preview: bool = False,
     exact_match: bool = False,
     progress_callback=None,
-    burn_in_subtitles: bool = False
+    burn_in_subtitles: bool = False,
+    stream_copy: bool = False
 ) -> Union[bool, dict]:
     """
     Execute voxgrep search with optional progress tracking.
@@ -344,6 +345,7 @@ def run_voxgrep_search(
         preview: Preview mode (use MPV)
         exact_match: Exact word matching
         progress_callback: Optional progress callback function
+        stream_copy: Cut without re-encoding (keyframe-accurate only)
         
     Returns:
         True if successful, False otherwise
@@ -365,7 +367,8 @@ def run_voxgrep_search(
             preview=preview,
             exact_match=exact_match,
             console=console,
-            burn_in_subtitles=burn_in_subtitles
+            burn_in_subtitles=burn_in_subtitles,
+            stream_copy=stream_copy
         )
     else:
         # Use progress bar for actual processing
@@ -399,7 +402,8 @@ def run_voxgrep_search(
                 exact_match=exact_match,
                 console=console,
                 progress_callback=progress_callback or update_progress,
-                burn_in_subtitles=burn_in_subtitles
+                burn_in_subtitles=burn_in_subtitles,
+                stream_copy=stream_copy
             )
             
             if result and isinstance(result, bool):
@@ -485,5 +489,6 @@ def execute_args(args: Namespace) -> bool:
         write_vtt=args.write_vtt,
         preview=args.preview,
         exact_match=args.exact_match,
-        burn_in_subtitles=getattr(args, 'burn_in_subtitles', False)
+        burn_in_subtitles=getattr(args, 'burn_in_subtitles', False),
+        stream_copy=getattr(args, 'stream_copy', False)
     )
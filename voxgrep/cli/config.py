@@ -7,8 +7,8 @@ safety, IDE support, and testability.
 """
 
 from argparse import Namespace
-from dataclasses import dataclass, field, asdict
-from typing import Any, Optional
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Optional
 
 from ..utils.config import (
     DEFAULT_WHISPER_MODEL,
@@ -19,10 +19,31 @@ from ..utils.config import (
 )
 
 
-@dataclass
+def _update_namespace(config: Any, args: Namespace) -> None:
+    """Copy a config's fields onto a Namespace following its ``_NS_MAP``."""
+    ns = vars(args)
+    for attr, name in config._NS_MAP:
+        ns[name] = getattr(config, attr)
+
+
+@dataclass(slots=True)
 class TranscriptionConfig:
     """Configuration for Whisper transcription."""
 
+    # (attribute, Namespace name) pairs written by to_namespace_update
+    _NS_MAP: ClassVar[tuple[tuple[str, str], ...]] = (
+        ('model', 'model'),
+        ('device', 'device'),
+        ('compute_type', 'compute_type'),
+        ('language', 'language'),
+        ('prompt', 'prompt'),
+        ('beam_size', 'beam_size'),
+        ('best_of', 'best_of'),
+        ('vad_filter', 'vad_filter'),
+        ('normalize_audio', 'normalize_audio'),
+        ('translate', 'translate'),
+    )
+
     model: str = DEFAULT_WHISPER_MODEL
     device: str = DEFAULT_DEVICE
     compute_type: str = DEFAULT_COMPUTE_TYPE
@@ -37,47 +58,40 @@ class TranscriptionConfig:
     @classmethod
     def from_namespace(cls, args: Namespace) -> "TranscriptionConfig":
         """Create TranscriptionConfig from argparse Namespace."""
+        ns = vars(args)
         return cls(
-            model=getattr(args, 'model', DEFAULT_WHISPER_MODEL),
-            device=getattr(args, 'device', DEFAULT_DEVICE),
-            compute_type=getattr(args, 'compute_type', DEFAULT_COMPUTE_TYPE),
-            language=getattr(args, 'language', None),
-            prompt=getattr(args, 'prompt', None),
-            beam_size=getattr(args, 'beam_size', 5),
-            best_of=getattr(args, 'best_of', 5),
-            vad_filter=getattr(args, 'vad_filter', True),
-            normalize_audio=getattr(args, 'normalize_audio', False),
-            translate=getattr(args, 'translate', False),
+            model=ns.get('model', DEFAULT_WHISPER_MODEL),
+            device=ns.get('device', DEFAULT_DEVICE),
+            compute_type=ns.get('compute_type', DEFAULT_COMPUTE_TYPE),
+            language=ns.get('language', None),
+            prompt=ns.get('prompt', None),
+            beam_size=ns.get('beam_size', 5),
+            best_of=ns.get('best_of', 5),
+            vad_filter=ns.get('vad_filter', True),
+            normalize_audio=ns.get('normalize_audio', False),
+            translate=ns.get('translate', False),
         )
 
     @classmethod
     def from_prefs(cls, prefs: dict[str, Any]) -> "TranscriptionConfig":
         """Create TranscriptionConfig from preferences dictionary."""
+        get = prefs.get
         return cls(
-            model=prefs.get('whisper_model', DEFAULT_WHISPER_MODEL),
-            device=prefs.get('device', DEFAULT_DEVICE),
-            compute_type=prefs.get('compute_type', DEFAULT_COMPUTE_TYPE),
+            model=get('whisper_model', DEFAULT_WHISPER_MODEL),
+            device=get('device', DEFAULT_DEVICE),
+            compute_type=get('compute_type', DEFAULT_COMPUTE_TYPE),
             language=None,
             prompt=None,
-            beam_size=prefs.get('beam_size', 5),
-            best_of=prefs.get('best_of', 5),
-            vad_filter=prefs.get('vad_filter', True),
-            normalize_audio=prefs.get('normalize_audio', False),
+            beam_size=get('beam_size', 5),
+            best_of=get('best_of', 5),
+            vad_filter=get('vad_filter', True),
+            normalize_audio=get('normalize_audio', False),
             translate=False,
         )
 
     def to_namespace_update(self, args: Namespace) -> None:
         """Update an existing Namespace with this config's values."""
-        args.model = self.model
-        args.device = self.device
-        args.compute_type = self.compute_type
-        args.language = self.language
-        args.prompt = self.prompt
-        args.beam_size = self.beam_size
-        args.best_of = self.best_of
-        args.vad_filter = self.vad_filter
-        args.normalize_audio = self.normalize_audio
-        args.translate = self.translate
+        _update_namespace(self, args)
 
     def to_prefs_update(self) -> dict[str, Any]:
         """Return dict of preference keys to update."""
@@ -92,10 +106,23 @@ class TranscriptionConfig:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchConfig:
     """Configuration for search operations."""
 
+    # (attribute, Namespace name) pairs written by to_namespace_update
+    _NS_MAP: ClassVar[tuple[tuple[str, str], ...]] = (
+        ('query', 'search'),
+        ('search_type', 'searchtype'),
+        ('maxclips', 'maxclips'),
+        ('padding', 'padding'),
+        ('randomize', 'randomize'),
+        ('exact_match', 'exact_match'),
+        ('resync', 'sync'),
+        ('ignored_words', 'ignored_words'),
+        ('use_ignored_words', 'use_ignored_words'),
+    )
+
     query: list[str] = field(default_factory=list)
     search_type: str = DEFAULT_SEARCH_TYPE
     maxclips: int = 0
@@ -106,47 +133,51 @@ class SearchConfig:
     ignored_words: list[str] = field(default_factory=lambda: DEFAULT_IGNORED_WORDS.copy())
     use_ignored_words: bool = True
 
+    @property
+    def padding_text(self) -> str:
+        """Padding as shown in the settings form; empty when unset."""
+        return str(self.padding) if self.padding else ""
+
+    @property
+    def maxclips_text(self) -> str:
+        """Max clips as shown in the settings form ("0" means all)."""
+        return str(self.maxclips)
+
     @classmethod
     def from_namespace(cls, args: Namespace) -> "SearchConfig":
         """Create SearchConfig from argparse Namespace."""
+        ns = vars(args)
         return cls(
-            query=getattr(args, 'search', None) or [],
-            search_type=getattr(args, 'searchtype', DEFAULT_SEARCH_TYPE),
-            maxclips=getattr(args, 'maxclips', 0),
-            padding=getattr(args, 'padding', None),
-            randomize=getattr(args, 'randomize', False),
-            exact_match=getattr(args, 'exact_match', False),
-            resync=getattr(args, 'sync', 0),
-            ignored_words=getattr(args, 'ignored_words', DEFAULT_IGNORED_WORDS.copy()),
-            use_ignored_words=getattr(args, 'use_ignored_words', True),
+            query=ns.get('search') or [],
+            search_type=ns.get('searchtype', DEFAULT_SEARCH_TYPE),
+            maxclips=ns.get('maxclips', 0),
+            padding=ns.get('padding', None),
+            randomize=ns.get('randomize', False),
+            exact_match=ns.get('exact_match', False),
+            resync=ns.get('sync', 0),
+            ignored_words=ns['ignored_words'] if 'ignored_words' in ns else DEFAULT_IGNORED_WORDS.copy(),
+            use_ignored_words=ns.get('use_ignored_words', True),
         )
 
     @classmethod
     def from_prefs(cls, prefs: dict[str, Any]) -> "SearchConfig":
         """Create SearchConfig from preferences dictionary."""
+        get = prefs.get
         return cls(
             query=[],
-            search_type=prefs.get('search_type', DEFAULT_SEARCH_TYPE),
+            search_type=get('search_type', DEFAULT_SEARCH_TYPE),
             maxclips=0,
             padding=None,
             randomize=False,
             exact_match=False,
             resync=0,
-            ignored_words=prefs.get('ignored_words', DEFAULT_IGNORED_WORDS.copy()),
-            use_ignored_words=prefs.get('use_ignored_words', True),
+            ignored_words=prefs['ignored_words'] if 'ignored_words' in prefs else DEFAULT_IGNORED_WORDS.copy(),
+            use_ignored_words=get('use_ignored_words', True),
         )
 
     def to_namespace_update(self, args: Namespace) -> None:
         """Update an existing Namespace with this config's values."""
-        args.search = self.query
-        args.searchtype = self.search_type
-        args.maxclips = self.maxclips
-        args.padding = self.padding
-        args.randomize = self.randomize
-        args.exact_match = self.exact_match
-        args.sync = self.resync
-        args.ignored_words = self.ignored_words
-        args.use_ignored_words = self.use_ignored_words
+        _update_namespace(self, args)
 
     def to_prefs_update(self) -> dict[str, Any]:
         """Return dict of preference keys to update."""
@@ -157,10 +188,20 @@ class SearchConfig:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportConfig:
     """Configuration for export operations."""
 
+    # (attribute, Namespace name) pairs written by to_namespace_update
+    _NS_MAP: ClassVar[tuple[tuple[str, str], ...]] = (
+        ('output', 'outputfile'),
+        ('preview', 'preview'),
+        ('demo', 'demo'),
+        ('export_clips', 'export_clips'),
+        ('write_vtt', 'write_vtt'),
+        ('burn_in_subtitles', 'burn_in_subtitles'),
+    )
+
     output: str = "supercut.mp4"
     preview: bool = False
     demo: bool = False
@@ -171,35 +212,32 @@ class ExportConfig:
     @classmethod
     def from_namespace(cls, args: Namespace) -> "ExportConfig":
         """Create ExportConfig from argparse Namespace."""
+        ns = vars(args)
         return cls(
-            output=getattr(args, 'outputfile', "supercut.mp4"),
-            preview=getattr(args, 'preview', False),
-            demo=getattr(args, 'demo', False),
-            export_clips=getattr(args, 'export_clips', False),
-            write_vtt=getattr(args, 'write_vtt', False),
-            burn_in_subtitles=getattr(args, 'burn_in_subtitles', False),
+            output=ns.get('outputfile', "supercut.mp4"),
+            preview=ns.get('preview', False),
+            demo=ns.get('demo', False),
+            export_clips=ns.get('export_clips', False),
+            write_vtt=ns.get('write_vtt', False),
+            burn_in_subtitles=ns.get('burn_in_subtitles', False),
         )
 
     @classmethod
     def from_prefs(cls, prefs: dict[str, Any]) -> "ExportConfig":
         """Create ExportConfig from preferences dictionary."""
+        get = prefs.get
         return cls(
             output="supercut.mp4",
-            preview=prefs.get('preview', False),
-            demo=prefs.get('demo', False),
+            preview=get('preview', False),
+            demo=get('demo', False),
             export_clips=False,
             write_vtt=False,
-            burn_in_subtitles=prefs.get('burn_in_subtitles', False),
+            burn_in_subtitles=get('burn_in_subtitles', False),
         )
 
     def to_namespace_update(self, args: Namespace) -> None:
         """Update an existing Namespace with this config's values."""
-        args.outputfile = self.output
-        args.preview = self.preview
-        args.demo = self.demo
-        args.export_clips = self.export_clips
-        args.write_vtt = self.write_vtt
-        args.burn_in_subtitles = self.burn_in_subtitles
+        _update_namespace(self, args)
 
     def to_prefs_update(self) -> dict[str, Any]:
         """Return dict of preference keys to update."""
@@ -210,7 +248,7 @@ class ExportConfig:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionConfig:
     """
     Complete session configuration combining all aspects.
@@ -229,13 +267,14 @@ class SessionConfig:
     @classmethod
     def from_namespace(cls, args: Namespace) -> "SessionConfig":
         """Create SessionConfig from argparse Namespace."""
+        ns = vars(args)
         return cls(
-            input_files=getattr(args, 'inputfile', None) or [],
+            input_files=ns.get('inputfile') or [],
             transcription=TranscriptionConfig.from_namespace(args),
             search=SearchConfig.from_namespace(args),
             export=ExportConfig.from_namespace(args),
-            transcribe=getattr(args, 'transcribe', False),
-            ngrams=getattr(args, 'ngrams', 0),
+            transcribe=ns.get('transcribe', False),
+            ngrams=ns.get('ngrams', 0),
         )
 
     @classmethod
@@ -252,10 +291,11 @@ class SessionConfig:
 
     def to_namespace(self) -> Namespace:
         """Convert to argparse Namespace for backward compatibility."""
-        args = Namespace()
-        args.inputfile = self.input_files
-        args.transcribe = self.transcribe
-        args.ngrams = self.ngrams
+        args = Namespace(
+            inputfile=self.input_files,
+            transcribe=self.transcribe,
+            ngrams=self.ngrams,
+        )
 
         self.transcription.to_namespace_update(args)
         self.search.to_namespace_update(args)
@@ -265,8 +305,19 @@ class SessionConfig:
 
     def to_prefs_update(self) -> dict[str, Any]:
         """Return dict of all preference keys to update."""
-        prefs = {}
-        prefs.update(self.transcription.to_prefs_update())
-        prefs.update(self.search.to_prefs_update())
-        prefs.update(self.export.to_prefs_update())
-        return prefs
+        transcription, search, export = self.transcription, self.search, self.export
+        return {
+            'whisper_model': transcription.model,
+            'device': transcription.device,
+            'compute_type': transcription.compute_type,
+            'beam_size': transcription.beam_size,
+            'best_of': transcription.best_of,
+            'vad_filter': transcription.vad_filter,
+            'normalize_audio': transcription.normalize_audio,
+            'search_type': search.search_type,
+            'ignored_words': search.ignored_words,
+            'use_ignored_words': search.use_ignored_words,
+            'preview': export.preview,
+            'demo': export.demo,
+            'burn_in_subtitles': export.burn_in_subtitles,
+        }
@@ -8,29 +8,20 @@ The main entry point is `interactive_mode()` which delegates to the
 InteractiveWizard state machine for cleaner flow control.
 """
 
+import re
 from argparse import Namespace
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import questionary
 
-from .ui import console, print_session_summary
 from .io import CLIContext
 from .config import SessionConfig
 
-from .workflows import (
-    select_input_files, check_transcripts, configure_transcription,
-    settings_menu, post_export_menu, search_settings_menu,
-    get_output_filename, manage_files_menu
-)
-from .commands import run_voxgrep_search, execute_args, run_transcription_whisper
-from .ngrams import interactive_ngrams_workflow
-from ..utils.config import (
-    DEFAULT_WHISPER_MODEL,
-    DEFAULT_DEVICE,
-    DEFAULT_SEARCH_TYPE,
-    DEFAULT_IGNORED_WORDS
-)
-from ..utils.prefs import load_prefs, save_prefs
+# Anything other than word characters, spaces and hyphens is dropped from output names
+_UNSAFE_NAME_CHARS_RE = re.compile(r"[^\w \-]")
+
+# One comma-separated search term, without surrounding whitespace
+_QUERY_TOKEN_RE = re.compile(r"[^,\s](?:[^,]*[^,\s])?")
 
 
 def create_default_args(input_files: list[str], prefs: dict[str, Any]) -> Namespace:
@@ -53,19 +44,107 @@ def create_default_args(input_files: list[str], prefs: dict[str, Any]) -> Namesp
     return session.to_namespace()
 
 
+def parse_search_terms(search_input: str) -> list[str]:
+    """Split comma-separated search input into stripped, non-empty terms."""
+    return _QUERY_TOKEN_RE.findall(search_input)
+
+
 def get_default_output_name(search_terms: list[str] | None) -> str:
     """Get a safe default output name from search terms."""
     default_out = "supercut"
     if search_terms:
-        safe_term = "".join([
-            c if c.isalnum() or c in (' ', '-', '_') else ''
-            for c in search_terms[0]
-        ]).strip().replace(' ', '_')
+        safe_term = _UNSAFE_NAME_CHARS_RE.sub('', search_terms[0]).strip().replace(' ', '_')
         if safe_term:
             default_out = safe_term
     return default_out
 
 
+def _search_kwargs(args: Namespace, preview: bool) -> dict[str, Any]:
+    """Map the interactive Namespace onto run_voxgrep_search keyword arguments."""
+    a = vars(args)
+    return {
+        'files': a['inputfile'],
+        'query': a['search'],
+        'search_type': a['searchtype'],
+        'output': a['outputfile'],
+        'maxclips': a['maxclips'],
+        'padding': a['padding'],
+        'demo': False,
+        'random_order': a['randomize'],
+        'resync': a['sync'],
+        'export_clips': a['export_clips'],
+        'write_vtt': a['write_vtt'],
+        'preview': preview,
+        'exact_match': a['exact_match'],
+        'burn_in_subtitles': a['burn_in_subtitles'],
+    }
+
+
+def _preview_search(args: Namespace, default_out: str) -> Optional[bool]:
+    """Preview the current search in MPV."""
+    from .ui import console, print_session_summary
+    from .commands import run_voxgrep_search
+
+    console.print("\n[bold yellow]Generating Preview...[/bold yellow]")
+    result = run_voxgrep_search(**_search_kwargs(args, preview=True))
+
+    if isinstance(result, dict):
+        print_session_summary(result)
+    return None
+
+
+def _edit_search_settings(args: Namespace, default_out: str) -> Optional[bool]:
+    """Change padding, max clips and the other search settings."""
+    from .workflows import search_settings_menu
+
+    search_settings_menu(args)
+    return None
+
+
+def _export_search(args: Namespace, default_out: str) -> Optional[bool]:
+    """Export the supercut, then offer the post-export menu."""
+    from .ui import print_session_summary
+    from .workflows import post_export_menu, get_output_filename
+    from .commands import run_voxgrep_search
+
+    args.preview = False
+    args.demo = False
+    args.outputfile = get_output_filename(args.search, default_out)
+
+    # Run export with progress
+    result = run_voxgrep_search(**_search_kwargs(args, preview=False))
+
+    if isinstance(result, dict) and result.get("success"):
+        print_session_summary(result)
+
+    # Post-export menu; opening the file or its folder shows it again
+    if result:
+        post_action = post_export_menu(args.outputfile)
+        while post_action in ("open", "folder"):
+            post_action = post_export_menu(args.outputfile)
+
+        if post_action == "edit":
+            return None  # Back to search workflow loop
+
+    # "new", "menu" or a cancelled prompt: back to main menu
+    return True
+
+
+def _cancel_search(args: Namespace, default_out: str) -> Optional[bool]:
+    """Leave the search workflow for the main menu."""
+    return True
+
+
+# "Next Step" menu value -> handler. A handler returns None to show the menu
+# again, or the value handle_search_workflow should return.
+_SEARCH_ACTIONS: dict[str, Callable[[Namespace, str], Optional[bool]]] = {
+    "preview": _preview_search,
+    "settings": _edit_search_settings,
+    "export": _export_search,
+    "cancel": _cancel_search,
+}
+
+
 def handle_search_workflow(args: Namespace) -> bool:
     """
     Handle the search workflow including preview, export, and settings.
@@ -81,7 +160,7 @@ def handle_search_workflow(args: Namespace) -> bool:
     if not search_input:
         return True
 
-    args.search = [s.strip() for s in search_input.split(',') if s.strip()]
+    args.search = parse_search_terms(search_input)
 
     # Select search type
     args.searchtype = questionary.select(
@@ -107,79 +186,10 @@ def handle_search_workflow(args: Namespace) -> bool:
             default="preview"
         ).ask()
 
-        if action == "cancel":
-            return True
-
-        if action == "preview":
-            console.print("\n[bold yellow]Generating Preview...[/bold yellow]")
-            result = run_voxgrep_search(
-                files=args.inputfile,
-                query=args.search,
-                search_type=args.searchtype,
-                output=args.outputfile,
-                maxclips=args.maxclips,
-                padding=args.padding,
-                demo=False,
-                random_order=args.randomize,
-                resync=args.sync,
-                export_clips=args.export_clips,
-                write_vtt=args.write_vtt,
-                preview=True,
-                exact_match=args.exact_match,
-                burn_in_subtitles=args.burn_in_subtitles
-            )
-
-            if isinstance(result, dict):
-                print_session_summary(result)
-
-            continue
-
-        if action == "settings":
-            search_settings_menu(args)
-            continue
-
-        if action == "export":
-            args.preview = False
-            args.demo = False
-            args.outputfile = get_output_filename(args.search, default_out)
-
-            # Run export with progress
-            result = run_voxgrep_search(
-                files=args.inputfile,
-                query=args.search,
-                search_type=args.searchtype,
-                output=args.outputfile,
-                maxclips=args.maxclips,
-                padding=args.padding,
-                demo=False,
-                random_order=args.randomize,
-                resync=args.sync,
-                export_clips=args.export_clips,
-                write_vtt=args.write_vtt,
-                preview=False,
-                exact_match=args.exact_match,
-                burn_in_subtitles=args.burn_in_subtitles
-            )
-
-            if isinstance(result, dict) and result.get("success"):
-                print_session_summary(result)
-
-            # Post-export menu
-            if result:
-                while True:
-                    post_action = post_export_menu(args.outputfile)
-
-                    if post_action == "edit":
-                        break  # Back to search workflow loop
-                    elif post_action in ("new", "menu"):
-                        return True  # Back to main menu
-
-                if post_action == "edit":
-                    continue
-
-            return True
-
-    return True
+        # A cancelled menu (None) is treated like "Start Over"
+        outcome = _SEARCH_ACTIONS.get(action, _cancel_search)(args, default_out)
+        if outcome is not None:
+            return outcome
 
 
 def interactive_mode(ctx: Optional[CLIContext] = None) -> None:
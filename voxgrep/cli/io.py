@@ -6,8 +6,9 @@ enabling the CLI to be tested without requiring actual user interaction.
 """
 
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Callable, Optional, TypeVar, Generic, Sequence
+from typing import Any, Callable, Iterator, Optional, TypeVar, Generic, Sequence
 
 import questionary
 from rich.console import Console
@@ -16,6 +17,14 @@ from ..utils.prefs import load_prefs, save_prefs
 
 T = TypeVar('T')
 
+# Menu highlight style shared by all questionary prompts
+DEFAULT_STYLE = questionary.Style([('highlighted', 'fg:cyan bold')])
+
+
+def _as_list(choices: Sequence[Any]) -> list[Any]:
+    """Return choices as a list, without copying one that already is."""
+    return choices if isinstance(choices, list) else list(choices)
+
 
 class PromptProvider(ABC):
     """
@@ -121,6 +130,28 @@ class PromptProvider(ABC):
         """
         ...
 
+    def form(self, questions: dict[str, dict[str, Any]]) -> dict[str, Any]:
+        """
+        Ask several questions in one call.
+
+        Each entry maps an answer key to a question spec: a dict with a
+        'type' of 'select', 'text' or 'confirm' plus that prompt's keyword
+        arguments. The default asks them one at a time through the methods
+        above; providers with a native form widget can override it.
+
+        Args:
+            questions: Ordered mapping of answer key to question spec
+
+        Returns:
+            Dict of answers by key; a cancelled question's answer is None
+        """
+        answers = {}
+        for key, spec in questions.items():
+            spec = dict(spec)
+            ask = getattr(self, spec.pop('type'))
+            answers[key] = ask(**spec)
+        return answers
+
 
 class ConsoleProvider(ABC):
     """
@@ -157,9 +188,7 @@ class QuestionaryPrompts(PromptProvider):
     """Production implementation using questionary."""
 
     def __init__(self, style: Optional[questionary.Style] = None):
-        self._style = style or questionary.Style([
-            ('highlighted', 'fg:cyan bold')
-        ])
+        self._style = style or DEFAULT_STYLE
 
     def select(
         self,
@@ -169,7 +198,7 @@ class QuestionaryPrompts(PromptProvider):
     ) -> Optional[Any]:
         return questionary.select(
             message,
-            choices=list(choices),
+            choices=_as_list(choices),
             default=default,
             style=self._style
         ).ask()
@@ -181,7 +210,7 @@ class QuestionaryPrompts(PromptProvider):
     ) -> Optional[list[Any]]:
         return questionary.checkbox(
             message,
-            choices=list(choices),
+            choices=_as_list(choices),
             style=self._style
         ).ask()
 
@@ -215,11 +244,24 @@ class QuestionaryPrompts(PromptProvider):
     ) -> Optional[str]:
         return questionary.autocomplete(
             message,
-            choices=list(choices),
+            choices=_as_list(choices),
             default=default,
             style=self._style
         ).ask()
 
+    def form(self, questions: dict[str, dict[str, Any]]) -> dict[str, Any]:
+        fields = {}
+        for key, spec in questions.items():
+            spec = dict(spec)
+            kind = spec.pop('type')
+            if kind in ('select', 'autocomplete'):
+                spec['choices'] = list(spec['choices'])
+                spec.setdefault('style', self._style)
+            fields[key] = getattr(questionary, kind)(**spec)
+        # questionary returns an empty dict when the form is cancelled
+        answers = questionary.form(**fields).ask()
+        return {key: answers.get(key) for key in questions}
+
 
 class RichConsole(ConsoleProvider):
     """Production implementation using Rich console."""
@@ -259,20 +301,24 @@ class MockPrompts(PromptProvider):
         Args:
             responses: List of values to return for each prompt call
         """
-        self._responses = list(responses) if responses else []
+        self._responses: deque[Any] = deque(responses) if responses else deque()
         self._call_history: list[dict[str, Any]] = []
 
     def _next_response(self, call_info: dict[str, Any]) -> Any:
         """Record the call and return the next response."""
         self._call_history.append(call_info)
         if self._responses:
-            return self._responses.pop(0)
+            return self._responses.popleft()
         return None
 
     @property
-    def call_history(self) -> list[dict[str, Any]]:
-        """Access the history of all prompt calls made."""
-        return self._call_history
+    def call_history(self) -> tuple[dict[str, Any], ...]:
+        """Snapshot of all prompt calls made so far."""
+        return tuple(self._call_history)
+
+    def iter_call_history(self) -> Iterator[dict[str, Any]]:
+        """Iterate over prompt calls made so far without copying them."""
+        return iter(self._call_history)
 
     def select(
         self,
@@ -283,7 +329,7 @@ class MockPrompts(PromptProvider):
         return self._next_response({
             'type': 'select',
             'message': message,
-            'choices': list(choices),
+            'choices': _as_list(choices),
             'default': default
         })
 
@@ -295,7 +341,7 @@ class MockPrompts(PromptProvider):
         return self._next_response({
             'type': 'checkbox',
             'message': message,
-            'choices': list(choices)
+            'choices': _as_list(choices)
         })
 
     def text(
@@ -330,7 +376,7 @@ class MockPrompts(PromptProvider):
         return self._next_response({
             'type': 'autocomplete',
             'message': message,
-            'choices': list(choices),
+            'choices': _as_list(choices),
             'default': default
         })
 
@@ -348,14 +394,22 @@ class MockConsole(ConsoleProvider):
         self._status_messages: list[str] = []
 
     @property
-    def output(self) -> list[str]:
-        """Access all printed messages."""
-        return self._output
+    def output(self) -> tuple[str, ...]:
+        """Snapshot of all printed messages."""
+        return tuple(self._output)
+
+    def iter_output(self) -> Iterator[str]:
+        """Iterate over printed messages without copying them."""
+        return iter(self._output)
 
     @property
-    def status_messages(self) -> list[str]:
-        """Access all status messages shown."""
-        return self._status_messages
+    def status_messages(self) -> tuple[str, ...]:
+        """Snapshot of all status messages shown."""
+        return tuple(self._status_messages)
+
+    def iter_status_messages(self) -> Iterator[str]:
+        """Iterate over status messages shown without copying them."""
+        return iter(self._status_messages)
 
     def print(self, message: str, **kwargs: Any) -> None:
         self._output.append(message)
@@ -20,7 +20,7 @@ from rich.logging import RichHandler
 from .ui import console, print_banner
 from .interactive import interactive_mode
 from .commands import execute_args
-from ..modules.youtube import download_video
+from ..modules.youtube import download_videos
 from .. import __version__
 from ..utils.config import (
     DEFAULT_WHISPER_MODEL,
@@ -173,6 +173,12 @@ Devices:
         action="store_true",
         help="Burn subtitles into the exported video",
     )
+    proc_group.add_argument(
+        "--stream-copy", "-sc",
+        dest="stream_copy",
+        action="store_true",
+        help="Cut without re-encoding (much faster, but cuts snap to keyframes)",
+    )
 
     # Transcription
     trans_group = parser.add_argument_group("Transcription Options")
@@ -427,31 +433,36 @@ def main() -> None:
         parser.error("the following arguments are required: --input/-i (or --files-from/-F)")
     
     # Process inputs (handle URLs)
-    processed_inputs = []
-    for inp in args.inputfile:
-        if inp.lower().startswith("http://") or inp.lower().startswith("https://"):
-            try:
-                console.print(f"[cyan]Found URL in input: {inp}[/cyan]")
-                # Use a simple status spinner, yt-dlp is fast enough usually or we can rely on internal logs if things get stuck
-                # But to show progress we use a custom hook
-                with console.status(f"[bold cyan]Initializing download...[/bold cyan]") as status:
-                    def progress_hook(d):
-                        if d['status'] == 'downloading':
-                            p = d.get('_percent_str', '').strip()
-                            eta = d.get('_eta_str', '').strip()
-                            status.update(f"[bold cyan]Downloading... {p} (ETA: {eta})[/bold cyan]")
-                        elif d['status'] == 'finished':
-                            status.update("[bold green]Download complete! Processing...[/bold green]")
+    processed_inputs = list(args.inputfile)
+    url_positions = [
+        i for i, inp in enumerate(processed_inputs)
+        if inp.lower().startswith("http://") or inp.lower().startswith("https://")
+    ]
+    if url_positions:
+        urls = [processed_inputs[i] for i in url_positions]
+        for url in urls:
+            console.print(f"[cyan]Found URL in input: {url}[/cyan]")
+        try:
+            # Use a simple status spinner, yt-dlp is fast enough usually or we can rely on internal logs if things get stuck
+            # But to show progress we use a custom hook
+            with console.status(f"[bold cyan]Initializing download...[/bold cyan]") as status:
+                def progress_hook(d):
+                    if d['status'] == 'downloading':
+                        p = d.get('_percent_str', '').strip()
+                        eta = d.get('_eta_str', '').strip()
+                        status.update(f"[bold cyan]Downloading... {p} (ETA: {eta})[/bold cyan]")
+                    elif d['status'] == 'finished':
+                        status.update("[bold green]Download complete! Processing...[/bold green]")
 
-                    filename = download_video(inp, progress_hooks=[progress_hook], quiet=True)
-                    console.print(f"[green]✓ Downloaded:[/green] {filename}")
-                    processed_inputs.append(filename)
-            except Exception as e:
-                logger.error(f"Download failed: {e}")
-                console.print(f"[bold red]✗ Failed to download {inp}[/bold red]")
-                sys.exit(1)
-        else:
-            processed_inputs.append(inp)
+                # One yt-dlp session for every URL on the command line
+                filenames = download_videos(urls, progress_hooks=[progress_hook], quiet=True)
+        except Exception as e:
+            logger.error(f"Download failed: {e}")
+            console.print(f"[bold red]✗ Failed to download {', '.join(urls)}[/bold red]")
+            sys.exit(1)
+        for i, filename in zip(url_positions, filenames):
+            console.print(f"[green]✓ Downloaded:[/green] {filename}")
+            processed_inputs[i] = filename
             
     args.inputfile = processed_inputs
     
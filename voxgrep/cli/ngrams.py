@@ -6,24 +6,113 @@ calculation, selection, filtering, and search operations.
 """
 
 from argparse import Namespace
-from typing import Optional
+from typing import Any, Callable, Optional
 
 import questionary
 
-from .ui import console, print_session_summary
-from .io import CLIContext
+from .ui import console, print_ngrams_table, print_session_summary
+from .io import CLIContext, DEFAULT_STYLE
 from .config import SearchConfig, ExportConfig
 from .action_loop import (
     ActionLoop, ActionLoopState, ActionResult, Action, separator,
-    create_preview_handler, create_exit_handler, create_back_handler
+    BACK_HANDLER, EXIT_HANDLER, SETTINGS_HANDLER
 )
 
 from .workflows import get_output_filename, post_export_menu
 from .commands import calculate_ngrams, run_voxgrep_search
+from ..utils.config import DEFAULT_IGNORED_WORDS
+from ..utils.prefs import load_prefs, save_prefs
+
+
+# Menu values that are control options rather than n-grams
+_SENTINELS = frozenset({
+    "__DONE__", "__SWITCH_SINGLE__", "__SWITCH_MULTI__", "__EXIT__",
+    "__CONTINUE__", "__USE_EXISTING__", "__IGNORE_WORD__",
+})
+
+# Separators carry no per-menu state, so every choice list shares one
+_SEP = questionary.Separator()
+
+
+class IgnoredWords:
+    """
+    The user's ignored-words preference with case-insensitive lookup.
+
+    Words are stored lowercased; a set mirrors the list so membership
+    checks don't rescan it. The preferences dict is loaded once and
+    additions are kept in memory until flush(), so ignoring several words
+    in a row reads and writes the preferences file once.
+    """
+
+    def __init__(
+        self,
+        prefs: dict[str, Any],
+        saver: Callable[[dict[str, Any]], None] = save_prefs,
+    ):
+        self.prefs = prefs
+        self.words = list(prefs.get("ignored_words", DEFAULT_IGNORED_WORDS))
+        self._lowered = {w.lower() for w in self.words}
+        self._saver = saver
+        self._dirty = False
+
+    @classmethod
+    def load(cls, ctx: Optional[CLIContext] = None) -> "IgnoredWords":
+        """Load the ignored words through the context's preference functions."""
+        if ctx:
+            return cls(ctx.prefs_loader(), ctx.prefs_saver)
+        return cls(load_prefs())
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the user has ignored-word filtering switched on."""
+        return self.prefs.get("use_ignored_words", True)
+
+    def __contains__(self, word: str) -> bool:
+        return word.lower() in self._lowered
+
+    def add(self, word: str) -> bool:
+        """
+        Add a word; it is saved to preferences by the next flush().
+
+        Returns:
+            False if the word was already ignored
+        """
+        word = word.lower()
+        if word in self._lowered:
+            return False
+        self.words.append(word)
+        self._lowered.add(word)
+        self._dirty = True
+        return True
+
+    def flush(self) -> None:
+        """Save the ignored words to preferences if any were added."""
+        if not self._dirty:
+            return
+        self.prefs["ignored_words"] = self.words
+        self._saver(self.prefs)
+        self._dirty = False
+
+
+def prepare_ngram_choices(most_common: list[tuple[tuple, int]]) -> list[tuple[str, str]]:
+    """
+    Format n-grams once for the selection menus.
+
+    Args:
+        most_common: List of (ngram, count) tuples
+
+    Returns:
+        List of (value, label) pairs, e.g. ("good morning", "good morning (12x)")
+    """
+    prepared = []
+    for ngram, count in most_common:
+        val = " ".join(ngram)
+        prepared.append((val, f"{val} ({count}x)"))
+    return prepared
 
 
 def select_ngrams_single_mode(
-    most_common: list[tuple[tuple, int]],
+    ngram_choices: list[tuple[str, str]],
     selected_ngrams_set: set[str],
     ctx: Optional[CLIContext] = None,
 ) -> tuple[str | None, set[str], str | None]:
@@ -31,7 +120,7 @@ def select_ngrams_single_mode(
     Single-select mode for n-gram selection.
 
     Args:
-        most_common: List of (ngram, count) tuples
+        ngram_choices: (value, label) pairs from prepare_ngram_choices()
         selected_ngrams_set: Currently selected n-grams
         ctx: Optional CLI context for prompts
 
@@ -58,14 +147,12 @@ def select_ngrams_single_mode(
         value="__IGNORE_WORD__"
     ))
 
-    choices.append(questionary.Separator())
+    choices.append(_SEP)
 
-    for ngram, count in most_common:
-        val = " ".join(ngram)
-        label = f"{val} ({count}x)"
+    for val, label in ngram_choices:
         choices.append(questionary.Choice(label, value=val))
 
-    choices.append(questionary.Separator())
+    choices.append(_SEP)
     choices.append(questionary.Choice("  [Back to Main Menu]", value="__EXIT__"))
 
     con.print("\n[bold cyan]--- Select N-gram (Type to filter, Enter to select) ---[/bold cyan]")
@@ -76,7 +163,7 @@ def select_ngrams_single_mode(
         selection = questionary.select(
             "Select n-gram:",
             choices=choices,
-            style=questionary.Style([('highlighted', 'fg:cyan bold')]),
+            style=DEFAULT_STYLE,
             use_indicator=True
         ).ask()
 
@@ -97,7 +184,7 @@ def select_ngrams_single_mode(
 
 
 def select_ngrams_multi_mode(
-    most_common: list[tuple[tuple, int]],
+    ngram_choices: list[tuple[str, str]],
     selected_ngrams_set: set[str],
     ctx: Optional[CLIContext] = None,
 ) -> tuple[str | None, set[str], str | None]:
@@ -105,7 +192,7 @@ def select_ngrams_multi_mode(
     Multi-select mode for n-gram selection.
 
     Args:
-        most_common: List of (ngram, count) tuples
+        ngram_choices: (value, label) pairs from prepare_ngram_choices()
         selected_ngrams_set: Currently selected n-grams
         ctx: Optional CLI context for prompts
 
@@ -115,15 +202,12 @@ def select_ngrams_multi_mode(
     prompts = ctx.prompts if ctx else None
     con = ctx.console if ctx else console
 
-    checkbox_choices = []
-
-    for ngram, count in most_common:
-        val = " ".join(ngram)
-        label = f"{val} ({count}x)"
-        is_checked = val in selected_ngrams_set
-        checkbox_choices.append(questionary.Choice(label, value=val, checked=is_checked))
+    checkbox_choices = [
+        questionary.Choice(label, value=val, checked=val in selected_ngrams_set)
+        for val, label in ngram_choices
+    ]
 
-    checkbox_choices.append(questionary.Separator())
+    checkbox_choices.append(_SEP)
     checkbox_choices.append(questionary.Choice("  Done / Confirm Selection", value="__DONE__"))
     checkbox_choices.append(questionary.Choice("  [x] Switch back to Single Select", value="__SWITCH_SINGLE__"))
 
@@ -135,7 +219,7 @@ def select_ngrams_multi_mode(
         page_selection = questionary.checkbox(
             "Select n-grams:",
             choices=checkbox_choices,
-            style=questionary.Style([('highlighted', 'fg:cyan bold')])
+            style=DEFAULT_STYLE
         ).ask()
 
     if page_selection is None:
@@ -144,28 +228,26 @@ def select_ngrams_multi_mode(
     # Handle control options
     if "__SWITCH_SINGLE__" in page_selection:
         # Capture valid selections before switching
-        for val in page_selection:
-            if val and not val.startswith("__"):
-                selected_ngrams_set.add(val)
+        selected_ngrams_set.update(val for val in page_selection if val and val not in _SENTINELS)
         return "__SWITCH_SINGLE__", selected_ngrams_set, None
 
-    # Extract valid selections
-    new_set = set()
-    for val in page_selection:
-        if val and not val.startswith("__"):
-            new_set.add(val)
+    picked = [val for val in page_selection if val and val not in _SENTINELS]
 
-    if not new_set and "__DONE__" not in page_selection:
+    if not picked and "__DONE__" not in page_selection:
         # User hit enter without selecting anything
         con.print("[yellow]No n-grams selected.[/yellow]")
         return "__CONTINUE__", selected_ngrams_set, None
 
-    return "__DONE__", new_set, None
+    # The checkbox result is the complete selection; replace the set's contents
+    selected_ngrams_set.clear()
+    selected_ngrams_set.update(picked)
+    return "__DONE__", selected_ngrams_set, None
 
 
 def ngram_selection_phase(
     most_common: list[tuple[tuple, int]],
     ctx: Optional[CLIContext] = None,
+    ignored: Optional[IgnoredWords] = None,
 ) -> list[str] | tuple[str, str] | None:
     """
     Handle the interactive n-gram selection phase.
@@ -173,6 +255,7 @@ def ngram_selection_phase(
     Args:
         most_common: List of (ngram, count) tuples
         ctx: Optional CLI context for prompts
+        ignored: Ignored words to add to; loaded from preferences if omitted
 
     Returns:
         List of selected n-grams, tuple of ("__REFRESH__", word) if ignoring, or None if cancelled
@@ -188,15 +271,19 @@ def ngram_selection_phase(
 
     selected_ngrams_set: set[str] = set()
     mode = "single"
+    owns_ignored = False  # Whether we loaded `ignored` and must save it ourselves
+    # most_common doesn't change while selecting, so format the labels once
+    ngram_choices = prepare_ngram_choices(most_common)
+    vocabulary: list[str] | None = None  # Sorted unique words, built on first use
 
     while True:
         if mode == "single":
             action, selected_ngrams_set, word_to_ignore = select_ngrams_single_mode(
-                most_common, selected_ngrams_set, ctx
+                ngram_choices, selected_ngrams_set, ctx
             )
         else:
             action, selected_ngrams_set, word_to_ignore = select_ngrams_multi_mode(
-                most_common, selected_ngrams_set, ctx
+                ngram_choices, selected_ngrams_set, ctx
             )
 
         if action == "__EXIT__":
@@ -207,34 +294,28 @@ def ngram_selection_phase(
             mode = "single"
         elif action == "__IGNORE_WORD__":
             # Prompt user to type or select a word to ignore
-            from ..utils.prefs import load_prefs, save_prefs
-
-            # Build list of all unique words from n-grams
-            all_words = set()
-            for ngram, _ in most_common:
-                for word in ngram:
-                    all_words.add(word)
+            if vocabulary is None:
+                vocabulary = sorted({word for ngram, _ in most_common for word in ngram})
 
             if prompts:
                 word_to_ignore = prompts.autocomplete(
                     "Enter word to add to ignored list:",
-                    sorted(all_words)
+                    vocabulary
                 )
             else:
                 word_to_ignore = questionary.autocomplete(
                     "Enter word to add to ignored list:",
-                    choices=sorted(all_words),
-                    style=questionary.Style([('highlighted', 'fg:cyan bold')])
+                    choices=vocabulary,
+                    style=DEFAULT_STYLE
                 ).ask()
 
             if word_to_ignore:
-                # Add to preferences
-                prefs = load_prefs()
-                ignored_words = prefs.get("ignored_words", [])
-                if word_to_ignore.lower() not in [w.lower() for w in ignored_words]:
-                    ignored_words.append(word_to_ignore.lower())
-                    prefs["ignored_words"] = ignored_words
-                    save_prefs(prefs)
+                if ignored is None:
+                    ignored = IgnoredWords.load(ctx)
+                    owns_ignored = True
+                if ignored.add(word_to_ignore):
+                    if owns_ignored:
+                        ignored.flush()
                     con.print(f"[green]Added '{word_to_ignore}' to ignored words list.[/green]")
                     # Signal to refresh n-grams
                     return ("__REFRESH__", word_to_ignore)
@@ -268,16 +349,17 @@ def ngram_action_phase(
         ctx = CLIContext.default()
 
     # Create config objects from args
+    a = vars(args)
     search = SearchConfig(
         query=selected_ngrams,
         search_type="sentence",
         maxclips=0,
         padding=None,
         randomize=False,
-        exact_match=getattr(args, 'exact_match', False),
+        exact_match=a.get('exact_match', False),
         resync=0,
-        ignored_words=getattr(args, 'ignored_words', []),
-        use_ignored_words=getattr(args, 'use_ignored_words', True),
+        ignored_words=a.get('ignored_words', []),
+        use_ignored_words=a.get('use_ignored_words', True),
     )
 
     export = ExportConfig(
@@ -286,14 +368,14 @@ def ngram_action_phase(
         demo=False,
         export_clips=False,
         write_vtt=False,
-        burn_in_subtitles=getattr(args, 'burn_in_subtitles', False),
+        burn_in_subtitles=a.get('burn_in_subtitles', False),
     )
 
     # Show demo if requested
     show_demo = ctx.prompts.confirm("Show text results table (Demo Mode)?", default=True)
     if show_demo:
         result = run_voxgrep_search(
-            files=args.inputfile,
+            files=a['inputfile'],
             query=search.query,
             search_type=search.search_type,
             output=export.output,
@@ -315,7 +397,7 @@ def ngram_action_phase(
     state = ActionLoopState(
         search=search,
         export=export,
-        input_files=args.inputfile,
+        input_files=a['inputfile'],
         ctx=ctx,
     )
 
@@ -350,55 +432,15 @@ def ngram_action_phase(
 
         return ActionResult.CONTINUE
 
-    def settings_handler(s: ActionLoopState) -> ActionResult:
-        s.search.search_type = s.ctx.prompts.select(
-            "Search Type",
-            choices=["sentence", "fragment", "mash", "semantic"],
-            default=s.search.search_type,
-        ) or s.search.search_type
-
-        padding_str = s.ctx.prompts.text(
-            "Padding (seconds, e.g., 0.5):",
-            default=str(s.search.padding) if s.search.padding else "",
-        )
-        s.search.padding = float(padding_str) if padding_str else None
-
-        maxclips_str = s.ctx.prompts.text(
-            "Max clips (0 for all):",
-            default=str(s.search.maxclips),
-        )
-        s.search.maxclips = int(maxclips_str) if maxclips_str else 0
-
-        s.search.randomize = s.ctx.prompts.confirm(
-            "Randomize order?",
-            default=s.search.randomize,
-        ) or False
-
-        s.search.exact_match = s.ctx.prompts.confirm(
-            "Exact Match (Whole Words Only)?",
-            default=s.search.exact_match,
-        ) or False
-
-        s.export.burn_in_subtitles = s.ctx.prompts.confirm(
-            "Burn-in Subtitles in output?",
-            default=s.export.burn_in_subtitles,
-        ) or False
-
-        s.ctx.console.print(
-            f"[green]Settings updated. Search Type: {s.search.search_type}, "
-            f"Exact Match: {s.search.exact_match}, Burn-in: {s.export.burn_in_subtitles}[/green]"
-        )
-        return ActionResult.CONTINUE
-
     # Build actions
-    actions = [
+    actions = (
         Action("Preview Results (MPV)", "preview", preview_handler),
         Action("Export Supercut", "export", export_handler),
-        Action("Settings (Search Type, Padding, etc.)", "settings", settings_handler),
-        Action("Edit Selection (Add/Remove N-grams)", "edit_selection", create_back_handler()),
-        Action("Start Over (New Search)", "start_over", create_exit_handler()),
-        Action("Cancel / Back", "cancel", create_exit_handler()),
-    ]
+        Action("Settings (Search Type, Padding, etc.)", "settings", SETTINGS_HANDLER),
+        Action("Edit Selection (Add/Remove N-grams)", "edit_selection", BACK_HANDLER),
+        Action("Start Over (New Search)", "start_over", EXIT_HANDLER),
+        Action("Cancel / Back", "cancel", EXIT_HANDLER),
+    )
 
     # Create and run action loop
     title = f"Action Menu ({' + '.join(selected_ngrams)})"
@@ -433,34 +475,38 @@ def interactive_ngrams_workflow(
     if not most_common:
         return
 
-    from .ui import print_ngrams_table
     print_ngrams_table(most_common, filtered, args.ngrams)
 
-    # Selection and action loop
-    while True:
-        selected_ngrams = ngram_selection_phase(most_common, ctx)
-
-        if not selected_ngrams:
-            return  # User cancelled or no selection
-
-        # Check if user wants to refresh (added word to ignore list)
-        if isinstance(selected_ngrams, tuple) and selected_ngrams[0] == "__REFRESH__":
-            con.print("\n[cyan]Recalculating n-grams with updated filter...[/cyan]")
-            # Recalculate with updated ignored words
-            most_common, filtered = calculate_ngrams(
-                args.inputfile,
-                args.ngrams,
-                None,  # Load from prefs
-                True   # Use filter
-            )
-            if not most_common:
-                con.print("[yellow]No n-grams remaining after filtering.[/yellow]")
-                return
-            print_ngrams_table(most_common, filtered, args.ngrams)
-            continue  # Go back to selection
-
-        # Enter action phase
-        back_to_selection = ngram_action_phase(args, selected_ngrams, ctx)
-
-        if not back_to_selection:
-            return  # User wants to exit or start over
+    ignored = IgnoredWords.load(ctx)
+
+    # Selection and action loop; words ignored along the way are saved on exit
+    try:
+        while True:
+            selected_ngrams = ngram_selection_phase(most_common, ctx, ignored)
+
+            if not selected_ngrams:
+                return  # User cancelled or no selection
+
+            # Check if user wants to refresh (added word to ignore list)
+            if isinstance(selected_ngrams, tuple) and selected_ngrams[0] == "__REFRESH__":
+                con.print("\n[cyan]Recalculating n-grams with updated filter...[/cyan]")
+                # Recalculate with updated ignored words
+                most_common, filtered = calculate_ngrams(
+                    args.inputfile,
+                    args.ngrams,
+                    ignored.words,  # Includes words not yet saved
+                    ignored.enabled
+                )
+                if not most_common:
+                    con.print("[yellow]No n-grams remaining after filtering.[/yellow]")
+                    return
+                print_ngrams_table(most_common, filtered, args.ngrams)
+                continue  # Go back to selection
+
+            # Enter action phase
+            back_to_selection = ngram_action_phase(args, selected_ngrams, ctx)
+
+            if not back_to_selection:
+                return  # User wants to exit or start over
+    finally:
+        ignored.flush()
@@ -12,7 +12,7 @@ import questionary
 
 from .config import SessionConfig, SearchConfig, ExportConfig
 from .io import CLIContext
-from .action_loop import ActionLoop, ActionLoopState, ActionResult, build_search_actions
+from .action_loop import ActionLoop, ActionLoopState, ActionResult, build_search_actions, search_action_labels
 
 
 class WizardPhase(Enum):
@@ -251,7 +251,9 @@ class InteractiveWizard:
         if not search_input:
             return True
 
-        self.session.search.query = [s.strip() for s in search_input.split(',') if s.strip()]
+        from .interactive import parse_search_terms
+
+        self.session.search.query = parse_search_terms(search_input)
 
         # Select search type
         search_type = self.ctx.prompts.select(
@@ -278,34 +280,21 @@ class InteractiveWizard:
         from .workflows import get_output_filename, post_export_menu
         from .commands import run_voxgrep_search
         from .ui import print_session_summary
-
-        def get_default_output_name() -> str:
-            """Get a safe default output name from search terms."""
-            default_out = "supercut"
-            if self.session and self.session.search.query:
-                safe_term = "".join([
-                    c if c.isalnum() or c in (' ', '-', '_') else ''
-                    for c in self.session.search.query[0]
-                ]).strip().replace(' ', '_')
-                if safe_term:
-                    default_out = safe_term
-            return default_out
+        from .interactive import get_default_output_name
 
         while True:
-            default_out = get_default_output_name()
-            padding_display = self.session.search.padding or 0
-            max_display = self.session.search.maxclips or "All"
+            default_out = get_default_output_name(self.session.search.query)
+            export_label, settings_label = search_action_labels(
+                self.session.search.padding, self.session.search.maxclips, default_out
+            )
 
             action = self.ctx.prompts.select(
                 "Next Step:",
                 choices=[
                     questionary.Choice("Preview Results (MPV)", value="preview"),
-                    questionary.Choice(f"Export Supercut (to {default_out}.mp4...)", value="export"),
+                    questionary.Choice(export_label, value="export"),
                     questionary.Separator(),
-                    questionary.Choice(
-                        f"Settings (Padding: {padding_display}s, Max: {max_display})",
-                        value="settings"
-                    ),
+                    questionary.Choice(settings_label, value="settings"),
                     questionary.Choice("Start Over (New Search)", value="cancel"),
                 ],
                 default="preview",
@@ -9,6 +9,7 @@ injection, enabling testability without actual user interaction.
 """
 
 import os
+import re
 import glob
 from typing import Any, Optional, TYPE_CHECKING
 from argparse import Namespace
@@ -25,6 +26,9 @@ from ..core.engine import find_transcript
 if TYPE_CHECKING:
     from .io import CLIContext
 
+# Output filenames keep only word characters, spaces, hyphens and plus signs
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^\w \-+]")
+
 
 def check_ytdlp_available() -> bool:
     """Check if yt-dlp is available in the system."""
@@ -583,50 +587,57 @@ def search_settings_menu(
             "Padding (seconds):",
             default=str(args.padding or 0),
             validate=_validate_padding
-        ) or "0"
+        )
     else:
         padding_str = questionary.text(
             "Padding (seconds):",
             default=str(args.padding or 0),
             validate=_validate_padding
         ).ask()
-    args.padding = float(padding_str) if padding_str else 0
+    # A cancelled prompt answers None; keep the previous value in that case
+    if padding_str is not None:
+        args.padding = float(padding_str) if padding_str else 0
 
     if prompts:
         maxclips_str = prompts.text(
             "Max Clips (0 for all):",
             default=str(args.maxclips),
             validate=_validate_maxclips
-        ) or "0"
+        )
     else:
         maxclips_str = questionary.text(
             "Max Clips (0 for all):",
             default=str(args.maxclips),
             validate=_validate_maxclips
         ).ask()
-    args.maxclips = int(maxclips_str) if maxclips_str else 0
+    if maxclips_str is not None:
+        args.maxclips = int(maxclips_str) if maxclips_str else 0
 
     if prompts:
-        args.randomize = prompts.confirm(
+        randomize = prompts.confirm(
             "Randomize clip order?",
             default=args.randomize
-        ) or False
+        )
     else:
-        args.randomize = questionary.confirm(
+        randomize = questionary.confirm(
             "Randomize clip order?",
             default=args.randomize
         ).ask()
+    if randomize is not None:
+        args.randomize = randomize
 
     if prompts:
-        args.burn_in_subtitles = prompts.confirm(
+        burn_in = prompts.confirm(
             "Burn-in Subtitles in output supercut?",
             default=getattr(args, 'burn_in_subtitles', False)
-        ) or False
+        )
     else:
-        args.burn_in_subtitles = questionary.confirm(
+        burn_in = questionary.confirm(
             "Burn-in Subtitles in output supercut?",
             default=getattr(args, 'burn_in_subtitles', False)
         ).ask()
+    if burn_in is not None:
+        args.burn_in_subtitles = burn_in
 
 
 def get_output_filename(
@@ -654,10 +665,7 @@ def get_output_filename(
         # Join all search terms with '+'
         combined_terms = "+".join(search_terms)
         # Sanitize: keep only alphanumeric, spaces, hyphens, underscores, and plus signs
-        safe_term = "".join([
-            c if c.isalnum() or c in (' ', '-', '_', '+') else ''
-            for c in combined_terms
-        ]).strip().replace(' ', '+')
+        safe_term = _UNSAFE_FILENAME_CHARS_RE.sub('', combined_terms).strip().replace(' ', '+')
 
         # Truncate if too long
         if safe_term and len(safe_term) > MAX_FILENAME_LENGTH:
@@ -1,14 +1,33 @@
 import os
 import re
 import json
+import hashlib
+import atexit
 import random
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from operator import itemgetter
 from pathlib import Path
 from typing import Iterator, Any
 from tqdm import tqdm
 
 import numpy as np
 try:
-    from sentence_transformers import SentenceTransformer, util
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    from sentence_transformers import SentenceTransformer
     import torch
     SEMANTIC_AVAILABLE = True
 except ImportError:
@@ -20,7 +39,10 @@ from ..formats import vtt, srt, sphinx
 from ..utils.config import (
     SUBTITLE_EXTENSIONS,
     DEFAULT_SEMANTIC_MODEL,
-    DEFAULT_SEMANTIC_THRESHOLD
+    DEFAULT_SEMANTIC_THRESHOLD,
+    get_semantic_batch_size,
+    get_semantic_backend,
+    get_cache_dir,
 )
 from ..utils.helpers import setup_logger, ensure_list
 from ..utils.exceptions import (
@@ -34,11 +56,22 @@ logger = setup_logger(__name__)
 # Legacy constant for backwards compatibility
 SUB_EXTS = SUBTITLE_EXTENSIONS
 
+# Runs of word characters, i.e. the spans a \b...\b pattern can match exactly
+WORD_TOKEN_RE = re.compile(r"\w+")
+# Separators for transcripts without word timings: these punctuation marks become
+# spaces, then the line is split on whitespace
+_NGRAM_SPLIT_TABLE = str.maketrans({c: " " for c in ".?!,:\""})
+# Punctuation stripped from words before mash matching
+_PUNCT_TABLE = str.maketrans("", "", ".?!,:\"")
+# Below this many sentences, starting work in a multi-GPU pool costs more than it saves
+MULTI_PROCESS_MIN_SENTENCES = 10000
+
 
 class SemanticModel:
     """Singleton class for managing the semantic search model."""
     _instance = None
     _device = None
+    _pool = None
 
     @classmethod
     def get_instance(cls, model_name: str | None = None):
@@ -52,53 +85,93 @@ class SemanticModel:
 
             model_name = model_name or DEFAULT_SEMANTIC_MODEL
 
-            # Device detection for acceleration
-            if torch.cuda.is_available():
+            # Device detection for acceleration; VOXGREP_SEMANTIC_DEVICE forces one
+            if os.getenv("VOXGREP_SEMANTIC_DEVICE"):
+                cls._device = os.getenv("VOXGREP_SEMANTIC_DEVICE")
+            elif torch.cuda.is_available():
                 cls._device = "cuda"
             elif hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
                 cls._device = "mps"
             else:
                 cls._device = "cpu"
 
-            logger.info(f"Loading semantic model: {model_name} on {cls._device}")
-            cls._instance = SentenceTransformer(model_name, device=cls._device)
+            # ONNX Runtime / OpenVINO need sentence-transformers' optional extras
+            backend = get_semantic_backend()
+            backend_kwargs = {}
+            if backend != "torch":
+                backend_kwargs["backend"] = backend
+                if backend == "onnx" and cls._device == "cuda":
+                    backend_kwargs["model_kwargs"] = {"provider": "CUDAExecutionProvider"}
+
+            logger.info(f"Loading semantic model: {model_name} on {cls._device} ({backend})")
+            cls._instance = SentenceTransformer(model_name, device=cls._device, **backend_kwargs)
 
         return cls._instance
 
+    @classmethod
+    def get_pool(cls) -> dict | None:
+        """
+        Get a multi-process encode pool spanning every CUDA device.
+
+        Returns None on hosts with fewer than two GPUs, where a single
+        process already uses the device (or all CPU cores) fully. The pool
+        is started on first use and stopped at interpreter exit.
+        """
+        if cls._pool is None:
+            model = cls.get_instance()
+            if cls._device != "cuda" or torch.cuda.device_count() < 2:
+                return None
+            devices = [f"cuda:{i}" for i in range(torch.cuda.device_count())]
+            logger.info(f"Starting semantic encode pool on {', '.join(devices)}")
+            cls._pool = model.start_multi_process_pool(target_devices=devices)
+            atexit.register(model.stop_multi_process_pool, cls._pool)
+        return cls._pool
+
 
 class TranscriptCache:
-    """Singleton for caching parsed transcripts to avoid redundant I/O."""
-    _cache: dict[str, list[dict]] = {}
-    _files_mtime: dict[str, float] = {}
+    """
+    Singleton for caching parsed transcripts to avoid redundant I/O.
+
+    Entries are keyed by transcript path and dropped when the file's mtime
+    changes. The least recently used entry is evicted beyond MAXSIZE files.
+    Access is locked because transcripts are parsed from a thread pool.
+    """
+    MAXSIZE = 4096
+    _cache: OrderedDict[str, tuple[float, list[dict]]] = OrderedDict()
+    _lock = threading.Lock()
 
     @classmethod
     def get(cls, subfile: str) -> list[dict] | None:
         """Get transcript from cache if available and file hasn't changed."""
-        if not os.path.exists(subfile):
-            return None
-
         try:
             mtime = os.path.getmtime(subfile)
-            if subfile in cls._cache and cls._files_mtime.get(subfile) == mtime:
-                return cls._cache[subfile]
         except OSError:
-            pass
-        return None
+            return None
+        with cls._lock:
+            entry = cls._cache.get(subfile)
+            if entry is None or entry[0] != mtime:
+                return None
+            cls._cache.move_to_end(subfile)
+            return entry[1]
 
     @classmethod
     def set(cls, subfile: str, transcript: list[dict]):
         """Cache the transcript and its modification time."""
         try:
-            cls._cache[subfile] = transcript
-            cls._files_mtime[subfile] = os.path.getmtime(subfile)
+            mtime = os.path.getmtime(subfile)
         except OSError:
-            pass
+            return
+        with cls._lock:
+            cls._cache[subfile] = (mtime, transcript)
+            cls._cache.move_to_end(subfile)
+            if len(cls._cache) > cls.MAXSIZE:
+                cls._cache.popitem(last=False)
 
     @classmethod
     def clear(cls):
         """Clear the cache."""
-        cls._cache.clear()
-        cls._files_mtime.clear()
+        with cls._lock:
+            cls._cache.clear()
 
 
 def find_transcript(videoname: str, prefer: str | None = None) -> str | None:
@@ -132,28 +205,42 @@ def find_transcript(videoname: str, prefer: str | None = None) -> str | None:
         if candidate.exists():
             return candidate.as_posix()
 
-    # Pre-list files once for efficiency
+    # Pre-list file names once; scandir entries know their type without a stat per file
     try:
-        all_files = list(parent.iterdir())
+        with os.scandir(parent) as entries:
+            file_names = [entry.name for entry in entries if entry.is_file()]
     except OSError:
         return None
 
     # Strategy 2: Fuzzy match for filenames with language codes (video.en.srt)
+    # First file per extension among those starting with the video's name
+    prefixed_by_ext: dict[str, str] = {}
+    for name in file_names:
+        if name.startswith(name_stem):
+            prefixed_by_ext.setdefault(os.path.splitext(name)[1], name)
     for ext in _sub_exts:
-        for f in all_files:
-            if f.is_file() and f.name.startswith(name_stem) and f.suffix == ext:
-                return f.as_posix()
+        if ext in prefixed_by_ext:
+            return (parent / prefixed_by_ext[ext]).as_posix()
 
     # Strategy 3: Legacy regex-based fallback for complex multi-part extensions
     for ext in _sub_exts:
-        pattern = re.escape(name_stem) + r".*?\.?" + ext.replace(".", "")
-        for f in all_files:
-            if f.is_file() and re.search(pattern, f.name):
-                return f.as_posix()
+        pattern = re.compile(re.escape(name_stem) + r".*?\.?" + ext.replace(".", ""))
+        for name in file_names:
+            if pattern.search(name):
+                return (parent / name).as_posix()
 
     return None
 
 
+def _load_json_transcript(subfile: str) -> list[dict]:
+    """Load a JSON transcript, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        with open(subfile, "rb") as infile:
+            return orjson.loads(infile.read())
+    with open(subfile, "r", encoding="utf8") as infile:
+        return json.load(infile)
+
+
 def parse_transcript(
     videoname: str, prefer: str | None = None
 ) -> list[dict] | None:
@@ -182,15 +269,16 @@ def parse_transcript(
     transcript = None
 
     try:
-        with open(subfile, "r", encoding="utf8") as infile:
-            if subfile.endswith(".srt"):
-                transcript = srt.parse(infile)
-            elif subfile.endswith(".vtt"):
-                transcript = vtt.parse(infile)
-            elif subfile.endswith(".json"):
-                transcript = json.load(infile)
-            elif subfile.endswith(".transcript"):
-                transcript = sphinx.parse(infile)
+        if subfile.endswith(".json"):
+            transcript = _load_json_transcript(subfile)
+        else:
+            with open(subfile, "r", encoding="utf8") as infile:
+                if subfile.endswith(".srt"):
+                    transcript = srt.parse(infile)
+                elif subfile.endswith(".vtt"):
+                    transcript = vtt.parse(infile)
+                elif subfile.endswith(".transcript"):
+                    transcript = sphinx.parse(infile)
     except (json.JSONDecodeError, UnicodeDecodeError, ValueError, IndexError) as e:
         logger.error(f"Error parsing transcript file {subfile}: {e}")
         return None
@@ -206,20 +294,189 @@ def get_embeddings_path(videoname: str) -> str:
     return os.path.splitext(videoname)[0] + ".embeddings.npy"
 
 
-def get_embeddings(videoname: str, transcript: list[dict], force: bool = False) -> np.ndarray:
+def load_cached_embeddings(videoname: str) -> np.ndarray | None:
     """
-    Get or generate semantic embeddings for a transcript.
+    Load the cached embeddings for a video, or None if there are none.
+
+    Caches are stored as float16; older float32 caches load unchanged.
+    Scoring upcasts either to float32. The array is memory-mapped
+    read-only, so pages are read from disk only when scoring touches them.
     """
     emb_path = get_embeddings_path(videoname)
-    if os.path.exists(emb_path) and not force:
-        return np.load(emb_path)
+    if not os.path.exists(emb_path):
+        return None
+    return np.load(emb_path, mmap_mode="r")
+
+
+def get_segments_path(videoname: str) -> Path:
+    """
+    Get the path of the segment list cached for a video's embeddings.
+
+    It lives in the cache directory rather than next to the video, where a
+    .json file would be taken for the video's transcript.
+    """
+    digest = hashlib.sha1(os.path.abspath(videoname).encode("utf-8")).hexdigest()
+    return get_cache_dir() / "semantic_segments" / f"{digest}.json"
+
+
+def _transcript_key(videoname: str, prefer: str | None = None) -> tuple[str, float] | None:
+    """The resolved transcript path and its mtime, or None if there is no transcript."""
+    subfile = find_transcript(videoname, prefer)
+    if subfile is None:
+        return None
+    try:
+        return os.path.abspath(subfile), os.path.getmtime(subfile)
+    except OSError:
+        return None
+
+
+def save_cached_segments(videoname: str, transcript: list[dict], prefer: str | None = None) -> None:
+    """
+    Cache the start, end and content of each line, one per embedding row.
+
+    The record names the transcript it came from and that file's mtime, so it
+    and the embeddings are only reused while that transcript is unchanged.
+    """
+    key = _transcript_key(videoname, prefer)
+    if key is None:
+        return
+    record = {
+        "transcript": key[0],
+        "mtime": key[1],
+        "segments": [
+            {"start": line["start"], "end": line["end"], "content": line["content"]}
+            for line in transcript
+        ],
+    }
+    seg_path = get_segments_path(videoname)
+    seg_path.parent.mkdir(parents=True, exist_ok=True)
+    if ORJSON_AVAILABLE:
+        with open(seg_path, "wb") as outfile:
+            outfile.write(orjson.dumps(record))
+    else:
+        with open(seg_path, "w", encoding="utf8") as outfile:
+            json.dump(record, outfile, ensure_ascii=False)
+
+
+def load_cached_segments(videoname: str, prefer: str | None = None) -> list[dict] | None:
+    """
+    Load a video's cached segment list.
+
+    Returns None if it is missing or unreadable, or if the transcript it was
+    built from is no longer the one resolved for the video or has changed.
+    """
+    seg_path = get_segments_path(videoname)
+    if not seg_path.exists():
+        return None
+    key = _transcript_key(videoname, prefer)
+    if key is None:
+        return None
+    try:
+        record = _load_json_transcript(str(seg_path))
+    except (ValueError, OSError) as e:
+        logger.debug(f"Ignoring unreadable segment cache {seg_path}: {e}")
+        return None
+    if not isinstance(record, dict) or (record.get("transcript"), record.get("mtime")) != key:
+        return None
+    return record.get("segments")
+
+
+def compute_embeddings_bulk(
+    pending: list[tuple[str, list[dict]]], prefer: str | None = None
+) -> list[np.ndarray]:
+    """
+    Generate and cache embeddings for several transcripts in one encode call.
+
+    Sentences from every transcript are encoded as a single batch, then
+    split back per video and saved to each video's cache file as float16,
+    and a segment list is cached that lets later searches skip the transcript.
+
+    Args:
+        pending: (videoname, transcript) pairs to embed
+        prefer: Subtitle format the transcripts were parsed with
+
+    Returns:
+        The embeddings for each pair, in the same order
+    """
+    if not pending:
+        return []
 
     model = SemanticModel.get_instance()
-    sentences = [line["content"] for line in transcript]
-    logger.info(f"Generating embeddings for {videoname}...")
-    embeddings = model.encode(sentences, show_progress_bar=False)
-    np.save(emb_path, embeddings)
-    return embeddings
+    sentences = [line["content"] for _, transcript in pending for line in transcript]
+    logger.info(f"Generating embeddings for {len(pending)} file(s)...")
+    pool = SemanticModel.get_pool() if len(sentences) >= MULTI_PROCESS_MIN_SENTENCES else None
+    if pool is not None:
+        # Shard the batch across every GPU. Each worker only length-sorts its
+        # own chunk, so sort globally first to keep padding low in every batch.
+        order = np.argsort([len(sentence) for sentence in sentences], kind="stable")
+        sorted_embeddings = model.encode_multi_process(
+            [sentences[i] for i in order], pool, batch_size=get_semantic_batch_size(), chunk_size=1000
+        )
+        embeddings = np.empty_like(sorted_embeddings)
+        embeddings[order] = sorted_embeddings
+    else:
+        # encode() length-sorts the whole flat list itself
+        embeddings = model.encode(
+            sentences,
+            batch_size=get_semantic_batch_size(),
+            convert_to_numpy=True,
+            show_progress_bar=len(pending) > 1,
+        )
+
+    results = []
+    offset = 0
+    for videoname, transcript in pending:
+        file_embeddings = embeddings[offset:offset + len(transcript)]
+        offset += len(transcript)
+        # Half precision halves the cache size with negligible cosine drift
+        np.save(get_embeddings_path(videoname), file_embeddings.astype(np.float16))
+        save_cached_segments(videoname, transcript, prefer)
+        results.append(file_embeddings)
+    return results
+
+
+def get_embeddings(videoname: str, transcript: list[dict], force: bool = False) -> np.ndarray:
+    """
+    Get or generate semantic embeddings for a transcript.
+    """
+    if not force:
+        cached = load_cached_embeddings(videoname)
+        if cached is not None:
+            return cached
+    return compute_embeddings_bulk([(videoname, transcript)])[0]
+
+
+_get_word = itemgetter("word")
+
+
+def _transcript_words(file: str) -> tuple[str, ...] | None:
+    """A transcript's words in order, reused until the transcript file changes."""
+    subfile = find_transcript(file)
+    try:
+        mtime = os.path.getmtime(subfile) if subfile else None
+    except OSError:
+        mtime = None
+    if mtime is None:
+        # Let parse_transcript report the missing or unreadable transcript
+        return _words_from(parse_transcript(file))
+    return _cached_transcript_words(file, subfile, mtime)
+
+
+@lru_cache(maxsize=32)
+def _cached_transcript_words(file: str, subfile: str, mtime: float) -> tuple[str, ...] | None:
+    return _words_from(parse_transcript(file))
+
+
+def _words_from(transcript: list[dict] | None) -> tuple[str, ...] | None:
+    if transcript is None:
+        return None
+    words = []
+    for line in transcript:
+        if "words" in line:
+            words.extend(map(_get_word, line["words"]))
+        else:
+            words.extend(line["content"].translate(_NGRAM_SPLIT_TABLE).split())
+    return tuple(words)
 
 
 def get_ngrams(files: str | list[str], n: int = 1, ignored_words: list[str] | None = None) -> Iterator[tuple]:
@@ -230,14 +487,9 @@ def get_ngrams(files: str | list[str], n: int = 1, ignored_words: list[str] | No
     words = []
 
     for file in files:
-        transcript = parse_transcript(file)
-        if transcript is None:
-            continue
-        for line in transcript:
-            if "words" in line:
-                words += [w["word"] for w in line["words"]]
-            else:
-                words += re.split(r"[.?!,:\"]+\s*|\s+", line["content"])
+        file_words = _transcript_words(file)
+        if file_words is not None:
+            words.extend(file_words)
 
     ngrams = zip(*[words[i:] for i in range(n)])
 
@@ -251,10 +503,36 @@ def get_ngrams(files: str | list[str], n: int = 1, ignored_words: list[str] | No
         yield from ngrams
 
 
+def _parse_transcripts(
+    files: list[str],
+    prefer: str | None,
+    desc: str,
+    max_workers: int = 8,
+) -> Iterator[tuple[str, list[dict] | None]]:
+    """
+    Parse transcripts on a thread pool, yielding (file, transcript) in input order.
+
+    Threads rather than processes keep results in the shared TranscriptCache
+    and avoid pickling parsed transcripts back to the caller; reads from
+    network storage overlap while one transcript is being searched.
+    """
+    parse = partial(parse_transcript, prefer=prefer)
+    if len(files) < 2:
+        yield from zip(files, map(parse, files))
+        return
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(files))) as executor:
+        yield from tqdm(zip(files, executor.map(parse, files)), desc=desc, unit="file", total=len(files))
+
+
 # =============================================================================
 # Search Strategy Implementations
 # =============================================================================
 
+def normalize_word(word: str) -> str:
+    """Lowercase a word and strip the punctuation that mash matching ignores."""
+    return word.lower().translate(_PUNCT_TABLE)
+
+
 def _search_mash(
     files: list[str],
     query: list[str],
@@ -268,8 +546,7 @@ def _search_mash(
     """
     all_words = []
 
-    for file in tqdm(files, desc="Indexing words for mash", unit="file", disable=len(files) < 2):
-        transcript = parse_transcript(file, prefer=prefer)
+    for file, transcript in _parse_transcripts(files, prefer, desc="Indexing words for mash"):
         if not transcript:
             continue
 
@@ -281,11 +558,16 @@ def _search_mash(
         logger.error("Could not extract any words from the provided files.")
         return []
 
+    # Index words by their normalized form so each query word is one lookup
+    word_index = defaultdict(list)
+    for w in all_words:
+        word_index[normalize_word(w["word"])].append(w)
+
     segments = []
     for _query in query:
         queries = _query.split(" ")
         for q in queries:
-            matches = [w for w in all_words if re.sub(r"[.?!,:\"]+", "", w["word"].lower()) == q.lower()]
+            matches = word_index.get(q.lower())
             if not matches:
                 continue
             word = random.choice(matches)
@@ -299,6 +581,22 @@ def _search_mash(
     return segments
 
 
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length so dot products are cosine similarities."""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-8)
+
+
+@lru_cache(maxsize=1024)
+def _encode_query_cached(model, query: tuple[str, ...]) -> np.ndarray:
+    """Encode search queries, reusing the result when the same queries repeat."""
+    embeddings = model.encode(list(query), convert_to_numpy=True, show_progress_bar=False)
+    # Shared between callers, so keep it from being modified in place
+    embeddings.setflags(write=False)
+    return embeddings
+
+
 def _search_semantic(
     files: list[str],
     query: list[str],
@@ -316,21 +614,48 @@ def _search_semantic(
         raise SemanticSearchNotAvailableError("Semantic search requires sentence-transformers.")
 
     model = SemanticModel.get_instance()
-    query_embeddings = model.encode(query, show_progress_bar=False)
+    query_embeddings = _encode_query_cached(model, tuple(query))
 
     # Batch processing: Collect all embeddings from all files
-    total_embeddings = []
-    embedding_metadata = []  # (file, segment)
-
-    for file in tqdm(files, desc="Loading embeddings", unit="file", disable=len(files) < 2):
-        transcript = parse_transcript(file, prefer=prefer)
+    per_file = [None] * len(files)  # (embeddings, segments) for each file
+    misses = []  # Positions of files whose transcript has to be parsed
+
+    # Warm files: cached embeddings whose segment list still matches the
+    # transcript (same resolved file and mtime), no transcript parse
+    for i, file in enumerate(files):
+        if not force_reindex:
+            embeddings = load_cached_embeddings(file)
+            if embeddings is not None:
+                segments = load_cached_segments(file, prefer)
+                if segments is not None and len(segments) == len(embeddings):
+                    per_file[i] = (embeddings, segments)
+                    continue
+        misses.append(i)
+
+    # Everything else is parsed and re-encoded: without a matching segment
+    # list, cached embeddings can't be trusted to belong to this transcript
+    pending = []  # (file, transcript) pairs to encode
+    pending_slots = []  # Position of each pending file in per_file
+    miss_files = [files[i] for i in misses]
+    for i, (file, transcript) in zip(misses, _parse_transcripts(miss_files, prefer, desc="Loading embeddings")):
         if not transcript:
             continue
+        pending_slots.append(i)
+        pending.append((file, transcript))
+        per_file[i] = (None, transcript)
+
+    # Encode every uncached file in one batch
+    for slot, embeddings in zip(pending_slots, compute_embeddings_bulk(pending, prefer)):
+        per_file[slot] = (embeddings, per_file[slot][1])
 
-        embeddings = get_embeddings(file, transcript, force=force_reindex)
+    total_embeddings = []
+    embedding_metadata = []  # (file, segment)
+    for file, entry in zip(files, per_file):
+        if entry is None:
+            continue
+        embeddings, segments = entry
         total_embeddings.append(embeddings)
-        for j in range(len(transcript)):
-            embedding_metadata.append((file, transcript[j]))
+        embedding_metadata.extend((file, segment) for segment in segments)
 
     if not total_embeddings or len(query_embeddings) == 0:
         return []
@@ -343,27 +668,60 @@ def _search_semantic(
         logger.error("Query embeddings have invalid shape. Check your search terms.")
         return []
 
-    # Compute all scores at once (matrix multiplication)
-    cos_scores = util.cos_sim(query_embeddings, combined_embeddings)
+    # Cosine similarity for every query/segment pair in one matrix multiplication
+    cos_scores = _normalize_rows(query_embeddings) @ _normalize_rows(combined_embeddings).T
 
     segments = []
-    for i, _query in enumerate(query):
-        scores = cos_scores[i]
-        # Use argwhere or similar for fast thresholding
-        indices = np.where(scores >= threshold)[0]
-        for idx in indices:
-            file_path, segment = embedding_metadata[idx]
-            segments.append({
-                "file": file_path,
-                "start": segment["start"],
-                "end": segment["end"],
-                "content": segment["content"],
-                "score": float(scores[idx])
-            })
+    for i, idx in np.argwhere(cos_scores >= threshold):
+        file_path, segment = embedding_metadata[idx]
+        segments.append({
+            "file": file_path,
+            "start": segment["start"],
+            "end": segment["end"],
+            "content": segment["content"],
+            "score": float(cos_scores[i, idx])
+        })
 
     return sorted(segments, key=lambda k: k["score"], reverse=True)
 
 
+def _compile_hyperscan(compiled_queries: list[tuple[str, re.Pattern]]):
+    """
+    Compile every query pattern into one Hyperscan database.
+
+    Returns None when hyperscan isn't installed or a pattern uses syntax it
+    doesn't support; callers then fall back to the compiled re patterns.
+    """
+    if not HYPERSCAN_AVAILABLE or not compiled_queries:
+        return None
+    flags = (
+        hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8
+        | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH
+    )
+    db = hyperscan.Database()
+    try:
+        db.compile(
+            expressions=[regex.pattern.encode("utf-8") for _, regex in compiled_queries],
+            ids=list(range(len(compiled_queries))),
+            flags=[flags] * len(compiled_queries),
+        )
+    except Exception as e:
+        logger.debug(f"Hyperscan could not compile the queries, using re: {e}")
+        return None
+    return db
+
+
+def _hyperscan_matches(db, content: str) -> set[int]:
+    """Indices of the queries matching content, from a single scan."""
+    matched = set()
+
+    def on_match(query_id, start, end, flags, context):
+        matched.add(query_id)
+
+    db.scan(content.encode("utf-8"), match_event_handler=on_match)
+    return matched
+
+
 def _search_sentence(
     files: list[str],
     query: list[str],
@@ -377,29 +735,70 @@ def _search_sentence(
     anywhere in the sentence content.
     """
     segments = []
+    # Matches all queries against a line in one pass when hyperscan is installed
+    hs_db = _compile_hyperscan(compiled_queries)
 
-    for file in tqdm(files, desc="Searching files", unit="file", disable=len(files) < 2):
-        transcript = parse_transcript(file, prefer=prefer)
+    for file, transcript in _parse_transcripts(files, prefer, desc="Searching files"):
         if transcript is None:
             continue
 
         file_segments = []
         for line in transcript:
             content = line["content"]
-            for _query_str, _query_regex in compiled_queries:
-                if _query_regex.search(content):
-                    file_segments.append({
-                        "file": file,
-                        "start": line["start"],
-                        "end": line["end"],
-                        "content": content,
-                    })
+            if hs_db is not None:
+                # Each matching query contributes the same segment
+                hits = len(_hyperscan_matches(hs_db, content))
+            else:
+                hits = sum(1 for _query_str, _query_regex in compiled_queries if _query_regex.search(content))
+            for _ in range(hits):
+                file_segments.append({
+                    "file": file,
+                    "start": line["start"],
+                    "end": line["end"],
+                    "content": content,
+                })
 
         segments.extend(sorted(file_segments, key=lambda k: k["start"]))
 
     return segments
 
 
+def _build_token_index(words: list[dict]) -> tuple[dict[str, list[int]], list[set[str]]]:
+    """
+    Index the lowercase word-character tokens of each word.
+
+    Returns:
+        Mapping of token -> word positions (ascending), and the token set per position.
+    """
+    index: dict[str, list[int]] = defaultdict(list)
+    tokens_at = []
+    for i, w in enumerate(words):
+        tokens = set(WORD_TOKEN_RE.findall(w["word"].lower()))
+        tokens_at.append(tokens)
+        for token in tokens:
+            index[token].append(i)
+    return index, tokens_at
+
+
+def _match_fragment_indexed(
+    queries: list[str],
+    index: dict[str, list[int]],
+    tokens_at: list[set[str]],
+) -> Iterator[int]:
+    """
+    Yield start positions where each query word is a whole token of the
+    corresponding transcript word. Equivalent to matching r"\bq\b" for
+    query words made only of word characters.
+    """
+    first, rest = queries[0], queries[1:]
+    last_start = len(tokens_at) - len(queries)
+    for i in index.get(first, ()):
+        if i > last_start:
+            break
+        if all(q in tokens_at[i + j] for j, q in enumerate(rest, start=1)):
+            yield i
+
+
 def _search_fragment(
     files: list[str],
     query: list[str],
@@ -415,8 +814,7 @@ def _search_fragment(
     """
     segments = []
 
-    for file in tqdm(files, desc="Searching files", unit="file", disable=len(files) < 2):
-        transcript = parse_transcript(file, prefer=prefer)
+    for file, transcript in _parse_transcripts(files, prefer, desc="Searching files"):
         if not transcript:
             continue
 
@@ -426,6 +824,11 @@ def _search_fragment(
         if not words:
             continue
 
+        # Built lazily: only exact matches of plain words can use the index
+        token_index = None
+        # Word text column, so the regex scan doesn't index a dict per comparison
+        word_texts = None
+
         for _query_str, _query_regex in compiled_queries:
             queries = [q.strip() for q in _query_str.split(" ") if q.strip()]
             if not queries:
@@ -433,6 +836,20 @@ def _search_fragment(
 
             fragment_len = len(queries)
 
+            lowered = [q.lower() for q in queries]
+            if exact_match and all(WORD_TOKEN_RE.fullmatch(q) for q in lowered):
+                if token_index is None:
+                    token_index = _build_token_index(words)
+                for i in _match_fragment_indexed(lowered, *token_index):
+                    fragment = words[i:i+fragment_len]
+                    segments.append({
+                        "file": file,
+                        "start": fragment[0]["start"],
+                        "end": fragment[-1]["end"],
+                        "content": " ".join([w["word"] for w in fragment]),
+                    })
+                continue
+
             # Compile individual regex patterns for each query word
             query_patterns = []
             for q in queries:
@@ -442,10 +859,15 @@ def _search_fragment(
                     pattern = re.escape(q)
                 query_patterns.append(re.compile(pattern, re.IGNORECASE))
 
+            if word_texts is None:
+                word_texts = [w["word"] for w in words]
+            first_pattern = query_patterns[0]
             for i in range(len(words) - fragment_len + 1):
-                fragment = words[i:i+fragment_len]
                 # Match each query word against its corresponding fragment word
-                if all(query_patterns[j].search(fragment[j]["word"]) for j in range(fragment_len)):
+                if first_pattern.search(word_texts[i]) and all(
+                    query_patterns[j].search(word_texts[i + j]) for j in range(1, fragment_len)
+                ):
+                    fragment = words[i:i+fragment_len]
                     segments.append({
                         "file": file,
                         "start": fragment[0]["start"],
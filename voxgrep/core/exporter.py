@@ -1,21 +1,33 @@
 import os
-import time
 import gc
+import itertools
 import platform
 import subprocess
+import tempfile
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from typing import List, Optional, Callable, Dict, Any
 from tqdm import tqdm
 from moviepy import VideoFileClip, AudioFileClip, concatenate_videoclips, concatenate_audioclips
+from moviepy.config import FFMPEG_BINARY
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
 
 from .types import ExportStrategy
 from .subtitle_utils import apply_subtitle_to_clip
 from ..formats import fcpxml
-from ..utils.config import BATCH_SIZE
+from ..utils.config import (
+    BATCH_CLIP_MEMORY, ENCODER_THREADS, EXPORT_WORKERS, SOURCE_CLIP_CACHE_SIZE,
+    get_available_memory, get_batch_size
+)
 from ..utils.helpers import setup_logger, get_media_type
 from ..utils.exceptions import ExportError, InvalidOutputFormatError, ExportFailedError
 
 logger = setup_logger(__name__)
 
+# Suffixes for temp audio files; unique per process, unlike a wall-clock timestamp
+_temp_audio_counter = itertools.count()
+
 # Module-level cache for encoding parameters
 _encoding_params_cache: Dict[str, Any] | None = None
 
@@ -38,7 +50,7 @@ def get_encoding_params() -> Dict[str, Any]:
         "bitrate": "8000k",
         "audio_bitrate": "192k",
         "preset": "medium",
-        "threads": 4
+        "threads": ENCODER_THREADS
     }
 
     try:
@@ -82,10 +94,24 @@ def get_encoding_params() -> Dict[str, Any]:
     return params
 
 
+def source_files(composition: List[dict]) -> frozenset:
+    """The distinct source files a composition draws from."""
+    return frozenset(c["file"] for c in composition)
+
+
+def _temp_audiofile(outputfile: str) -> str:
+    """A temp audio path next to outputfile that no concurrent write will share."""
+    return f"{outputfile}_temp-audio.{os.getpid()}.{next(_temp_audio_counter)}.m4a"
+
+
 def get_input_type(composition: List[dict]) -> str:
     """Determine if the composition is primarily audio or video."""
-    filenames = set([c["file"] for c in composition])
-    types = [get_media_type(f) for f in filenames]
+    return _input_type_for(source_files(composition))
+
+
+@lru_cache(maxsize=64)
+def _input_type_for(filenames: frozenset) -> str:
+    types = {get_media_type(f) for f in filenames}
 
     if "video" in types:
         return "video"
@@ -94,6 +120,11 @@ def get_input_type(composition: List[dict]) -> str:
     return "unknown"
 
 
+# Output container extensions, by the kind of export they imply
+OUTPUT_VIDEO_EXTS = frozenset({'.mp4', '.mkv', '.mov', '.avi', '.webm'})
+OUTPUT_AUDIO_EXTS = frozenset({'.mp3', '.wav', '.aac', '.flac', '.ogg', '.m4a'})
+
+
 def plan_output_strategy(composition: List[dict], outputfile: str) -> ExportStrategy:
     """
     Determine the export strategy based on input types and output format.
@@ -104,19 +135,16 @@ def plan_output_strategy(composition: List[dict], outputfile: str) -> ExportStra
     input_type = get_input_type(composition)
     output_ext = os.path.splitext(outputfile)[1].lower()
 
-    video_exts = ['.mp4', '.mkv', '.mov', '.avi', '.webm']
-    audio_exts = ['.mp3', '.wav', '.aac', '.flac', '.ogg', '.m4a']
-
-    if input_type == "audio" and output_ext in video_exts and outputfile != "supercut.mp4":
+    if input_type == "audio" and output_ext in OUTPUT_VIDEO_EXTS and outputfile != "supercut.mp4":
         raise InvalidOutputFormatError(
             "VoxGrep cannot convert audio input to video output. "
             "Please use an audio output format like .mp3 or .wav."
         )
 
-    if input_type == "video" and output_ext not in audio_exts:
+    if input_type == "video" and output_ext not in OUTPUT_AUDIO_EXTS:
         return ExportStrategy.VIDEO
 
-    if input_type == "audio" or output_ext in audio_exts:
+    if input_type == "audio" or output_ext in OUTPUT_AUDIO_EXTS:
         return ExportStrategy.AUDIO
 
     return ExportStrategy.VIDEO  # Default
@@ -125,18 +153,106 @@ def plan_output_strategy(composition: List[dict], outputfile: str) -> ExportStra
 def cleanup_log_files(outputfile: str):
     """Search for and remove temp log files found in the output directory."""
     d = os.path.dirname(os.path.abspath(outputfile))
-    if os.path.exists(d):
-        logfiles = [f for f in os.listdir(d) if f.endswith("ogg.log")]
-        for f in logfiles:
-            try:
-                os.remove(os.path.join(d, f))
-            except OSError:
-                pass
+    try:
+        with os.scandir(d) as entries:
+            for entry in entries:
+                if entry.name.endswith("ogg.log") and entry.is_file():
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+    except OSError:
+        pass
+
+
+def _remove_quietly(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def remove_files(paths: List[str], max_workers: int = 16):
+    """
+    Delete files concurrently, ignoring ones that are already gone.
+
+    Each unlink is an independent syscall that releases the GIL, so issuing
+    them from a thread pool overlaps the round trips on networked storage.
+    """
+    if len(paths) <= 1:
+        for path in paths:
+            _remove_quietly(path)
+        return
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        list(executor.map(_remove_quietly, paths))
+
+
+class SourceClipCache:
+    """
+    Opens source clips on first use instead of all up front.
+
+    With maxsize set, the least recently used clip is closed once more than
+    maxsize are open, which reaps its ffmpeg reader. Leave maxsize as None when
+    cut clips must stay readable until a final concatenated write.
+
+    Each source's duration is recorded when it is first opened and outlives
+    eviction, so clamping clip ends is a plain dict lookup.
+    """
+
+    def __init__(self, factory: Callable[[str], Any], maxsize: Optional[int] = None):
+        self.factory = factory
+        self.maxsize = maxsize
+        self.durations: Dict[str, float] = {}
+        self._clips: "OrderedDict[str, Any]" = OrderedDict()
+
+    def __getitem__(self, path: str) -> Any:
+        clip = self._clips.get(path)
+        if clip is not None:
+            self._clips.move_to_end(path)
+            return clip
+
+        clip = self._clips[path] = self.factory(path)
+        self.durations.setdefault(path, clip.duration)
+        if self.maxsize is not None and len(self._clips) > self.maxsize:
+            _, evicted = self._clips.popitem(last=False)
+            evicted.close()
+        return clip
+
+    def bounds(self, c: dict) -> tuple:
+        """A segment's (start, end) clamped to its source's duration."""
+        return max(0, c["start"]), min(self.durations[c["file"]], c["end"])
+
+    def __len__(self) -> int:
+        return len(self._clips)
+
+    def close(self):
+        """Close every clip that is still open."""
+        while self._clips:
+            _, clip = self._clips.popitem(last=False)
+            clip.close()
+
+
+def _source_order(composition: List[dict]) -> List[int]:
+    """Composition indices grouped by file and sorted by start, for forward-only seeks."""
+    return sorted(range(len(composition)), key=lambda i: (composition[i]["file"], composition[i]["start"]))
+
+
+def _concat_method(clips: List[Any]) -> str:
+    """
+    "chain" when every clip shares one frame size and fps, else "compose".
+
+    Chaining plays frames back to back; composing builds a CompositeVideoClip
+    that centres each frame on a shared canvas, which only mixed sizes need.
+    """
+    first = clips[0]
+    if all(c.size == first.size and c.fps == first.fps for c in clips):
+        return "chain"
+    return "compose"
 
 
 def _process_video_clips(
     composition: List[dict],
-    source_clips: Dict[str, VideoFileClip],
+    source_clips: SourceClipCache,
     burn_in_subtitles: bool = False,
     progress_callback: Optional[Callable[[float], None]] = None,
 ) -> List[Any]:
@@ -145,7 +261,7 @@ def _process_video_clips(
 
     Args:
         composition: List of segment dicts with file, start, end, content.
-        source_clips: Pre-loaded source video clips by filename.
+        source_clips: Source video clips by filename.
         burn_in_subtitles: Whether to overlay subtitles.
         progress_callback: Optional callback for progress updates.
 
@@ -157,8 +273,7 @@ def _process_video_clips(
 
     for i, c in enumerate(iterable):
         clip_source = source_clips[c["file"]]
-        start = max(0, c["start"])
-        end = min(clip_source.duration, c["end"])
+        start, end = source_clips.bounds(c)
 
         clip = clip_source.subclipped(start, end)
 
@@ -175,7 +290,7 @@ def _process_video_clips(
 
 def _process_audio_clips(
     composition: List[dict],
-    source_clips: Dict[str, AudioFileClip],
+    source_clips: SourceClipCache,
     progress_callback: Optional[Callable[[float], None]] = None,
 ) -> List[Any]:
     """
@@ -183,7 +298,7 @@ def _process_audio_clips(
 
     Args:
         composition: List of segment dicts with file, start, end.
-        source_clips: Pre-loaded source audio clips by filename.
+        source_clips: Source audio clips by filename.
         progress_callback: Optional callback for progress updates.
 
     Returns:
@@ -194,8 +309,7 @@ def _process_audio_clips(
 
     for i, c in enumerate(iterable):
         clip_source = source_clips[c["file"]]
-        start = max(0, c["start"])
-        end = min(clip_source.duration, c["end"])
+        start, end = source_clips.bounds(c)
 
         cut_clips.append(clip_source.subclipped(start, end))
 
@@ -205,25 +319,132 @@ def _process_audio_clips(
     return cut_clips
 
 
+def _trim_command(clip: dict, segment_file: str) -> List[str]:
+    """ffmpeg arguments that cut one clip into segment_file without re-encoding."""
+    start = max(0, clip["start"])
+    duration = clip["end"] - start
+    return [
+        FFMPEG_BINARY, "-y", "-loglevel", "error",
+        "-ss", f"{start:.3f}", "-i", clip["file"], "-t", f"{duration:.3f}",
+        "-map", "0:v:0", "-map", "0:a:0?",
+        "-c", "copy", "-avoid_negative_ts", "make_zero", segment_file,
+    ]
+
+
+def _trim_clip(cmd: List[str]) -> tuple:
+    """Run one ffmpeg trim; returns (returncode, stderr)."""
+    proc = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    return proc.returncode, proc.stderr.decode(errors="replace").strip()
+
+
+def _run_trims(
+    commands: List[List[str]],
+    max_concurrent: int,
+    progress_callback: Optional[Callable[[float], None]] = None,
+) -> List[tuple]:
+    """
+    Run the trim commands concurrently, reporting progress as each one finishes.
+
+    Each worker thread just waits on its ffmpeg subprocess, so this works the
+    same whether or not the caller is already inside an event loop.
+    """
+    done = 0
+    pbar = None if progress_callback else tqdm(total=len(commands), desc="Trimming clips", unit="clip")
+    with ThreadPoolExecutor(max_workers=min(max_concurrent, len(commands))) as executor:
+        futures = [executor.submit(_trim_clip, cmd) for cmd in commands]
+        for _ in as_completed(futures):
+            done += 1
+            if progress_callback:
+                progress_callback(done / len(commands) * 0.9)
+            if pbar:
+                pbar.update(1)
+    if pbar:
+        pbar.close()
+
+    return [future.result() for future in futures]
+
+
+def _default_trim_workers() -> int:
+    """Concurrent ffmpeg trims; each is I/O bound, so half the cores avoids disk thrash."""
+    return max(1, (os.cpu_count() or 1) // 2)
+
+
+def _trim_stream_copy(
+    composition: List[dict],
+    outputfile: str,
+    progress_callback: Optional[Callable[[float], None]] = None,
+    max_concurrent: Optional[int] = None,
+) -> bool:
+    """
+    Cut each clip with ffmpeg stream copy and join them with the concat demuxer.
+
+    Nothing is decoded or re-encoded, so this is much faster than the moviepy
+    pipeline, but cut points snap to the nearest keyframe. Trims run as
+    concurrent ffmpeg subprocesses, at most max_concurrent at a time.
+
+    Returns:
+        True if the output was written, False if the caller should re-encode instead.
+    """
+    ext = os.path.splitext(outputfile)[1] or ".mp4"
+    out_dir = os.path.dirname(os.path.abspath(outputfile))
+    clips = [c for c in composition if c["end"] > max(0, c["start"])]
+    if not clips:
+        return False
+
+    with tempfile.TemporaryDirectory(prefix="voxgrep_trim_", dir=out_dir) as tmp_dir:
+        segment_files = [os.path.join(tmp_dir, f"segment{i:05d}{ext}") for i in range(len(clips))]
+        commands = [_trim_command(c, f) for c, f in zip(clips, segment_files)]
+
+        results = _run_trims(
+            commands,
+            max_concurrent or _default_trim_workers(),
+            progress_callback=progress_callback
+        )
+        for returncode, stderr in results:
+            if returncode != 0:
+                logger.warning(f"Stream copy trim failed, re-encoding instead: {stderr}")
+                return False
+
+        logger.info("[+] Joining trimmed clips with stream copy.")
+        return concat_stream_copy(segment_files, outputfile)
+
+
 def create_supercut(
     composition: List[dict],
     outputfile: str,
     progress_callback: Optional[Callable[[float], None]] = None,
-    burn_in_subtitles: bool = False
+    burn_in_subtitles: bool = False,
+    encoder_threads: Optional[int] = None,
+    stream_copy: bool = False,
+    strategy: Optional[ExportStrategy] = None
 ):
     """
     Creates a supercut from a composition of clips.
+
+    Args:
+        encoder_threads: Override the ffmpeg encoder thread count (default: ENCODER_THREADS).
+        stream_copy: Cut and join video without re-encoding when all sources share
+                     one format. Much faster, but cuts land on keyframes.
+                     Ignored when burning in subtitles.
+        strategy: Export strategy already planned by the caller; planned here if omitted.
     """
     if not composition:
         return
 
-    strategy = plan_output_strategy(composition, outputfile)
-    all_filenames = set([c["file"] for c in composition])
+    if strategy is None:
+        strategy = plan_output_strategy(composition, outputfile)
+
+    if strategy == ExportStrategy.VIDEO and stream_copy and not burn_in_subtitles:
+        logger.info("[+] Trimming video clips with stream copy.")
+        if _trim_stream_copy(composition, outputfile, progress_callback=progress_callback):
+            if progress_callback:
+                progress_callback(1.0)
+            return
 
     try:
         if strategy == ExportStrategy.VIDEO:
             logger.info("[+] Creating video clips.")
-            videofileclips = {f: VideoFileClip(f) for f in all_filenames}
+            videofileclips = SourceClipCache(VideoFileClip)
             try:
                 cut_clips = _process_video_clips(
                     composition, videofileclips,
@@ -232,13 +453,15 @@ def create_supercut(
                 )
 
                 logger.info("[+] Concatenating video clips.")
-                final_clip = concatenate_videoclips(cut_clips, method="compose")
+                final_clip = concatenate_videoclips(cut_clips, method=_concat_method(cut_clips))
 
                 logger.info("[+] Writing video output.")
                 encoding_params = get_encoding_params()
+                if encoder_threads:
+                    encoding_params["threads"] = encoder_threads
 
                 write_kwargs = {
-                    "temp_audiofile": f"{outputfile}_temp-audio{time.time()}.m4a",
+                    "temp_audiofile": _temp_audiofile(outputfile),
                     "remove_temp": True,
                     "logger": 'bar',
                     **encoding_params
@@ -253,12 +476,11 @@ def create_supercut(
                 for clip in cut_clips:
                     clip.close()
             finally:
-                for f in videofileclips:
-                    videofileclips[f].close()
+                videofileclips.close()
 
         else:  # Audio strategy
             logger.info("[+] Creating audio clips.")
-            audiofileclips = {f: AudioFileClip(f) for f in all_filenames}
+            audiofileclips = SourceClipCache(AudioFileClip)
             try:
                 cut_clips = _process_audio_clips(
                     composition, audiofileclips,
@@ -283,8 +505,7 @@ def create_supercut(
                 for clip in cut_clips:
                     clip.close()
             finally:
-                for f in audiofileclips:
-                    audiofileclips[f].close()
+                audiofileclips.close()
 
         if progress_callback:
             progress_callback(1.0)
@@ -294,17 +515,108 @@ def create_supercut(
         raise ExportFailedError(f"Failed to create supercut: {e}") from e
 
 
+def _stream_signature(filename: str) -> tuple:
+    """Codec/format parameters that must match for a lossless concat."""
+    infos = ffmpeg_parse_infos(filename)
+    return (
+        infos.get("video_codec_name"),
+        tuple(infos.get("video_size") or ()),
+        infos.get("video_fps"),
+        infos.get("audio_fps"),
+    )
+
+
+def concat_stream_copy(input_files: List[str], outputfile: str) -> bool:
+    """
+    Join video files with the ffmpeg concat demuxer without re-encoding.
+
+    Only attempted when every input shares codec, frame size, fps and audio rate.
+
+    Returns:
+        True if the output was written, False if the caller should re-encode instead.
+    """
+    try:
+        signatures = {_stream_signature(f) for f in input_files}
+    except Exception as e:
+        logger.debug(f"Could not probe batch files for stream copy: {e}")
+        return False
+
+    if len(signatures) != 1:
+        logger.info("[+] Batch files differ in format; re-encoding for concat.")
+        return False
+
+    list_file = f"{outputfile}.concat.txt"
+    try:
+        with open(list_file, "w", encoding="utf-8") as f:
+            for path in input_files:
+                escaped = os.path.abspath(path).replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+
+        result = subprocess.run(
+            [FFMPEG_BINARY, "-y", "-loglevel", "error",
+             "-f", "concat", "-safe", "0", "-i", list_file,
+             "-c", "copy", outputfile],
+            capture_output=True,
+            text=True
+        )
+        if result.returncode != 0:
+            logger.warning(f"Stream copy concat failed, re-encoding instead: {result.stderr.strip()}")
+            return False
+        return True
+    finally:
+        if os.path.exists(list_file):
+            os.remove(list_file)
+
+
+def _default_export_workers(
+    num_batches: int,
+    batch_size: int,
+    encoder_threads: Optional[int] = None
+) -> int:
+    """
+    Number of parallel batch encodes that fits the cores and the free memory.
+
+    Each worker holds a whole batch of clips, so only as many run as there is
+    memory for batch_size clips apiece; if memory can't be measured, batches
+    are encoded serially.
+    """
+    available = get_available_memory()
+    if not available:
+        return 1
+    by_memory = available // (batch_size * BATCH_CLIP_MEMORY)
+    threads = encoder_threads or ENCODER_THREADS
+    by_cores = max(1, (os.cpu_count() or 1) // threads)
+    return max(1, min(EXPORT_WORKERS, by_cores, by_memory, num_batches))
+
+
 def create_supercut_in_batches(
     composition: List[dict],
     outputfile: str,
     progress_callback: Optional[Callable[[float], None]] = None,
-    burn_in_subtitles: bool = False
+    burn_in_subtitles: bool = False,
+    encoder_threads: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    fast_concat: bool = True,
+    stream_copy: bool = False,
+    batch_size: Optional[int] = None
 ):
     """
     Creates a supercut in batches to avoid memory issues.
+
+    Args:
+        batch_size: Clips per batch. Defaults to get_batch_size(), which is sized
+                    from available memory.
+        encoder_threads: Override the ffmpeg encoder thread count (default: ENCODER_THREADS).
+        max_workers: Number of batches to encode in parallel processes.
+                     Defaults to what fits the CPU count and free memory;
+                     1 encodes serially.
+        fast_concat: Join the batch files with stream copy when their formats match.
+        stream_copy: Cut each batch without re-encoding (see create_supercut).
     """
+    if batch_size is None:
+        batch_size = get_batch_size()
     total_clips = len(composition)
-    num_batches = (total_clips + BATCH_SIZE - 1) // BATCH_SIZE
+    num_batches = (total_clips + batch_size - 1) // batch_size
     batch_files = []
 
     strategy = plan_output_strategy(composition, outputfile)
@@ -313,38 +625,74 @@ def create_supercut_in_batches(
     if strategy == ExportStrategy.AUDIO and outputfile.endswith(".mp4"):
         outputfile = outputfile.replace(".mp4", ".mp3")
 
+    batches = [
+        (composition[start_idx:start_idx + batch_size], f"{outputfile}.batch{batch_idx}{file_ext}")
+        for batch_idx, start_idx in enumerate(range(0, total_clips, batch_size))
+    ]
+
+    if max_workers is None:
+        max_workers = _default_export_workers(num_batches, batch_size, encoder_threads)
+
     pbar = None
     if not progress_callback:
         pbar = tqdm(total=num_batches, desc="Processing batches", unit="batch")
 
     try:
-        for batch_idx in range(num_batches):
-            start_idx = batch_idx * BATCH_SIZE
-            end_idx = min(start_idx + BATCH_SIZE, total_clips)
-
-            batch_filename = f"{outputfile}.batch{batch_idx}{file_ext}"
+        if max_workers > 1:
+            logger.info(f"[+] Encoding {num_batches} batches with {max_workers} workers.")
+            completed = {}
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        create_supercut, batch, batch_filename,
+                        burn_in_subtitles=burn_in_subtitles,
+                        encoder_threads=encoder_threads,
+                        stream_copy=stream_copy,
+                        strategy=strategy
+                    ): (batch_idx, batch_filename)
+                    for batch_idx, (batch, batch_filename) in enumerate(batches)
+                }
+                for done_count, future in enumerate(as_completed(futures), start=1):
+                    batch_idx, batch_filename = futures[future]
+                    try:
+                        future.result()
+                        completed[batch_idx] = batch_filename
+                    except Exception as e:
+                        logger.error(f"Failed to create batch {batch_idx}: {e}")
+                        logger.warning(f"Skipping batch {batch_idx}, continuing with remaining batches...")
 
-            def batch_progress(p):
-                if progress_callback:
-                    # Scale batch progress to 80% of total
-                    overall_p = (batch_idx + p) / num_batches * 0.8
-                    progress_callback(overall_p)
+                    if progress_callback:
+                        progress_callback(done_count / num_batches * 0.8)
+                    if pbar:
+                        pbar.update(1)
 
-            try:
-                create_supercut(
-                    composition[start_idx:end_idx],
-                    batch_filename,
-                    progress_callback=batch_progress,
-                    burn_in_subtitles=burn_in_subtitles
-                )
-                batch_files.append(batch_filename)
-            except Exception as e:
-                logger.error(f"Failed to create batch {batch_idx}: {e}")
-                logger.warning(f"Skipping batch {batch_idx}, continuing with remaining batches...")
+            batch_files = [completed[i] for i in sorted(completed)]
+        else:
+            for batch_idx, (batch, batch_filename) in enumerate(batches):
+                def batch_progress(p):
+                    if progress_callback:
+                        # Scale batch progress to 80% of total
+                        overall_p = (batch_idx + p) / num_batches * 0.8
+                        progress_callback(overall_p)
 
-            gc.collect()
-            if pbar:
-                pbar.update(1)
+                try:
+                    create_supercut(
+                        batch,
+                        batch_filename,
+                        progress_callback=batch_progress,
+                        burn_in_subtitles=burn_in_subtitles,
+                        encoder_threads=encoder_threads,
+                        stream_copy=stream_copy,
+                        strategy=strategy
+                    )
+                    batch_files.append(batch_filename)
+                except Exception as e:
+                    logger.error(f"Failed to create batch {batch_idx}: {e}")
+                    logger.warning(f"Skipping batch {batch_idx}, continuing with remaining batches...")
+
+                gc.collect()
+                if pbar:
+                    pbar.update(1)
 
         if pbar:
             pbar.close()
@@ -359,13 +707,23 @@ def create_supercut_in_batches(
             progress_callback(0.8)
 
         logger.info("[+] Concatenating all batches.")
-        if strategy == ExportStrategy.VIDEO:
+        if len(batch_files) == 1 and os.path.splitext(outputfile)[1].lower() == file_ext:
+            # Nothing to join and already in the target format; move the lone batch into place
+            os.replace(batch_files[0], outputfile)
+            if progress_callback:
+                progress_callback(1.0)
+        elif strategy == ExportStrategy.VIDEO and fast_concat and concat_stream_copy(batch_files, outputfile):
+            if progress_callback:
+                progress_callback(1.0)
+        elif strategy == ExportStrategy.VIDEO:
             clips = [VideoFileClip(f) for f in batch_files]
-            final = concatenate_videoclips(clips, method="compose")
+            final = concatenate_videoclips(clips, method=_concat_method(clips))
 
             encoding_params = get_encoding_params()
+            if encoder_threads:
+                encoding_params["threads"] = encoder_threads
             write_kwargs = {
-                "temp_audiofile": f"{outputfile}_final_temp-audio.m4a",
+                "temp_audiofile": _temp_audiofile(outputfile),
                 "remove_temp": True,
                 "logger": 'bar',
                 **encoding_params
@@ -394,12 +752,8 @@ def create_supercut_in_batches(
             progress_callback(1.0)
 
     finally:
-        for f in batch_files:
-            if os.path.exists(f):
-                try:
-                    os.remove(f)
-                except OSError:
-                    pass
+        # Every planned batch file, so failed or interrupted batches go too
+        remove_files([batch_filename for _, batch_filename in batches])
         cleanup_log_files(outputfile)
 
 
@@ -407,28 +761,34 @@ def export_individual_clips(
     composition: List[dict],
     outputfile: str,
     progress_callback: Optional[Callable[[float], None]] = None,
-    burn_in_subtitles: bool = False
+    burn_in_subtitles: bool = False,
+    encoder_threads: Optional[int] = None
 ):
-    """Exports each clip in the composition as a separate file."""
+    """
+    Exports each clip in the composition as a separate file.
+
+    Clips are written grouped by source file so that only SOURCE_CLIP_CACHE_SIZE
+    sources are open at once; output filenames keep the composition order.
+    """
     strategy = plan_output_strategy(composition, outputfile)
-    all_filenames = set([c["file"] for c in composition])
     basename, ext = os.path.splitext(outputfile)
 
     if strategy == ExportStrategy.AUDIO and ext == ".mp4":
         ext = ".mp3"
 
     results = {"success": 0, "failed": 0, "errors": []}
+    order = _source_order(composition)
 
     try:
         if strategy == ExportStrategy.VIDEO:
-            videofileclips = {f: VideoFileClip(f) for f in all_filenames}
+            videofileclips = SourceClipCache(VideoFileClip, maxsize=SOURCE_CLIP_CACHE_SIZE)
             try:
-                iterable = composition if progress_callback else tqdm(composition, desc="Exporting individual clips", unit="clip")
-                for i, c in enumerate(iterable):
+                iterable = order if progress_callback else tqdm(order, desc="Exporting individual clips", unit="clip")
+                for done, i in enumerate(iterable, start=1):
+                    c = composition[i]
                     try:
                         clip_source = videofileclips[c["file"]]
-                        start = max(0, c["start"])
-                        end = min(clip_source.duration, c["end"])
+                        start, end = videofileclips.bounds(c)
 
                         clip = clip_source.subclipped(start, end)
 
@@ -438,6 +798,8 @@ def export_individual_clips(
                         clip_filename = f"{basename}_{str(i).zfill(5)}{ext}"
 
                         encoding_params = get_encoding_params()
+                        if encoder_threads:
+                            encoding_params["threads"] = encoder_threads
 
                         clip.write_videofile(
                             clip_filename,
@@ -446,43 +808,43 @@ def export_individual_clips(
                             **encoding_params
                         )
 
+                        # Don't close the subclip: it shares its source's reader, and
+                        # closing it would break later clips from the same file.
                         if progress_callback:
-                            progress_callback((i + 1) / len(composition))
-                        clip.close()
+                            progress_callback(done / len(composition))
                         results["success"] += 1
                     except Exception as e:
                         logger.error(f"Failed to export clip {i}: {e}")
                         results["failed"] += 1
                         results["errors"].append(f"Clip {i}: {e}")
             finally:
-                for f in videofileclips:
-                    videofileclips[f].close()
+                videofileclips.close()
         else:
-            audiofileclips = {f: AudioFileClip(f) for f in all_filenames}
+            audiofileclips = SourceClipCache(AudioFileClip, maxsize=SOURCE_CLIP_CACHE_SIZE)
             try:
-                iterable = composition if progress_callback else tqdm(composition, desc="Exporting individual clips", unit="clip")
-                for i, c in enumerate(iterable):
+                iterable = order if progress_callback else tqdm(order, desc="Exporting individual clips", unit="clip")
+                for done, i in enumerate(iterable, start=1):
+                    c = composition[i]
                     try:
                         clip_source = audiofileclips[c["file"]]
-                        start = max(0, c["start"])
-                        end = min(clip_source.duration, c["end"])
+                        start, end = audiofileclips.bounds(c)
 
                         clip = clip_source.subclipped(start, end)
                         clip_filename = f"{basename}_{str(i).zfill(5)}{ext}"
 
                         clip.write_audiofile(clip_filename, logger='bar')
 
+                        # Don't close the subclip: it shares its source's reader, and
+                        # closing it would break later clips from the same file.
                         if progress_callback:
-                            progress_callback((i + 1) / len(composition))
-                        clip.close()
+                            progress_callback(done / len(composition))
                         results["success"] += 1
                     except Exception as e:
                         logger.error(f"Failed to export clip {i}: {e}")
                         results["failed"] += 1
                         results["errors"].append(f"Clip {i}: {e}")
             finally:
-                for f in audiofileclips:
-                    audiofileclips[f].close()
+                audiofileclips.close()
     except Exception as e:
         logger.error(f"Batch setup failed: {e}")
         raise ExportFailedError(f"Failed to start export: {e}") from e
@@ -492,27 +854,23 @@ def export_individual_clips(
 
 def export_m3u(composition: List[dict], outputfile: str):
     """Exports a VLC-compatible M3U playlist."""
-    lines = ["#EXTM3U"]
-    for c in composition:
-        lines.append("#EXTINF:")
-        lines.append(f"#EXTVLCOPT:start-time={c['start']}")
-        lines.append(f"#EXTVLCOPT:stop-time={c['end']}")
-        lines.append(c["file"])
-
-    with open(outputfile, "w", encoding="utf-8") as outfile:
-        outfile.write("\n".join(lines))
+    with open(outputfile, "w", encoding="utf-8", buffering=1 << 20) as outfile:
+        outfile.write("#EXTM3U\n")
+        outfile.writelines(
+            f"#EXTINF:\n#EXTVLCOPT:start-time={c['start']}\n#EXTVLCOPT:stop-time={c['end']}\n{c['file']}\n"
+            for c in composition
+        )
 
 
 def export_mpv_edl(composition: List[dict], outputfile: str):
     """Exports an mpv-compatible EDL file."""
-    lines = ["# mpv EDL v0"]
-    for c in composition:
-        abs_path = os.path.abspath(c['file'])
-        duration = c['end'] - c['start']
-        lines.append(f"{abs_path},{c['start']},{duration}")
-
-    with open(outputfile, "w", encoding="utf-8") as outfile:
-        outfile.write("\n".join(lines))
+    abs_paths = {f: os.path.abspath(f) for f in source_files(composition)}
+    with open(outputfile, "w", encoding="utf-8", buffering=1 << 20) as outfile:
+        outfile.write("# mpv EDL v0\n")
+        outfile.writelines(
+            f"{abs_paths[c['file']]},{c['start']},{c['end'] - c['start']}\n"
+            for c in composition
+        )
 
 
 def export_xml(composition: List[dict], outputfile: str):
@@ -1,8 +1,11 @@
 import random
 import os
 import re
+from operator import itemgetter
 from typing import List, Union, Optional, Callable, Dict, Any
 
+import numpy as np
+
 from rich.console import Console
 from rich.table import Table
 from rich.text import Text
@@ -12,7 +15,7 @@ from . import engine as search_module
 from . import exporter
 from .types import VoxGrepResult, SearchType
 from ..formats import vtt
-from ..utils.config import DEFAULT_PADDING, BATCH_SIZE
+from ..utils.config import DEFAULT_PADDING, get_batch_size
 from ..utils.helpers import setup_logger, ensure_list, ensure_directory_exists, get_media_type
 from ..utils import mpv_utils
 
@@ -53,15 +56,21 @@ def remove_overlaps(segments: List[dict]) -> List[dict]:
         return []
 
     # Sort by start time
-    segments = sorted(segments, key=lambda k: k["start"])
+    segments = sorted(segments, key=itemgetter("start"))
 
-    out = [segments[0]]
+    # The open segment's file and end are kept in locals rather than re-read
+    current = segments[0]
+    current_file, current_end = current["file"], current["end"]
+    out = [current]
     for segment in segments[1:]:
         # Only merge if it's the same file
-        if segment["file"] == out[-1]["file"] and out[-1]["end"] >= segment["start"]:
-            out[-1]["end"] = max(out[-1]["end"], segment["end"])
+        if segment["file"] == current_file and current_end >= segment["start"]:
+            if segment["end"] > current_end:
+                current_end = current["end"] = segment["end"]
         else:
-            out.append(segment)
+            current = segment
+            current_file, current_end = current["file"], current["end"]
+            out.append(current)
 
     return out
 
@@ -75,21 +84,25 @@ def pad_and_sync(
     if not segments:
         return []
 
-    processed = []
-    for s in segments:
-        new_segment = s.copy()
-        if padding != 0:
-            new_segment["start"] -= padding
-            new_segment["end"] += padding
-        if resync != 0:
-            new_segment["start"] += resync
-            new_segment["end"] += resync
-
-        # Ensure bounds
-        new_segment["start"] = max(0, new_segment["start"])
-        new_segment["end"] = max(0, new_segment["end"])
-
-        processed.append(new_segment)
+    # Shift and clamp every timestamp at once; float64 keeps long timestamps exact
+    count = len(segments)
+    starts = np.fromiter(map(itemgetter("start"), segments), dtype=np.float64, count=count)
+    ends = np.fromiter(map(itemgetter("end"), segments), dtype=np.float64, count=count)
+    if padding != 0:
+        starts -= padding
+        ends += padding
+    if resync != 0:
+        starts += resync
+        ends += resync
+
+    # Ensure bounds
+    np.maximum(starts, 0, out=starts)
+    np.maximum(ends, 0, out=ends)
+
+    processed = [
+        {**s, "start": start, "end": end}
+        for s, start, end in zip(segments, starts.tolist(), ends.tolist())
+    ]
 
     # Merge overlaps that were created by padding
     return remove_overlaps(processed)
@@ -245,6 +258,8 @@ def _handle_export_mode(
     write_vtt: bool = False,
     progress_callback: Optional[Callable[[float], None]] = None,
     burn_in_subtitles: bool = False,
+    encoder_threads: Optional[int] = None,
+    stream_copy: bool = False,
 ) -> VoxGrepResult:
     """
     Handle export mode: create supercut or individual clips.
@@ -257,6 +272,8 @@ def _handle_export_mode(
         write_vtt: Whether to write VTT subtitle file.
         progress_callback: Optional callback for progress updates.
         burn_in_subtitles: Whether to burn subtitles into video.
+        encoder_threads: Optional override for the ffmpeg encoder thread count.
+        stream_copy: Cut the supercut without re-encoding (keyframe-accurate only).
 
     Returns:
         VoxGrepResult with export statistics.
@@ -269,7 +286,8 @@ def _handle_export_mode(
         exporter.export_individual_clips(
             segments, output,
             progress_callback=progress_callback,
-            burn_in_subtitles=burn_in_subtitles
+            burn_in_subtitles=burn_in_subtitles,
+            encoder_threads=encoder_threads
         )
     elif output.endswith(".m3u"):
         exporter.export_m3u(segments, output)
@@ -279,17 +297,23 @@ def _handle_export_mode(
         exporter.export_xml(segments, output)
     else:
         # Create full supercut
-        if len(segments) > BATCH_SIZE:
+        batch_size = get_batch_size()
+        if len(segments) > batch_size:
             exporter.create_supercut_in_batches(
                 segments, output,
+                batch_size=batch_size,
                 progress_callback=progress_callback,
-                burn_in_subtitles=burn_in_subtitles
+                burn_in_subtitles=burn_in_subtitles,
+                encoder_threads=encoder_threads,
+                stream_copy=stream_copy
             )
         else:
             exporter.create_supercut(
                 segments, output,
                 progress_callback=progress_callback,
-                burn_in_subtitles=burn_in_subtitles
+                burn_in_subtitles=burn_in_subtitles,
+                encoder_threads=encoder_threads,
+                stream_copy=stream_copy
             )
 
     # Write WebVTT if requested
@@ -302,8 +326,7 @@ def _handle_export_mode(
     supercut_duration = sum(s['end'] - s['start'] for s in segments)
 
     # Get original file durations (cached per unique file)
-    unique_files = list(set(s['file'] for s in segments))
-    original_duration = sum(get_file_duration(f) for f in unique_files)
+    original_duration = sum(get_file_duration(f) for f in exporter.source_files(segments))
 
     time_saved = max(0, original_duration - supercut_duration)
     efficiency_percent = (time_saved / original_duration * 100) if original_duration > 0 else 0
@@ -339,6 +362,8 @@ def voxgrep(
     console: Optional[Console] = None,
     progress_callback: Optional[Callable[[float], None]] = None,
     burn_in_subtitles: bool = False,
+    encoder_threads: Optional[int] = None,
+    stream_copy: bool = False,
 ) -> Union[bool, Dict[str, Any], VoxGrepResult]:
     """
     Main entry point for creating a supercut based on a search query.
@@ -404,4 +429,6 @@ def voxgrep(
         write_vtt=write_vtt,
         progress_callback=progress_callback,
         burn_in_subtitles=burn_in_subtitles,
+        encoder_threads=encoder_threads,
+        stream_copy=stream_copy,
     )
@@ -5,7 +5,7 @@ from collections.abc import Callable
 from tqdm import tqdm
 
 try:
-    from faster_whisper import WhisperModel
+    from faster_whisper import WhisperModel, BatchedInferencePipeline
     WHISPER_AVAILABLE = True
 except ImportError:
     WHISPER_AVAILABLE = False
@@ -34,6 +34,9 @@ from ..utils.audio import normalize_audio as norm_audio, get_normalized_cache_pa
 
 logger = setup_logger(__name__)
 
+# Loaded faster-whisper models kept alive between calls (keep_model_loaded=True)
+_whisper_model_cache: dict[tuple[str, str, str], "WhisperModel"] = {}
+
 
 def _prepare_audio_input(
     videofile: str,
@@ -79,6 +82,53 @@ def _prepare_audio_input(
         return videofile
 
 
+def _load_whisper_model(
+    model_name: str,
+    device: str,
+    compute_type: str,
+    keep_loaded: bool = False
+) -> "WhisperModel":
+    """
+    Load a faster-whisper model, optionally reusing a previously loaded instance.
+
+    Args:
+        model_name: Whisper model name or path.
+        device: Device to load the model on.
+        compute_type: CTranslate2 compute type.
+        keep_loaded: Cache the model so later calls skip the load.
+
+    Returns:
+        A loaded WhisperModel.
+    """
+    key = (model_name, device, compute_type)
+    if key in _whisper_model_cache:
+        logger.debug(f"Reusing loaded model {model_name} on {device}")
+        return _whisper_model_cache[key]
+
+    try:
+        model = WhisperModel(model_name, device=device, compute_type=compute_type)
+    except Exception as e:
+        logger.error(f"Could not load model {model_name} on {device}: {e}")
+        if device == "cuda":
+            logger.info("Falling back to CPU...")
+            try:
+                model = WhisperModel(model_name, device="cpu", compute_type="int8")
+            except Exception as e2:
+                raise TranscriptionFailedError(f"Fallback to CPU failed: {e2}") from e2
+        else:
+            raise TranscriptionFailedError(f"Failed to load Whisper model: {e}") from e
+
+    if keep_loaded:
+        _whisper_model_cache[key] = model
+    return model
+
+
+def clear_model_cache():
+    """Release any faster-whisper models kept loaded between calls."""
+    _whisper_model_cache.clear()
+    gc.collect()
+
+
 def _process_whisper_segment(segment) -> dict:
     """
     Convert a faster-whisper segment to standard dict format.
@@ -156,7 +206,10 @@ def transcribe_whisper(
     vad_filter: bool = True,
     vad_parameters: dict | None = None,
     normalize_audio: bool = False,
-    translate: bool = False
+    translate: bool = False,
+    batch_size: int | None = None,
+    keep_model_loaded: bool = False,
+    condition_on_previous_text: bool = True
 ) -> list[dict]:
     """
     Transcribes a video file using faster-whisper (CTranslate2)
@@ -170,6 +223,10 @@ def transcribe_whisper(
         vad_parameters: Optional VAD parameters dict
         normalize_audio: Pre-process audio with loudnorm filter for better quality. Default: False
         translate: Translate the subtitles to English. Default: False
+        batch_size: Decode audio chunks in batches with BatchedInferencePipeline. Default: None (sequential)
+        keep_model_loaded: Keep the model in memory for subsequent calls. Default: False
+        condition_on_previous_text: Feed the previous window's text as a prompt for the next one.
+            Disabling stops early mistakes and repetition loops from propagating. Default: True
     """
     if not WHISPER_AVAILABLE:
         raise TranscriptionModelNotAvailableError(
@@ -187,18 +244,7 @@ def transcribe_whisper(
     actual_input_file = _prepare_audio_input(videofile, normalize_audio, progress_callback)
 
     # Load model
-    try:
-        model = WhisperModel(model_name, device=device, compute_type=compute_type)
-    except Exception as e:
-        logger.error(f"Could not load model {model_name} on {device}: {e}")
-        if device == "cuda":
-            logger.info("Falling back to CPU...")
-            try:
-                model = WhisperModel(model_name, device="cpu", compute_type="int8")
-            except Exception as e2:
-                raise TranscriptionFailedError(f"Fallback to CPU failed: {e2}") from e2
-        else:
-            raise TranscriptionFailedError(f"Failed to load Whisper model: {e}") from e
+    model = _load_whisper_model(model_name, device, compute_type, keep_loaded=keep_model_loaded)
 
     # Transcribe with advanced parameters
     try:
@@ -212,6 +258,7 @@ def transcribe_whisper(
             "beam_size": beam_size,
             "best_of": best_of,
             "vad_filter": vad_filter,
+            "condition_on_previous_text": condition_on_previous_text,
             "task": "translate" if translate else "transcribe"
         }
 
@@ -219,7 +266,12 @@ def transcribe_whisper(
         if vad_parameters:
             transcribe_params["vad_parameters"] = vad_parameters
 
-        segments_generator, info = model.transcribe(actual_input_file, **transcribe_params)
+        if batch_size:
+            transcribe_params["batch_size"] = batch_size
+            pipeline = BatchedInferencePipeline(model=model)
+            segments_generator, info = pipeline.transcribe(actual_input_file, **transcribe_params)
+        else:
+            segments_generator, info = model.transcribe(actual_input_file, **transcribe_params)
 
         logger.info(f"Transcription started. Detected language: {info.language}")
 
@@ -265,8 +317,9 @@ def transcribe_whisper(
         logger.info(f"Processed {len(out)} segments.")
 
         # Explicitly cleanup model to avoid crashes on return
-        del model
-        gc.collect()
+        if not keep_model_loaded:
+            del model
+            gc.collect()
 
     except Exception as e:
         logger.error(f"Error during transcription: {e}")
@@ -333,7 +386,10 @@ def transcribe(
     vad_filter: bool = True,
     vad_parameters: dict | None = None,
     normalize_audio: bool = False,
-    translate: bool = False
+    translate: bool = False,
+    batch_size: int | None = None,
+    keep_model_loaded: bool = False,
+    condition_on_previous_text: bool = True
 ) -> list[dict]:
     """
     Transcribes a video file using Whisper, handling caching and backend selection.
@@ -348,6 +404,9 @@ def transcribe(
         vad_parameters: Optional VAD parameters
         normalize_audio: Pre-process audio with loudnorm filter
         translate: Translate the subtitles to English
+        batch_size: Batched decoding size for faster-whisper (None = sequential)
+        keep_model_loaded: Keep the faster-whisper model loaded for later calls
+        condition_on_previous_text: Condition each window on the previous text (faster-whisper only)
     """
     if not os.path.exists(videofile):
         raise VoxGrepFileNotFoundError(f"Could not find file {videofile}")
@@ -456,7 +515,10 @@ def transcribe(
             vad_filter=vad_filter,
             vad_parameters=vad_parameters,
             normalize_audio=normalize_audio,
-            translate=translate
+            translate=translate,
+            batch_size=batch_size,
+            keep_model_loaded=keep_model_loaded,
+            condition_on_previous_text=condition_on_previous_text
         )
 
     if not out:
@@ -2,6 +2,9 @@ import re
 import io
 from typing import Tuple, Union, List
 
+# Cue index lines that precede each timespan
+CUE_INDEX_RE = re.compile(r"^\d+[\n\r]", flags=re.MULTILINE)
+
 
 def convert_timespan(timespan: str) -> Tuple[float, float]:
     """
@@ -53,7 +56,7 @@ def parse(srt: Union[io.IOBase, str]) -> List[dict]:
     out = []
 
     _srt = _srt.replace(u"\ufeff", "")
-    _srt = re.sub(r"^\d+[\n\r]", "", _srt, flags=re.MULTILINE)
+    _srt = CUE_INDEX_RE.sub("", _srt)
     lines = _srt.splitlines()
 
     for line in lines:
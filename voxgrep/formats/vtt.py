@@ -2,6 +2,13 @@ import re
 import io
 from typing import Union, List
 
+# Inline word timing tag: <00:00:00.000>
+TIMESTAMP_TAG_RE = re.compile(r"<(\d\d:\d\d:\d\d(?:\.\d+)?)>")
+# Any other inline tag, such as <c> or </c>
+STYLE_TAG_RE = re.compile(r"<(?!/?\d\d:\d\d:\d\d)/?[^>]+>")
+# A line that carries a timestamp at all
+TIMESTAMP_RE = re.compile(r"\d\d:\d\d:\d\d")
+
 
 def timestamp_to_secs(ts: str) -> float:
     """
@@ -22,9 +29,7 @@ def secs_to_timestamp(secs: float) -> str:
 
 def parse_cued(data: List[str]) -> List[dict]:
     out = []
-    # regex for timestamp tags: <00:00:00.000>
-    timestamp_pat = r"<(\d\d:\d\d:\d\d(?:\.\d+)?)>"
-    
+
     for meta, content in data:
         start_match, end_match = meta.split(" --> ")
         seg_start = timestamp_to_secs(start_match)
@@ -32,42 +37,27 @@ def parse_cued(data: List[str]) -> List[dict]:
         seg_end = timestamp_to_secs(end_match.split(" ")[0])
         
         # Strip other tags like <c> or </c>
-        clean_content = re.sub(r"<(?!/?\d\d:\d\d:\d\d)/?[^>]+>", "", content)
+        clean_content = STYLE_TAG_RE.sub("", content)
         
         # Split by timestamp tags, keeping the tags in the result
-        parts = re.split(timestamp_pat, clean_content)
+        parts = TIMESTAMP_TAG_RE.split(clean_content)
         
         sentence = {"content": "", "words": [], "start": seg_start, "end": seg_end}
-        
-        current_time = seg_start
-        
-        # re.split with one capturing group returns [text, tag, text, tag, ...]
-        for i in range(0, len(parts), 2):
-            text = parts[i].strip()
-            if text:
-                # This text belongs to the previous time or the segment start
-                # We'll assign it the current_time as start
-                # If there's a next timestamp, that's the end. 
-                # Otherwise seg_end is the end.
-                next_time = seg_end
-                if i + 1 < len(parts):
-                    next_time = timestamp_to_secs(parts[i+1])
-                
-                # Split text into words if multiple
-                sub_words = text.split()
-                for j, sw in enumerate(sub_words):
-                    # For sub-words, we don't know the exact timing, so we'll just distribute
-                    # them or just keep them together. For better results, let's just 
-                    # create one entry per split text for now if it's meant to be one word.
-                    sentence["words"].append({
-                        "word": sw,
-                        "start": current_time,
-                        "end": next_time
-                    })
-            
-            if i + 1 < len(parts):
-                current_time = timestamp_to_secs(parts[i+1])
-                
+
+        # re.split with one capturing group returns [text, tag, text, tag, ...].
+        # Each tag is converted once; text run k spans bounds[k] to bounds[k + 1].
+        bounds = [seg_start, *map(timestamp_to_secs, parts[1::2]), seg_end]
+
+        for k, text in enumerate(parts[::2]):
+            # For sub-words, we don't know the exact timing, so every word in
+            # a run shares the run's start and end.
+            for sw in text.split():
+                sentence["words"].append({
+                    "word": sw,
+                    "start": bounds[k],
+                    "end": bounds[k + 1]
+                })
+
         if sentence["words"]:
             sentence["content"] = " ".join([w["word"] for w in sentence["words"]])
             out.append(sentence)
@@ -112,14 +102,13 @@ def parse(vtt: Union[io.IOBase, str]) -> List[dict]:
     else:
         _vtt = vtt
 
-    pat = r"<(\d\d:\d\d:\d\d(\.\d+)?)>"
     out = []
 
     lines = []
     data = _vtt.split("\n")
-    data = [d for d in data if re.search(r"\d\d:\d\d:\d\d", d) is not None]
+    data = [d for d in data if TIMESTAMP_RE.search(d) is not None]
     for i, d in enumerate(data):
-        if re.search(pat, d):
+        if TIMESTAMP_TAG_RE.search(d):
             lines.append((data[i - 1], d))
 
     if len(lines) > 0:
@@ -1,44 +1,103 @@
 import logging
 import yt_dlp
+import time
+import queue
 import asyncio
 import functools
+import threading
 import traceback
 from tqdm import tqdm
 
+from ..utils.config import get_cache_dir
+
 logger = logging.getLogger(__name__)
 
-def download_video(
-    url: str,
-    output_template: str = "%(title)s.%(ext)s",
-    format_code: str = None,
-    progress_hooks: list = None,
-    restrict_filenames: bool = True,
-    quiet: bool = True,
-    languages: list = None,
-    cookies_from_browser: str = None,
-    cookies_file: str = None
-) -> str:
-    """
-    Download a video (and subtitles) from a URL using yt-dlp.
 
-    Args:
-        url (str): The URL of the video to download.
-        output_template (str): The output filename template.
-                               Default is "%(title)s.%(ext)s".
-        format_code (str): The format code to use (optional).
-                           Defaults to robust logic.
-        progress_hooks (list): Optional list of callback functions for progress updates.
-        restrict_filenames (bool): Restrict filenames to ASCII characters (default: True).
-        quiet (bool): Whether to suppress stdout output (default: True).
-        cookies_from_browser (str): Browser to extract cookies from (e.g., 'chrome', 'firefox',
-                                    'safari', 'edge', 'brave', 'opera', 'chromium').
-                                    Useful for X/Twitter and age-restricted content.
-        cookies_file (str): Path to a Netscape-format cookies.txt file.
+class _BackgroundProgressBar:
+    """
+    yt-dlp progress hook that draws its tqdm bar on a separate thread.
 
-    Returns:
-        str: The filename of the downloaded video.
+    The hook only queues byte deltas, so a slow terminal never stalls the
+    download loop. Each downloaded stream (e.g. video, then audio) gets its
+    own bar. Deltas are coalesced until at least MIN_BYTES have arrived or
+    MIN_INTERVAL seconds have passed, so the bar redraws a few times a second
+    rather than on every network chunk.
     """
-    # Configure yt-dlp options
+
+    _STOP = object()
+    MIN_BYTES = 256 * 1024
+    MIN_INTERVAL = 0.1
+
+    def __init__(self, desc: str = "Downloading", maxsize: int = 256):
+        self._desc = desc
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._reported = 0
+        self._seen = 0
+        self._last_put = 0.0
+        self._started = False
+        self._thread = threading.Thread(target=self._render, name="yt-dlp-progress", daemon=True)
+        self._thread.start()
+
+    def _render(self):
+        pbar = None
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                break
+            kind, value = item
+            try:
+                if kind == 'start':
+                    pbar = tqdm(total=value, unit='B', unit_scale=True, unit_divisor=1024, desc=self._desc)
+                elif kind == 'advance' and pbar is not None:
+                    pbar.update(value)
+                elif kind == 'finish' and pbar is not None:
+                    pbar.close()
+                    pbar = None
+            except Exception as pk_err:
+                # If progress bar fails, just ignore it to not break the download
+                logger.debug(f"Progress bar error: {pk_err}")
+        if pbar is not None:
+            pbar.close()
+
+    def __call__(self, d):
+        if d['status'] == 'downloading':
+            if not self._started:
+                self._started = True
+                self._queue.put(('start', d.get('total_bytes') or d.get('total_bytes_estimate')))
+            self._seen = d.get('downloaded_bytes', 0)
+            now = time.monotonic()
+            if self._seen - self._reported < self.MIN_BYTES and now - self._last_put < self.MIN_INTERVAL:
+                return  # Carried over into the next update
+            try:
+                self._queue.put_nowait(('advance', self._seen - self._reported))
+            except queue.Full:
+                return  # Carried over into the next update
+            self._reported = self._seen
+            self._last_put = now
+        elif d['status'] == 'finished' and self._started:
+            residual = (d.get('downloaded_bytes') or self._seen) - self._reported
+            if residual > 0:
+                self._queue.put(('advance', residual))
+            self._queue.put(('finish', None))
+            self._started = False
+            self._reported = self._seen = 0
+
+    def close(self):
+        """Stop the render thread once it has drawn everything queued."""
+        self._queue.put(self._STOP)
+        self._thread.join()
+
+
+def _build_ydl_opts(
+    output_template: str,
+    format_code: str,
+    restrict_filenames: bool,
+    quiet: bool,
+    languages: list,
+    cookies_from_browser: str,
+    cookies_file: str,
+) -> dict:
+    """Build the yt-dlp options shared by every download in a session."""
     ydl_opts = {
         'format': format_code if format_code else 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best',
         'outtmpl': output_template,
@@ -52,6 +111,8 @@ def download_video(
         'restrictfilenames': restrict_filenames,
         # Ensure we merge into mp4 if possible for compatibility
         'merge_output_format': 'mp4',
+        # Persist extractor data (e.g. player signature functions) between runs
+        'cachedir': str(get_cache_dir() / "yt-dlp"),
     }
 
     # Add cookie support for authenticated downloads (X/Twitter, etc.)
@@ -61,67 +122,124 @@ def download_video(
     elif cookies_file:
         ydl_opts['cookiefile'] = cookies_file
         logger.info(f"Using cookies file: {cookies_file}")
-    
-    pbar = None
-    
-    def tqdm_hook(d):
-        nonlocal pbar
-        try:
-            if d['status'] == 'downloading':
-                if pbar is None:
-                    total = d.get('total_bytes') or d.get('total_bytes_estimate')
-                    # If total is unknown, we can still use tqdm but might need to be careful with arguments
-                    pbar = tqdm(total=total, unit='B', unit_scale=True, unit_divisor=1024, desc="Downloading")
-                
-                downloaded = d.get('downloaded_bytes', 0)
-                if pbar is not None:
-                    pbar.update(downloaded - pbar.n)
-            
-            elif d['status'] == 'finished':
-                if pbar is not None:
-                    pbar.close()
-                    pbar = None
-        except Exception as pk_err:
-            # If progress bar fails, just ignore it to not break the download
-            logger.debug(f"Progress bar error: {pk_err}")
+
+    return ydl_opts
+
+
+def _download_with(ydl: yt_dlp.YoutubeDL, url: str) -> str:
+    """Download one URL with an open YoutubeDL and return the output filename."""
+    # Extract info first to get the filename
+    # We treat this as a single item download
+    info = ydl.extract_info(url, download=True)
+
+    if info is None:
+        raise Exception("Failed to extract info (returned None)")
+
+    # extract_info returns a dict for a single video, or 'entries' for a playlist
+    # We assume single video for this helper, but handle basic playlist case by taking first
+    if 'entries' in info:
+        info = info['entries'][0]
+
+    filename = ydl.prepare_filename(info)
+
+    # If merged, the extension might change to mp4
+    if info.get('requested_downloads'):
+        for d in info['requested_downloads']:
+            if d.get('filepath'):
+                filename = d['filepath']
+                break
+
+    logger.info(f"Successfully downloaded: {filename}")
+    return filename
+
+
+def download_videos(
+    urls: list,
+    output_template: str = "%(title)s.%(ext)s",
+    format_code: str = None,
+    progress_hooks: list = None,
+    restrict_filenames: bool = True,
+    quiet: bool = True,
+    languages: list = None,
+    cookies_from_browser: str = None,
+    cookies_file: str = None
+) -> list:
+    """
+    Download several videos (and subtitles) through a single yt-dlp session.
+
+    The YoutubeDL instance, and with it the extractor setup and any loaded
+    cookies, is built once and reused for every URL.
+
+    Args:
+        urls (list): The URLs to download, in order.
+        Other arguments are as for download_video().
+
+    Returns:
+        list: The downloaded filenames, in the same order as urls.
+
+    Raises:
+        Exception: The first download error; later URLs are not attempted.
+    """
+    ydl_opts = _build_ydl_opts(
+        output_template, format_code, restrict_filenames, quiet,
+        languages, cookies_from_browser, cookies_file,
+    )
+
+    progress_bar = None
 
     if progress_hooks:
         ydl_opts['progress_hooks'] = progress_hooks
     elif not quiet:
-        ydl_opts['progress_hooks'] = [tqdm_hook]
+        progress_bar = _BackgroundProgressBar()
+        ydl_opts['progress_hooks'] = [progress_bar]
 
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
         try:
-            # Extract info first to get the filename
-            # We treat this as a single item download
-            info = ydl.extract_info(url, download=True)
-            
-            if info is None:
-                raise Exception("Failed to extract info (returned None)")
-
-            # extract_info returns a dict for a single video, or 'entries' for a playlist
-            # We assume single video for this helper, but handle basic playlist case by taking first
-            if 'entries' in info:
-                info = info['entries'][0]
-                
-            filename = ydl.prepare_filename(info)
-            
-            # If merged, the extension might change to mp4
-            if info.get('requested_downloads'):
-                for d in info['requested_downloads']:
-                    if d.get('filepath'):
-                        filename = d['filepath']
-                        break
-            
-            logger.info(f"Successfully downloaded: {filename}")
-            return filename
+            return [_download_with(ydl, url) for url in urls]
         except Exception as e:
             logger.error(f"Error downloading video: {e}")
             logger.debug(traceback.format_exc())
             raise
         finally:
-            if pbar is not None:
-                pbar.close()
+            if progress_bar is not None:
+                progress_bar.close()
+
+
+def download_video(
+    url: str,
+    output_template: str = "%(title)s.%(ext)s",
+    format_code: str = None,
+    progress_hooks: list = None,
+    restrict_filenames: bool = True,
+    quiet: bool = True,
+    languages: list = None,
+    cookies_from_browser: str = None,
+    cookies_file: str = None
+) -> str:
+    """
+    Download a video (and subtitles) from a URL using yt-dlp.
+
+    Args:
+        url (str): The URL of the video to download.
+        output_template (str): The output filename template.
+                               Default is "%(title)s.%(ext)s".
+        format_code (str): The format code to use (optional).
+                           Defaults to robust logic.
+        progress_hooks (list): Optional list of callback functions for progress updates.
+        restrict_filenames (bool): Restrict filenames to ASCII characters (default: True).
+        quiet (bool): Whether to suppress stdout output (default: True).
+        cookies_from_browser (str): Browser to extract cookies from (e.g., 'chrome', 'firefox',
+                                    'safari', 'edge', 'brave', 'opera', 'chromium').
+                                    Useful for X/Twitter and age-restricted content.
+        cookies_file (str): Path to a Netscape-format cookies.txt file.
+
+    Returns:
+        str: The filename of the downloaded video.
+    """
+    return download_videos(
+        [url], output_template, format_code, progress_hooks, restrict_filenames,
+        quiet, languages, cookies_from_browser, cookies_file,
+    )[0]
 
 async def download_video_async(
     url: str,
@@ -79,6 +79,30 @@ class Embedding(SQLModel, table=True):
     video: Video | None = Relationship(back_populates="embeddings")
 
 
+class Token(SQLModel, table=True):
+    """
+    One transcript word in the inverted index.
+    Lets mash and exact-word searches look words up instead of scanning transcripts.
+    """
+    id: int | None = Field(default=None, primary_key=True)
+    word: str = Field(index=True)  # Normalized (lowercase, no punctuation)
+    video_id: int = Field(foreign_key="video.id", index=True)
+    position: int  # Word index within the transcript
+    start: float
+    end: float
+    content: str  # Word as it appears in the transcript
+
+
+class TokenSource(SQLModel, table=True):
+    """
+    Transcript a video's token rows were built from.
+    Lets the index spot a re-transcribed or edited transcript and rebuild.
+    """
+    video_id: int = Field(foreign_key="video.id", primary_key=True)
+    transcript_path: str
+    transcript_mtime: float
+
+
 # ============================================================================
 # Speaker Diarization Models (Phase 2)
 # ============================================================================
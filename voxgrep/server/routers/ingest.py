@@ -10,9 +10,12 @@ from sqlmodel import select, Session as DbSession
 from ..dependencies import get_model_manager, get_vector_store, config, features, logger
 from ..models import Video
 from ..db import engine
+from .library import _scan_path
 from ..multi_model import TranscriptionBackend
 from ...modules.youtube import download_video
 from ...core.engine import parse_transcript, find_transcript
+from ...utils.config import MEDIA_EXTENSIONS
+from ...utils.helpers import ensure_directory_exists
 
 router = APIRouter()
 
@@ -167,7 +170,7 @@ def add_local_file(
             
             # Add to database
             with DbSession(engine) as session:
-                # Scan the parent directory to add the file
+                # Scan the parent directory to add the file and refresh its word index
                 parent_dir = os.path.dirname(abs_filepath)
                 _scan_path(parent_dir, session)
                 
@@ -2,11 +2,13 @@
 Library Management Routes
 """
 import os
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session, select
 
 from ..dependencies import get_session, get_vector_store, config, logger
 from ..models import Video
+from ..token_index import refresh_video_tokens, remove_video_tokens
 from ...core import engine as search_engine
 from ...utils.config import MEDIA_EXTENSIONS
 from ..db import engine
@@ -14,39 +16,66 @@ from ..db import engine
 router = APIRouter(prefix="/library", tags=["library"])
 
 # Helper function (internal)
+def _probe_media(full_path: str) -> tuple[os.stat_result, str | None]:
+    """Stat a media file and locate its transcript."""
+    return os.stat(full_path), search_engine.find_transcript(full_path)
+
+
 def _scan_path(path: str, session: Session) -> int:
     """Scans a path for media files and adds them to the database using absolute paths."""
     abs_target_path = os.path.abspath(path)
     if not os.path.exists(abs_target_path):
         os.makedirs(abs_target_path, exist_ok=True)
         
-    count = 0
+    # One query for the library's paths under this directory instead of one per file
+    existing_paths = set(session.exec(
+        select(Video.path).where(Video.path.startswith(abs_target_path))
+    ).all())
+
+    new_files = []  # (full_path, filename) not yet in the library
     for root, _, files in os.walk(abs_target_path):
         for file in files:
             ext = os.path.splitext(file)[1].lower()
             if ext in MEDIA_EXTENSIONS:
                 full_path = os.path.join(root, file)
-                existing = session.exec(select(Video).where(Video.path == full_path)).first()
-                if not existing:
-                    try:
-                        stats = os.stat(full_path)
-                        transcript_path = search_engine.find_transcript(full_path)
-                        video = Video(
-                            path=full_path,
-                            filename=file,
-                            size_bytes=stats.st_size,
-                            created_at=stats.st_mtime,
-                            has_transcript=transcript_path is not None,
-                            transcript_path=transcript_path
-                        )
-                        session.add(video)
-                        count += 1
-                        logger.info(f"Added to library: {file}")
-                    except OSError as e:
-                        logger.error(f"Error accessing {full_path}: {e}")
-                        
+                if full_path not in existing_paths:
+                    new_files.append((full_path, file))
+
+    def probe(item):
+        try:
+            return _probe_media(item[0])
+        except OSError as e:
+            return e
+
+    # Stat calls and transcript lookups are filesystem round trips, so overlap them;
+    # the session stays on this thread.
+    added = []
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for (full_path, file), result in zip(new_files, executor.map(probe, new_files)):
+            if isinstance(result, OSError):
+                logger.error(f"Error accessing {full_path}: {result}")
+                continue
+            stats, transcript_path = result
+            video = Video(
+                path=full_path,
+                filename=file,
+                size_bytes=stats.st_size,
+                created_at=stats.st_mtime,
+                has_transcript=transcript_path is not None,
+                transcript_path=transcript_path
+            )
+            added.append(video)
+            logger.info(f"Added to library: {file}")
+
+    session.add_all(added)
     session.commit()
-    return count
+
+    # Index new transcripts, and rebuild ones edited or re-transcribed since the last scan
+    scanned = session.exec(
+        select(Video).where(Video.path.startswith(abs_target_path))
+    ).all()
+    refresh_video_tokens(scanned, session)
+    return len(added)
 
 
 @router.get("", response_model=list[Video])
@@ -83,6 +112,7 @@ def delete_video(video_id: int, session: Session = Depends(get_session)):
     # Remove associated embeddings
     vector_store = get_vector_store()
     vector_store.remove_video(video_id, session)
+    remove_video_tokens(video_id, session)
     
     session.delete(video)
     session.commit()
@@ -3,31 +3,33 @@ Search and Analysis Routes
 """
 import os
 import os
+import json
+import asyncio
+from functools import partial
+from typing import AsyncIterator, Callable
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session, select
 
 from ..dependencies import get_session, get_vector_store, features, logger
-from ..models import SearchResult, Video
+from ..models import SearchResult, Video, Embedding
+from ..token_index import token_indexed_video_ids, search_mash
 from ...core import engine as search_engine
 from ...utils.config import MEDIA_EXTENSIONS, DEFAULT_SEARCH_TYPE
 
 router = APIRouter(tags=["search"])
 
-@router.get("/search", response_model=list[SearchResult])
-def search(
-    query: str, 
-    type: str = DEFAULT_SEARCH_TYPE, 
-    threshold: float = 0.45,
-    exact_match: bool = False,
-    video_ids: str | None = None,
-    session: Session = Depends(get_session)
-):
-    """
-    Searches across all videos in the library.
-    """
+# Search types whose matches in one file don't depend on the other files
+_PER_FILE_SEARCH_TYPES = {"sentence", "fragment"}
+
+
+def _select_videos(
+    query: str, video_ids: str | None, session: Session
+) -> tuple[list[int] | None, list[Video]]:
+    """Validate the query and return the requested video IDs and their videos."""
     if not query or not query.strip():
         raise HTTPException(status_code=400, detail="Search query cannot be empty")
-        
+
     # Parse video_ids if provided
     target_video_ids = None
     if video_ids:
@@ -35,7 +37,7 @@ def search(
             target_video_ids = [int(vid.strip()) for vid in video_ids.split(",")]
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid video_ids format")
-    
+
     # Get files to search
     if target_video_ids:
         videos = session.exec(
@@ -43,6 +45,23 @@ def search(
         ).all()
     else:
         videos = session.exec(select(Video)).all()
+
+    return target_video_ids, videos
+
+
+@router.get("/search", response_model=list[SearchResult])
+def search(
+    query: str, 
+    type: str = DEFAULT_SEARCH_TYPE, 
+    threshold: float = 0.45,
+    exact_match: bool = False,
+    video_ids: str | None = None,
+    session: Session = Depends(get_session)
+):
+    """
+    Searches across all videos in the library.
+    """
+    target_video_ids, videos = _select_videos(query, video_ids, session)
     
     files = [v.path for v in videos]
     
@@ -105,6 +124,13 @@ def search(
             indexed_query = indexed_query.where(Video.id.in_(target_video_ids))
         indexed_ids = set(session.exec(indexed_query).all())
         
+        # Mash over a fully token-indexed selection is a single indexed lookup
+        if type == "mash":
+            token_ids = token_indexed_video_ids(session, target_video_ids)
+            if token_ids and all(v.id in token_ids for v in videos if v.has_transcript):
+                mash = [SearchResult(**s) for s in search_mash(session, [query], token_ids)]
+                return sorted(mash, key=lambda x: x.start)
+
         # Filter files: keep only those NOT in indexed_ids (unless type != sentence)
         files_to_scan = []
         for v in videos:
@@ -133,6 +159,74 @@ def search(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/search/stream")
+async def search_stream(
+    query: str,
+    type: str = DEFAULT_SEARCH_TYPE,
+    threshold: float = 0.45,
+    exact_match: bool = False,
+    video_ids: str | None = None,
+    session: Session = Depends(get_session)
+):
+    """
+    Streams search results as NDJSON, one SearchResult per line.
+
+    Sentence and fragment searches run per file on worker threads, and each
+    file's matches are sent as soon as it finishes, so the first hits arrive
+    before the whole library is scanned. Lines arrive in completion order,
+    not sorted by start time.
+    """
+    target_video_ids, videos = _select_videos(query, video_ids, session)
+    files = [v.path for v in videos]
+
+    if type == "semantic" and features.enable_semantic_search:
+        # The vector store answers from one index lookup; nothing to overlap
+        vector_store = get_vector_store()
+        semantic_results = await asyncio.to_thread(
+            vector_store.search, query, session, threshold=threshold, video_ids=target_video_ids
+        )
+        results = [SearchResult(**r) for r in semantic_results]
+        return StreamingResponse(_stream_batches([lambda: results]), media_type="application/x-ndjson")
+
+    def run(paths: list[str]) -> list[SearchResult]:
+        segments = search_engine.search(paths, query, type, threshold=threshold, exact_match=exact_match)
+        return [
+            SearchResult(file=s["file"], start=s["start"], end=s["end"], content=s["content"], score=s.get("score"))
+            for s in segments
+        ]
+
+    if type in _PER_FILE_SEARCH_TYPES:
+        jobs = [partial(run, [f]) for f in files]
+    else:
+        # Mash picks among all files and semantic encodes the query once
+        jobs = [partial(run, files)] if files else []
+
+    return StreamingResponse(_stream_batches(jobs), media_type="application/x-ndjson")
+
+
+async def _stream_batches(jobs: list[Callable[[], list[SearchResult]]]) -> AsyncIterator[str]:
+    """
+    Run each job on a worker thread and yield every result as one NDJSON line.
+
+    Batches are sent in completion order. When the client disconnects the
+    generator is closed, and searches that have not started yet are cancelled.
+    """
+    tasks = [asyncio.ensure_future(asyncio.to_thread(job)) for job in jobs]
+    try:
+        for batch in asyncio.as_completed(tasks):
+            try:
+                results = await batch
+            except Exception as e:
+                logger.error(f"Search failed: {e}")
+                yield '{"error": ' + json.dumps(str(e)) + '}\n'
+                continue
+            for result in results:
+                yield result.model_dump_json() + "\n"
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
 @router.get("/ngrams")
 def get_ngrams(path: str, n: int = 1):
     """Returns n-grams for indexed videos in the given path."""
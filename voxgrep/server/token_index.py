@@ -0,0 +1,153 @@
+"""
+VoxGrep Token Index Module
+
+Persistent inverted index of transcript words in the library database.
+Mash search over indexed videos becomes one indexed SQL lookup instead of
+a scan of every transcript.
+"""
+import os
+import random
+from collections import defaultdict
+
+from sqlmodel import Session, select, delete, insert
+
+from ..core import engine as search_engine
+from ..core.word_timestamps import synthesize_word_timestamps
+from ..utils.helpers import setup_logger
+from .models import Video, Token, TokenSource
+
+logger = setup_logger(__name__)
+
+# Rows sent per bulk INSERT while indexing a long transcript
+INSERT_BATCH = 10_000
+
+
+def _transcript_source(video: Video) -> tuple[str, float] | None:
+    """Path and mtime of the transcript the engine would parse for a video."""
+    transcript_file = search_engine.find_transcript(video.path)
+    if not transcript_file:
+        return None
+    try:
+        return os.path.abspath(transcript_file), os.path.getmtime(transcript_file)
+    except OSError:
+        return None
+
+
+def index_video_tokens(video: Video, session: Session) -> int:
+    """
+    (Re)build the token rows for one video from its transcript.
+
+    Returns:
+        Number of tokens stored
+    """
+    session.exec(delete(Token).where(Token.video_id == video.id))
+    session.exec(delete(TokenSource).where(TokenSource.video_id == video.id))
+    source = _transcript_source(video)
+    transcript = search_engine.parse_transcript(video.path) if source else None
+    if source:
+        session.add(TokenSource(
+            video_id=video.id,
+            transcript_path=source[0],
+            transcript_mtime=source[1],
+        ))
+    if not transcript:
+        session.commit()
+        return 0
+
+    rows = []
+    for position, w in enumerate(synthesize_word_timestamps(transcript, log_info=False)):
+        word = search_engine.normalize_word(w["word"])
+        if not word:
+            continue
+        rows.append({
+            "word": word,
+            "video_id": video.id,
+            "position": position,
+            "start": w["start"],
+            "end": w["end"],
+            "content": w["word"],
+        })
+    # Core executemany inserts instead of one ORM object per word
+    for i in range(0, len(rows), INSERT_BATCH):
+        session.execute(insert(Token), rows[i:i + INSERT_BATCH])
+    session.commit()
+    count = len(rows)
+    logger.debug(f"Indexed {count} tokens for {video.filename}")
+    return count
+
+
+def refresh_video_tokens(videos: list[Video], session: Session) -> int:
+    """
+    Rebuild the token rows of videos whose transcript changed since indexing.
+
+    A video is re-indexed when its transcript path or mtime differs from the
+    one recorded at index time, or when it has a transcript but no index.
+
+    Returns:
+        Number of videos re-indexed
+    """
+    ids = [v.id for v in videos]
+    recorded = {
+        s.video_id: (s.transcript_path, s.transcript_mtime)
+        for s in session.exec(select(TokenSource).where(TokenSource.video_id.in_(ids))).all()
+    }
+    refreshed = 0
+    for video in videos:
+        source = _transcript_source(video)
+        if source == recorded.get(video.id):
+            continue
+        if source is None:
+            remove_video_tokens(video.id, session)
+        else:
+            index_video_tokens(video, session)
+        refreshed += 1
+    return refreshed
+
+
+def token_indexed_video_ids(session: Session, video_ids: list[int] | None = None) -> set[int]:
+    """IDs of videos that have token rows, optionally limited to video_ids."""
+    stmt = select(Token.video_id).distinct()
+    if video_ids:
+        stmt = stmt.where(Token.video_id.in_(video_ids))
+    return set(session.exec(stmt).all())
+
+
+def search_mash(session: Session, query: list[str], video_ids: set[int]) -> list[dict]:
+    """
+    Mash search answered from the token index.
+
+    Mirrors the engine's mash search: each query word picks one random
+    occurrence among the given videos.
+    """
+    query_words = [q for _query in query for q in _query.split(" ")]
+    wanted = {q.lower() for q in query_words}
+    rows = session.exec(
+        select(Token, Video.path)
+        .join(Video, Video.id == Token.video_id)
+        .where(Token.word.in_(wanted), Token.video_id.in_(video_ids))
+    ).all()
+
+    occurrences = defaultdict(list)
+    for token, path in rows:
+        occurrences[token.word].append((token, path))
+
+    segments = []
+    for q in query_words:
+        matches = occurrences.get(q.lower())
+        if not matches:
+            continue
+        token, path = random.choice(matches)
+        segments.append({
+            "file": path,
+            "start": token.start,
+            "end": token.end,
+            "content": token.content,
+        })
+    return segments
+
+
+def remove_video_tokens(video_id: int, session: Session) -> None:
+    """Delete all token rows for a video."""
+    session.exec(delete(Token).where(Token.video_id == video_id))
+    session.exec(delete(TokenSource).where(TokenSource.video_id == video_id))
+    session.commit()
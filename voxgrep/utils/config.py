@@ -21,10 +21,57 @@ MEDIA_EXTENSIONS = VIDEO_EXTENSIONS + AUDIO_EXTENSIONS
 # ============================================================================
 # Processing Constants
 # ============================================================================
-BATCH_SIZE = 20  # Number of clips to process in a batch for large supercuts
+BATCH_SIZE = 20  # Clips per batch for large supercuts when free memory can't be measured
+MIN_BATCH_SIZE = 10  # Bounds for the memory-derived batch size
+MAX_BATCH_SIZE = 500
+BATCH_CLIP_MEMORY = 200 * 1024 * 1024  # Rough footprint of one in-flight moviepy clip
 MAX_CHARS = 36  # Maximum characters for display/formatting
 DEFAULT_PADDING = 0.3  # Default padding in seconds for fragment/mash searches
 MASH_PADDING = 0.05  # Micro-padding in seconds for word-level cuts (50ms)
+ENCODER_THREADS = 4  # ffmpeg encoder threads; libx264 on auto oversubscribes many-core hosts
+EXPORT_WORKERS = 4  # Max batches encoded in parallel by create_supercut_in_batches
+SOURCE_CLIP_CACHE_SIZE = 8  # Source files kept open at once by export_individual_clips
+
+
+def get_available_memory() -> int | None:
+    """Bytes of physical memory currently available, or None if unknown."""
+    try:
+        import psutil
+        return psutil.virtual_memory().available
+    except ImportError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def _env_int(name: str) -> int | None:
+    """Integer value of an environment variable, or None if unset or not a number."""
+    try:
+        return int(os.getenv(name, ""))
+    except ValueError:
+        return None
+
+
+def get_batch_size() -> int:
+    """
+    Clips per batch for create_supercut_in_batches.
+
+    An integer VOXGREP_BATCH_SIZE overrides it. Otherwise it is sized so
+    that EXPORT_WORKERS batches in flight fit in the currently available
+    memory, falling back to BATCH_SIZE when that can't be measured.
+    """
+    override = _env_int("VOXGREP_BATCH_SIZE")
+    if override is not None:
+        return max(1, override)
+
+    available = get_available_memory()
+    if not available:
+        return BATCH_SIZE
+
+    per_worker = available // EXPORT_WORKERS
+    return max(MIN_BATCH_SIZE, min(MAX_BATCH_SIZE, per_worker // BATCH_CLIP_MEMORY))
 
 
 # ============================================================================
@@ -83,6 +130,22 @@ DEFAULT_COMPUTE_TYPE = "float16" if DEFAULT_DEVICE == "mlx" else "int8"
 DEFAULT_SEARCH_TYPE = "sentence"
 DEFAULT_SEMANTIC_THRESHOLD = 0.45
 DEFAULT_SEMANTIC_MODEL = "all-MiniLM-L6-v2"
+DEFAULT_SEMANTIC_BATCH_SIZE = 64  # Sentences per forward pass when embedding transcripts
+DEFAULT_SEMANTIC_BACKEND = "torch"  # sentence-transformers backend: torch, onnx or openvino
+
+
+def get_semantic_backend() -> str:
+    """Inference backend for the semantic model; VOXGREP_SEMANTIC_BACKEND overrides it."""
+    return (os.getenv("VOXGREP_SEMANTIC_BACKEND") or DEFAULT_SEMANTIC_BACKEND).lower()
+
+
+def get_semantic_batch_size() -> int:
+    """Sentences per semantic encode batch; an integer VOXGREP_SEMANTIC_BATCH_SIZE overrides it."""
+    override = _env_int("VOXGREP_SEMANTIC_BATCH_SIZE")
+    if override is not None:
+        return max(1, override)
+    return DEFAULT_SEMANTIC_BATCH_SIZE
+
 
 DEFAULT_IGNORED_WORDS = [
     "a", "o", "as", "os", "e", "é", "de", "do", "da", "dos", "das", 
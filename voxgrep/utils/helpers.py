@@ -5,7 +5,7 @@ Common utility functions used across the application.
 """
 import os
 import logging
-from pathlib import Path
+from functools import lru_cache
 from pathlib import Path
 from .config import SUBTITLE_EXTENSIONS, MEDIA_EXTENSIONS, VIDEO_EXTENSIONS, AUDIO_EXTENSIONS
 from .exceptions import InvalidFileFormatError
@@ -42,9 +42,13 @@ def is_subtitle_file(filename: str) -> bool:
     return get_file_extension(filename) in SUBTITLE_EXTENSIONS
 
 
+@lru_cache(maxsize=1024)
 def get_media_type(filename: str) -> str:
     """
     Get the media type for a file.
+
+    Cached per filename, since exporters classify the same few sources
+    for every clip.
     
     Returns:
         'video', 'audio', or 'unknown'